@@ -0,0 +1,211 @@
+"""
+IntIndexMap - Compact Open-Addressing Hash Table for int -> int
+
+Problem: the `seen = {}` dict in two_sum_hash_map stores every key and
+value as a separate Python int object plus a dict slot - roughly 100 bytes
+per entry. For 10^8 numbers that is ~10 GB.
+
+Approach: store keys and values unboxed in two parallel array('q') buffers.
+- Slot of a key: multiplicative hash (top bits of key * golden ratio), then
+  linear probing: try slot, slot + 1, ... until we find the key or an
+  empty slot.
+- Empty slots hold a sentinel key (the smallest int64). The sentinel itself
+  is still a valid key: it is stored outside the table.
+- Capacity is a power of two and the table grows (doubles and reinserts)
+  before it is 2/3 full, which keeps probe sequences short.
+
+Each slot costs 16 bytes, so memory is 16 / load bytes per entry: 24-48
+bytes, versus ~100 for dict. The price is speed - every probe runs in the
+interpreter instead of in C. Run the benchmark to see both numbers.
+
+Keys and values must fit in a signed 64-bit integer. There is no delete,
+two-sum never needs it.
+
+Time Complexity: O(1) expected per operation
+Space Complexity: O(n) - 16 bytes per slot, load kept between 1/3 and 2/3
+
+Run the benchmark with: python -m arrays.int_index_map [count]
+"""
+
+from array import array
+from typing import Iterator, List, Optional, Sequence
+
+EMPTY = -(1 << 63)
+_GOLDEN = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+_MIN_SIZE = 8
+
+
+class IntIndexMap:
+    """
+    int -> int map with the dict operations two_sum_hash_map uses.
+
+    Example:
+        seen = IntIndexMap()
+        seen[7] = 0
+        7 in seen        # True
+        seen[7]          # 0
+        seen.get(8, -1)  # -1
+    """
+
+    __slots__ = ("_keys", "_values", "_mask", "_shift", "_len", "_has_empty", "_empty_value")
+
+    def __init__(self, capacity: int = 0):
+        """
+        Args:
+            capacity: Expected number of entries (avoids growing on insert)
+        """
+        size = _MIN_SIZE
+        while size * 2 <= capacity * 3:
+            size *= 2
+        self._allocate(size)
+        self._len = 0
+        self._has_empty = False
+        self._empty_value = 0
+
+    def _allocate(self, size: int) -> None:
+        self._keys = array("q", [EMPTY]) * size
+        self._values = array("q", [0]) * size
+        self._mask = size - 1
+        self._shift = 64 - size.bit_length() + 1
+
+    def _grow(self) -> None:
+        """Double the table and reinsert every entry."""
+        keys, values = self._keys, self._values
+        self._allocate(2 * len(keys))
+        new_keys, new_values = self._keys, self._values
+        mask, shift = self._mask, self._shift
+        for key, value in zip(keys, values):
+            if key != EMPTY:
+                i = ((key * _GOLDEN) & _MASK64) >> shift
+                while new_keys[i] != EMPTY:
+                    i = (i + 1) & mask
+                new_keys[i] = key
+                new_values[i] = value
+
+    def _find(self, key: int) -> int:
+        """Slot holding key, or the empty slot where it would go."""
+        keys = self._keys
+        mask = self._mask
+        i = ((key * _GOLDEN) & _MASK64) >> self._shift
+        k = keys[i]
+        while k != key and k != EMPTY:
+            i = (i + 1) & mask
+            k = keys[i]
+        return i
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __contains__(self, key: int) -> bool:
+        if key == EMPTY:
+            return self._has_empty
+        return self._keys[self._find(key)] == key
+
+    def get(self, key: int, default: Optional[int] = None) -> Optional[int]:
+        """Value for key, or default - one probe sequence instead of two."""
+        if key == EMPTY:
+            return self._empty_value if self._has_empty else default
+        i = self._find(key)
+        return self._values[i] if self._keys[i] == key else default
+
+    def __getitem__(self, key: int) -> int:
+        value = self.get(key, None)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: int, value: int) -> None:
+        if key == EMPTY:
+            if not self._has_empty:
+                self._has_empty = True
+                self._len += 1
+            self._empty_value = value
+            return
+        i = self._find(key)
+        if self._keys[i] == key:
+            self._values[i] = value
+            return
+        if (self._len + 1) * 3 > len(self._keys) * 2:
+            self._grow()
+            i = self._find(key)
+        self._keys[i] = key
+        self._values[i] = value
+        self._len += 1
+
+    def __iter__(self) -> Iterator[int]:
+        if self._has_empty:
+            yield EMPTY
+        for key in self._keys:
+            if key != EMPTY:
+                yield key
+
+    def capacity(self) -> int:
+        """Number of slots in the table."""
+        return len(self._keys)
+
+    def memory_bytes(self) -> int:
+        """Bytes used by the key and value buffers."""
+        return self._keys.itemsize * len(self._keys) + self._values.itemsize * len(self._values)
+
+    def bytes_per_entry(self) -> float:
+        return self.memory_bytes() / self._len if self._len else 0.0
+
+
+def two_sum_int_map(nums: Sequence[int], target: int) -> Optional[List[int]]:
+    """
+    two_sum_hash_map with IntIndexMap as the `seen` map.
+
+    Args:
+        nums: Integers (values and target - value must fit in int64)
+        target: Target sum to find
+
+    Returns:
+        List of two indices [i, j] if found, None otherwise
+    """
+    seen = IntIndexMap(len(nums))
+    for i, num in enumerate(nums):
+        j = seen.get(target - num, -1)
+        if j >= 0:
+            return [j, i]
+        seen[num] = i
+    return None
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    print("=" * 60)
+    print("INTINDEXMAP VS DICT - MEMORY AND THROUGHPUT")
+    print("=" * 60)
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**7
+    keys = array("q", (random.randrange(-(10**15), 10**15) for _ in range(n)))
+    print(f"\n{n:,} random int64 keys")
+
+    for name, factory in [("dict", dict), ("IntIndexMap", IntIndexMap)]:
+        start = time.perf_counter()
+        table = factory()
+        for i, key in enumerate(keys):
+            table[key] = i
+        insert_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for key in keys:
+            table.get(key)
+        lookup_s = time.perf_counter() - start
+
+        if isinstance(table, IntIndexMap):
+            size = table.memory_bytes()
+        else:
+            # The dict itself plus the int objects it keeps alive
+            size = sys.getsizeof(table) + sum(
+                sys.getsizeof(k) + sys.getsizeof(v) for k, v in table.items()
+            )
+        print(f"   {name:<12} {size / len(table):6.1f} bytes/entry   "
+              f"insert {n / insert_s / 1e6:5.2f} M/s   lookup {n / lookup_s / 1e6:5.2f} M/s")
+        del table
+
+    print("\n" + "=" * 60)
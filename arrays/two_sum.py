@@ -7,30 +7,26 @@ such that they add up to the target. Return their indices.
 Algorithm Approaches:
 1. Brute Force: Check all pairs - O(n^2) time, O(1) space
 2. Hash Map: Store complements - O(n) time, O(n) space (optimal)
+3. Two Pointers: Sorted input only - O(n) time, O(1) space
 
 HINTS:
 - Brute force: Use nested loops, outer picks first number, inner picks second
 - Hash map: complement = target - current_num
 - If complement exists in hash map, we found a pair!
 - Store value -> index mapping as you iterate
-"""
-
-import time
-from typing import List, Optional
 
+Run the demo with: python -m arrays.two_sum
+"""
 
-def timer_dec(func):
-    def wrapper(*args, **kwargs):
-        start_time = time.time()
-        res = func(*args, **kwargs)
-        end_time = time.time()
-        print(f"Function {func.__name__} took {end_time - start_time:.10f}s to execute")
-        return res
+from itertools import islice
+from operator import le
+from typing import List, Optional, Sequence
 
-    return wrapper
+from python_concepts.instrumentation import RECORDER, instrument
+from searching.predicate_search import find_first_true
 
 
-@timer_dec
+@instrument
 def two_sum_brute_force(nums: List[int], target: int) -> Optional[List[int]]:
     """
     Brute force approach: Check all pairs.
@@ -62,7 +58,7 @@ def two_sum_brute_force(nums: List[int], target: int) -> Optional[List[int]]:
                 return [i, j]
 
 
-@timer_dec
+@instrument
 def two_sum_hash_map(nums: List[int], target: int) -> Optional[List[int]]:
     """
     Hash map approach: Store seen numbers and their indices.
@@ -98,11 +94,129 @@ def two_sum_hash_map(nums: List[int], target: int) -> Optional[List[int]]:
         seen[num] = i
 
 
+def is_sorted(nums: Sequence[int]) -> bool:
+    """
+    True if nums is in non-decreasing order.
+
+    Runs entirely inside C iterators (no list copy) and stops at the first
+    out-of-order pair, so unsorted inputs are usually rejected immediately.
+    """
+    return all(map(le, nums, islice(nums, 1, None)))
+
+
+@instrument
+def two_sum_two_pointer(nums: Sequence[int], target: int) -> Optional[List[int]]:
+    """
+    Two pointers for SORTED input: same result as two_sum_hash_map, no dict.
+
+    HINT:
+    - On sorted input, two_sum_hash_map completes its first pair at the
+      FIRST copy of the smallest value y that has a partner x = target - y
+      earlier in the array, and i is the LAST copy of x
+    - If target / 2 occurs twice, that pair completes first of all
+    - Otherwise start both pointers at the middle (the target / 2 boundary)
+      and move them OUTWARD: hi walks up through candidate y values in
+      increasing order, lo walks down through x values, so the first match
+      is the smallest y, found at its first copy, with lo at the last copy
+      of x
+
+    Works on lists, array.array and memoryview buffers - only indexing is
+    used, nothing is copied.
+
+    Args:
+        nums: Numbers (int or float) in non-decreasing order
+        target: Target sum to find
+
+    Returns:
+        List of two indices [i, j] if found, None otherwise
+
+    Time Complexity: O(log n + distance scanned from the middle)
+    Space Complexity: O(1)
+    """
+    n = len(nums)
+    # Bounds by comparison, not floor division: works for float input too
+    mid = find_first_true(lambda k: 2 * nums[k] >= target, 0, n - 1)
+    mid = n if mid is None else mid  # first x >= target / 2
+    if mid + 1 < n and 2 * nums[mid] == target and 2 * nums[mid + 1] == target:
+        return [mid, mid + 1]
+    lo = mid - 1  # last x < target / 2
+    hi = find_first_true(lambda k: 2 * nums[k] > target, mid, n - 1)
+    hi = n if hi is None else hi  # first y > target / 2
+    while lo >= 0 and hi < n:
+        s = nums[lo] + nums[hi]
+        if s < target:
+            hi += 1
+        elif s > target:
+            lo -= 1
+        else:
+            return [lo, hi]
+    return None
+
+
+# Inputs at least this long use the NumPy backend when it is installed
+NUMPY_THRESHOLD = 100_000
+# Cheap hash-map scan tried first, since most pairs complete early
+PREFIX_SCAN = 1 << 14
+
+
+def two_sum(
+    nums: List[int], target: int, backend: str = "auto", assume_sorted: bool = False
+) -> Optional[List[int]]:
+    """
+    Two sum with automatic backend selection.
+
+    All backends return exactly what two_sum_hash_map returns.
+
+    HINT:
+    - Sorted inputs (assume_sorted=True, or detected by is_sorted): two
+      pointers, no allocation at all
+    - Small inputs: plain two_sum_hash_map
+    - Large inputs: try two_sum_hash_map on the first PREFIX_SCAN numbers.
+      If the earliest pair completes inside the prefix, it is also the
+      earliest pair overall, so we are done without touching the rest.
+    - Otherwise hand the whole array to the vectorized NumPy backend
+
+    Args:
+        nums: List of integers (or array.array / NumPy integer array)
+        target: Target sum to find
+        backend: "auto", "hash_map", "numpy" or "two_pointer"
+        assume_sorted: Caller guarantees nums is sorted (skips the check)
+
+    Returns:
+        List of two indices [i, j] if found, None otherwise
+    """
+    if backend not in ("auto", "hash_map", "numpy", "two_pointer"):
+        raise ValueError(f"unknown backend {backend!r}")
+    if backend == "hash_map":
+        return two_sum_hash_map(nums, target)
+    if backend == "two_pointer" or (
+        backend == "auto" and (assume_sorted or is_sorted(nums))
+    ):
+        return two_sum_two_pointer(nums, target)
+
+    from arrays.two_sum_numpy import np, two_sum_numpy
+
+    if backend == "numpy":
+        return two_sum_numpy(nums, target)
+    if np is None or len(nums) < NUMPY_THRESHOLD:
+        return two_sum_hash_map(nums, target)
+    early = two_sum_hash_map(nums[:PREFIX_SCAN], target)
+    if early is not None:
+        return early
+    try:
+        return two_sum_numpy(nums, target)
+    except TypeError:
+        return two_sum_hash_map(nums, target)
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("TWO SUM - TEST YOUR IMPLEMENTATION")
     print("=" * 60)
 
+    # Record every call; latencies are printed once at the end
+    RECORDER.configure(sample_every=1)
+
     # Test Case 1: Basic case
     nums1 = [2, 7, 11, 15]
     target1 = 9
@@ -152,4 +266,6 @@ if __name__ == "__main__":
     print(f"  Brute force: {two_sum_brute_force(nums7, target7)} (expected: [0, 2])")
     print(f"  Hash map:    {two_sum_hash_map(nums7, target7)} (expected: [0, 2])")
 
+    print("\nTiming:")
+    RECORDER.report()
     print("\n" + "=" * 60)
@@ -0,0 +1,273 @@
+"""
+Two Sum - External Memory (Inputs Larger Than RAM)
+
+Problem: the numbers are a file of billions of packed integers. The `seen`
+dict of two_sum_hash_map would need ~100 bytes per number - far more RAM
+than we have.
+
+Approach: hash partitioning.
+1. Every pair {u, target - u} has one canonical key: min(u, target - u).
+   Both members of a pair have the SAME key, so if we route each number to
+   partition hash(key) % P, a number and its complement always land in the
+   same partition.
+2. One streaming pass writes (index, value) records to P temp files.
+   Records keep their original order within each file.
+3. Each partition is small enough for the in-memory two_sum_hash_map loop
+   (with global indices). Its first completing pair is the earliest pair
+   among its values, and i is the latest earlier complement - the
+   complement can only live in this partition.
+4. The globally earliest pair is the one with the smallest j. Once a pair
+   ending at j is known, the other partitions are only scanned up to j.
+
+P is chosen so that one partition's dict fits in memory_limit, but at most
+MAX_PARTITIONS files are open at once. A partition that is still too big
+is split again with the next 8 bits of the same hash (a pair's key keeps
+both members together at every level), so huge inputs take one extra pass
+per level instead of thousands of open files. A split that leaves every
+record in one child (one value repeated) stops: `seen` only holds distinct
+values. Each partition's write buffer is memory_limit / P bytes, capped at
+_BLOCK values.
+
+Time Complexity: O(n) - sequential passes, one more per level of
+                 splitting (log_256 of the partitions needed)
+Space Complexity: O(n / P) in memory, O(n) on disk
+
+Run the demo with: python -m arrays.two_sum_external [count]
+"""
+
+import os
+import tempfile
+from array import array
+from itertools import chain
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Rough in-memory cost of one `seen` entry: dict slot + two int objects
+ENTRY_BYTES = 128
+DEFAULT_MEMORY_LIMIT = 256 * 2**20
+# Open partition files per pass, well under the usual limit of 1024 fds
+MAX_PARTITIONS = 256
+_LEVEL_BITS = 8  # log2(MAX_PARTITIONS): hash bits used per level
+_LEVELS = 64 // _LEVEL_BITS
+_RECORD_BYTES = 16  # (index, value) as two int64
+_BLOCK = 1 << 16
+_GOLDEN = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+
+def _partition_count(n: int, memory_limit: int) -> int:
+    """
+    Smallest power of two P with n / P entries fitting in memory_limit,
+    capped at MAX_PARTITIONS and at n (one record per partition).
+    """
+    partitions = 1
+    while (n * ENTRY_BYTES > memory_limit * partitions
+           and partitions < MAX_PARTITIONS and 2 * partitions <= n):
+        partitions *= 2
+    return partitions
+
+
+def _buffer_size(memory_limit: int, partitions: int) -> int:
+    """Values per partition buffer: memory_limit / P bytes, whole records."""
+    values = min(_BLOCK, memory_limit // (8 * partitions))
+    return max(2, values - values % 2)
+
+
+def _read_blocks(source, typecode: str) -> Iterable[array]:
+    """Yield array blocks from a packed binary file or a sequence."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            while True:
+                block = array(typecode)
+                try:
+                    block.fromfile(f, _BLOCK)
+                except EOFError:  # last, partial block
+                    pass
+                if not block:
+                    return
+                yield block
+    else:
+        for start in range(0, len(source), _BLOCK):
+            yield source[start:start + _BLOCK]
+
+
+def _file_records(path: str) -> Iterator[Tuple[int, int]]:
+    """(index, value) records of a partition file, _BLOCK values at a time."""
+    values = chain.from_iterable(_read_blocks(path, "q"))  # _BLOCK is even
+    return zip(values, values)
+
+
+def _partition(
+    records: Iterable[Tuple[int, int]],
+    target: int,
+    partitions: int,
+    level: int,
+    prefix: str,
+    memory_limit: int,
+    stop: int,
+) -> List[str]:
+    """
+    Route (index, value) records with index < stop to one file per
+    non-empty partition, using hash bits [level * 8, level * 8 + 8) from
+    the top. Returns the paths in partition order.
+    """
+    shift = 64 - _LEVEL_BITS * (level + 1)
+    mask = partitions - 1
+    flush_at = _buffer_size(memory_limit, partitions)
+    # Files open on their first flush: empty partitions cost nothing
+    files: List[Optional[BinaryIO]] = [None] * partitions
+    buffers = [array("q") for _ in range(partitions)]
+
+    def flush(p: int) -> None:
+        if files[p] is None:
+            files[p] = open(f"{prefix}.{p:03d}", "wb")
+        buffers[p].tofile(files[p])
+        del buffers[p][:]
+
+    try:
+        for i, num in records:
+            if i >= stop:
+                break
+            key = min(num, target - num)
+            # Multiplicative hash: 8 bits of key * golden ratio per level
+            p = (((key * _GOLDEN) & _MASK64) >> shift) & mask
+            buf = buffers[p]
+            buf.append(i)
+            buf.append(num)
+            if len(buf) >= flush_at:
+                flush(p)
+        for p, buf in enumerate(buffers):
+            if buf:
+                flush(p)
+    finally:
+        for f in files:
+            if f is not None:
+                f.close()
+    return [f.name for f in files if f is not None]
+
+
+def _earliest_in_partition(path: str, target: int, stop: int) -> Optional[List[int]]:
+    """
+    two_sum_hash_map over one partition's records, ignoring j >= stop.
+
+    Records are read _BLOCK values at a time: a partition can be far larger
+    than memory_limit (a value repeated n times sends all n records to one
+    partition), but `seen` only holds its distinct values.
+    """
+    seen = {}
+    for j, num in _file_records(path):
+        if j >= stop:
+            return None
+        complement = target - num
+        if complement in seen:
+            return [seen[complement], j]
+        seen[num] = j
+    return None
+
+
+def _search(
+    paths: List[str],
+    target: int,
+    stop: int,
+    memory_limit: int,
+    level: int,
+    parent_count: int,
+) -> Optional[List[int]]:
+    """
+    Earliest pair over the partition files of one level. Files that are
+    still over memory_limit are split with the next level's hash bits.
+    Every file is removed once it has been searched.
+    """
+    best: Optional[List[int]] = None
+    for path in paths:
+        limit = best[1] if best else stop
+        count = os.path.getsize(path) // _RECORD_BYTES
+        if (count * ENTRY_BYTES > memory_limit and count < parent_count
+                and level + 1 < _LEVELS):
+            partitions = _partition_count(count, memory_limit)
+            children = _partition(_file_records(path), target, partitions, level + 1,
+                                  path, memory_limit, limit)
+            os.remove(path)
+            pair = _search(children, target, limit, memory_limit, level + 1, count)
+        else:
+            pair = _earliest_in_partition(path, target, limit)
+            os.remove(path)
+        if pair is not None:
+            best = pair
+    return best
+
+
+def two_sum_external(
+    source: Union[str, os.PathLike, Sequence[int]],
+    target: int,
+    memory_limit: int = DEFAULT_MEMORY_LIMIT,
+    tmp_dir: Optional[str] = None,
+    typecode: str = "q",
+) -> Optional[List[int]]:
+    """
+    Same result as two_sum_hash_map, for inputs that do not fit in memory.
+
+    Args:
+        source: Path to a file of packed native-endian integers (as written
+            by array.tofile), or a sequence such as array.array
+        target: Target sum to find
+        memory_limit: Approximate bytes allowed for one partition's dict
+            (and, while partitioning, for all write buffers together)
+        tmp_dir: Where to put partition files (system temp dir if None)
+        typecode: array typecode of the file; values must fit in int64
+
+    Returns:
+        List of two indices [i, j] if found, None otherwise
+    """
+    if isinstance(source, (str, os.PathLike)):
+        n = os.path.getsize(source) // array(typecode).itemsize
+    else:
+        n = len(source)
+    partitions = _partition_count(n, memory_limit)
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as directory:
+        records = enumerate(chain.from_iterable(_read_blocks(source, typecode)))
+        paths = _partition(records, target, partitions, 0, os.path.join(directory, "part"),
+                           memory_limit, n)
+        return _search(paths, target, n, memory_limit, 0, n)
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    from arrays.two_sum import two_sum_hash_map
+
+    print("=" * 60)
+    print("EXTERNAL MEMORY TWO SUM - TEST YOUR IMPLEMENTATION")
+    print("=" * 60)
+
+    # Pass a larger count (e.g. 300_000_000 for a 2.4 GB file) to try it
+    # on data that really does not fit in memory
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    memory_limit = 16 * 2**20
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "numbers.bin")
+        with open(path, "wb") as f:
+            for start in range(0, count, _BLOCK):
+                size = min(_BLOCK, count - start)
+                # Even values and an odd target: no pair, the worst case
+                array("q", (2 * random.randrange(10**12) for _ in range(size))).tofile(f)
+        print(f"\n   {count:,} int64 values, {os.path.getsize(path) / 2**20:,.0f} MB on disk")
+        print(f"   memory_limit={memory_limit // 2**20} MB -> "
+              f"{_partition_count(count, memory_limit)} partitions")
+
+        start = time.perf_counter()
+        result = two_sum_external(path, 1, memory_limit=memory_limit, tmp_dir=directory)
+        print(f"   two_sum_external: {result} in {time.perf_counter() - start:.2f}s")
+
+        if count <= 10_000_000:
+            nums = array("q")
+            with open(path, "rb") as f:
+                nums.frombytes(f.read())
+            start = time.perf_counter()
+            expected = two_sum_hash_map(nums, 1)
+            print(f"   two_sum_hash_map: {expected} in {time.perf_counter() - start:.2f}s (in memory)")
+
+    print("\n" + "=" * 60)
@@ -0,0 +1,156 @@
+"""
+Two Sum Index - Many Targets Over the Same Array
+
+Problem: two_sum_hash_map rebuilds its `seen` dict on every call. When the
+same nums is queried with thousands of different targets, that O(n) dict
+construction is repeated every time.
+
+Approach: build the value -> indices map ONCE, then answer each query by
+walking the DISTINCT values in order of first appearance, stopping at the
+first completing pair.
+
+Matching two_sum_hash_map exactly:
+two_sum_hash_map returns [i, j] where j is the FIRST position at which some
+earlier element completes the pair, and i is the LATEST earlier index holding
+the complement (because `seen[num] = i` overwrites older indices).
+- For two different values u and c, the pair completes at
+  max(first[u], first[c]) - i.e. always at a first appearance. So walking
+  distinct values u in first-appearance order and stopping at the first u
+  whose complement appeared earlier finds j = first[u].
+- For u == c (the [3, 3] case, only possible when target is even) the pair
+  completes at the SECOND appearance of u; that candidate is checked first
+  and bounds how far the walk has to go.
+- The walk keeps a small local `seen` set rather than probing the full
+  index: it stays cache-resident, the same trick that makes the original
+  loop fast.
+- i is the last index of the complement below j (binary search in the
+  complement's sorted index list).
+
+Time Complexity:
+    Build: O(n)
+    Query: O(d + log n) worst case for d distinct values, and it stops at
+           the first hit - arrays with many duplicates get much cheaper
+Space Complexity: O(n) for the index, O(d) scratch set per query
+
+Run the benchmark with: python -m arrays.two_sum_index
+"""
+
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from searching.binary_search import find_insertion_position
+
+
+class TwoSumIndex:
+    """
+    Reusable two-sum index over a fixed list of numbers.
+
+    The list must not be mutated after the index is built.
+
+    Example:
+        index = TwoSumIndex([2, 7, 11, 15])
+        index.query(9)            # [0, 1]
+        index.query(26)           # [2, 3]
+        index.query_many([9, 4])  # [[0, 1], None]
+    """
+
+    def __init__(self, nums: Sequence[int]):
+        self.nums = nums
+        self._positions: Dict[int, List[int]] = {}
+        for i, num in enumerate(nums):
+            if num in self._positions:
+                self._positions[num].append(i)
+            else:
+                self._positions[num] = [i]
+        self._first: Dict[int, int] = {v: idx[0] for v, idx in self._positions.items()}
+        self._distinct: List[int] = list(self._positions)  # first-appearance order
+        self._firsts: List[int] = list(self._first.values())
+        if nums:
+            self._min_sum = 2 * min(self._positions)
+            self._max_sum = 2 * max(self._positions)
+
+    def __len__(self) -> int:
+        return len(self.nums)
+
+    def query(self, target: int) -> Optional[List[int]]:
+        """
+        Same result as two_sum_hash_map(nums, target).
+
+        Args:
+            target: Target sum to find
+
+        Returns:
+            List of two indices [i, j] if found, None otherwise
+        """
+        if len(self.nums) < 2 or not self._min_sum <= target <= self._max_sum:
+            return None
+        best_j = len(self.nums)
+        best_value = None
+        if target % 2 == 0:
+            same = self._positions.get(target // 2)
+            if same is not None and len(same) > 1:
+                best_j, best_value = same[1], target // 2
+
+        # Walk distinct values (first-appearance order) that appear before
+        # best_j, exactly like two_sum_hash_map but skipping duplicates
+        limit = find_insertion_position(self._firsts, best_j)
+        seen = set()
+        add = seen.add
+        for k, u in enumerate(islice(self._distinct, limit)):
+            if target - u in seen:
+                best_j, best_value = self._firsts[k], target - u
+                break
+            add(u)
+
+        if best_value is None:
+            return None
+        indices = self._positions[best_value]
+        return [indices[find_insertion_position(indices, best_j) - 1], best_j]
+
+    def query_many(self, targets: Iterable[int]) -> List[Optional[List[int]]]:
+        """
+        Answer many targets; repeated targets are only computed once.
+
+        Returns:
+            List of results in the same order as targets
+        """
+        answers: Dict[int, Optional[List[int]]] = {}
+        results = []
+        for target in targets:
+            if target not in answers:
+                answers[target] = self.query(target)
+            answer = answers[target]
+            results.append(None if answer is None else list(answer))
+        return results
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from arrays.two_sum import two_sum_hash_map
+
+    print("=" * 60)
+    print("TWO SUM INDEX - REPEATED TARGETS BENCHMARK")
+    print("=" * 60)
+
+    for n, value_range in [(100_000, 10**6), (1_000_000, 10**5)]:
+        nums = [random.randrange(value_range) for _ in range(n)]
+        targets = [random.randrange(2 * value_range) for _ in range(1_000)]
+        print(f"\nn={n:,}, values < {value_range:,}, 1,000 targets")
+
+        start = time.perf_counter()
+        expected = [two_sum_hash_map(nums, t) for t in targets]
+        print(f"   two_sum_hash_map per target:    {time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        index = TwoSumIndex(nums)
+        build = time.perf_counter() - start
+        got = index.query_many(targets)
+        print(
+            f"   TwoSumIndex build + query_many: {time.perf_counter() - start:.2f}s "
+            f"(build {build:.3f}s)"
+        )
+        print(f"   Results match: {got == expected}")
+
+    print("\n" + "=" * 60)
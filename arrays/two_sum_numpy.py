@@ -0,0 +1,161 @@
+"""
+Two Sum - Vectorized NumPy Backend
+
+Problem: for 10^7 int64 values, two_sum_hash_map spends its time creating
+Python int objects and dict entries, not doing arithmetic.
+
+Approach: answer the same question with whole-array operations.
+
+two_sum_hash_map returns the EARLIEST completing pair [i, j]:
+- j is the first position where some earlier element completes the pair
+- i is the LATEST earlier index holding the complement
+
+For two different values u and c the pair completes at
+max(first[u], first[c]); for u == c it completes at the second
+appearance of u.
+
+Pass 1 sorts only the VALUES (NumPy's fast unstable sort) to find which
+distinct values have a partner at all. Usually few do, so pass 2 keeps only
+the positions holding those values - in their original order, which
+preserves the earliest-pair semantics - and runs a stable argsort on that
+much smaller array to compute, for every candidate value at once:
+
+    order  = argsort(nums, stable)   -> equal values keep index order
+    vals   = distinct values (sorted), first = first index of each value
+    comp   = target - vals, looked up in vals with searchsorted
+    j[u]   = max(first[u], first[comp]) or second index of u if comp == u
+
+j* = min(j). The complement's indices are a contiguous, increasing slice
+of order, so i = the last one below j* (one more searchsorted).
+
+Time Complexity: O(n log n) - sorting, the rest is linear and vectorized
+Space Complexity: O(n)
+
+Run the benchmark with: python -m arrays.two_sum_numpy
+"""
+
+from typing import List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is an optional accelerator
+    np = None
+
+from arrays.two_sum import two_sum_hash_map
+
+# Values are kept well inside int64 so target - value cannot overflow
+_SAFE_BOUND = 1 << 62
+
+
+def two_sum_numpy(nums: Sequence[int], target: int) -> Optional[List[int]]:
+    """
+    Same result as two_sum_hash_map, computed with NumPy.
+
+    Args:
+        nums: Integers (list, array.array or 1-D NumPy integer array)
+        target: Target sum to find
+
+    Returns:
+        List of two indices [i, j] if found, None otherwise
+
+    Raises:
+        ImportError: If NumPy is not installed
+        TypeError: If nums is not a 1-D integer array
+    """
+    if np is None:
+        raise ImportError("two_sum_numpy requires NumPy to be installed")
+    a = np.asarray(nums)
+    n = a.size
+    if n < 2:
+        return None
+    if a.ndim != 1 or a.dtype.kind not in "iu":
+        raise TypeError("two_sum_numpy only supports 1-D integer arrays")
+
+    lo = int(a.min())
+    hi = int(a.max())
+    if not (-_SAFE_BOUND < lo and hi < _SAFE_BOUND and -_SAFE_BOUND < target < _SAFE_BOUND):
+        # Too close to the int64 limits for vectorized arithmetic
+        return two_sum_hash_map(a.tolist(), target)
+    if target < 2 * lo or target > 2 * hi:
+        return None
+    a = a.astype(np.int64, copy=False)
+
+    # Pass 1 (values only, fast unstable sort): which values have a partner?
+    sorted_vals = np.sort(a)
+    vals = sorted_vals[np.concatenate(([True], sorted_vals[1:] != sorted_vals[:-1]))]
+    comp = (target - vals)[::-1]  # ascending, so searchsorted stays cache-friendly
+    pos = np.minimum(np.searchsorted(vals, comp), vals.size - 1)
+    partner = (vals[pos] == comp)[::-1]
+    candidates = vals[partner & (vals * 2 != target)]
+    if target % 2 == 0 and np.count_nonzero(sorted_vals == target // 2) > 1:
+        candidates = np.union1d(candidates, [target // 2])
+    if candidates.size == 0:
+        return None
+
+    # Pass 2: only positions holding a candidate value can form the answer,
+    # and keeping them in order preserves "earliest j, latest i"
+    pos = np.minimum(np.searchsorted(candidates, a), candidates.size - 1)
+    keep = np.flatnonzero(candidates[pos] == a)
+    i, j = _earliest_pair(a[keep], target)
+    return [int(keep[i]), int(keep[j])]
+
+
+def _earliest_pair(a, target: int) -> List[int]:
+    """
+    Earliest completing pair of a (which is known to contain one).
+
+    Uses a stable argsort so equal values keep their index order: the first
+    index of each value and the indices of the complement come for free.
+    """
+    n = a.size
+    order = np.argsort(a, kind="stable")
+    sorted_vals = a[order]
+    starts = np.flatnonzero(np.concatenate(([True], sorted_vals[1:] != sorted_vals[:-1])))
+    vals = sorted_vals[starts]
+    first = order[starts]
+    counts = np.diff(np.append(starts, n))
+
+    comp = target - vals
+    pos = np.minimum(np.searchsorted(vals, comp), vals.size - 1)
+    found = vals[pos] == comp
+
+    j = np.full(vals.size, n, dtype=np.int64)
+    different = found & (comp != vals)
+    j[different] = np.maximum(first[different], first[pos[different]])
+    same = found & (comp == vals) & (counts > 1)
+    j[same] = order[starts[same] + 1]
+
+    j_star = int(j.min())
+    complement = target - int(a[j_star])
+    g = int(np.searchsorted(vals, complement))
+    group = order[starts[g]:starts[g] + counts[g]]
+    i = int(group[np.searchsorted(group, j_star) - 1])
+    return [i, j_star]
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    print("=" * 60)
+    print("TWO SUM - NUMPY BACKEND BENCHMARK")
+    print("=" * 60)
+
+    for n in (10**5, 10**6, 10**7):
+        # Even values and an odd target: no pair exists, so both backends
+        # must look at every element (the worst case for the hash map)
+        nums = [2 * random.randrange(-(10**12), 10**12) for _ in range(n)]
+        target = 1
+        print(f"\nn={n:,} (no pair)")
+
+        start = time.perf_counter()
+        expected = two_sum_hash_map(nums, target)
+        print(f"   two_sum_hash_map: {time.perf_counter() - start:.3f}s")
+
+        if np is not None:
+            arr = np.array(nums, dtype=np.int64)
+            start = time.perf_counter()
+            got = two_sum_numpy(arr, target)
+            print(f"   two_sum_numpy:    {time.perf_counter() - start:.3f}s (match: {got == expected})")
+
+    print("\n" + "=" * 60)
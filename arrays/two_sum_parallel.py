@@ -0,0 +1,378 @@
+"""
+Two Sum - Parallel Across CPU Cores
+
+Problem: two_sum_hash_map is one interpreter loop, so it uses one core no
+matter how many the machine has.
+
+Approach: put nums in shared memory once, then run three phases. The result
+is identical to two_sum_hash_map.
+
+two_sum_hash_map returns [i, j] where j is the earliest position that
+completes a pair and i is the LATEST earlier index of the complement.
+For u != target - u, the pair completes at max(first[u], first[c]), so
+only FIRST occurrences matter. For u == target - u it completes at the
+second occurrence of u.
+
+1. Per chunk (parallel): the first index of every distinct value. Each
+   (value, first index) is routed to a partition by the canonical pair
+   key min(u, target - u), which both members of a pair share (the trick
+   from two_sum_external), so a value and its complement always meet in
+   the same partition. With NumPy this is np.unique(return_index=True)
+   plus one stable argsort by partition - no Python loop at all; without
+   it, dict(zip(reversed(chunk), reversed(indices))) and one routing step
+   per distinct value. The records go to the chunk's own rows of a scratch
+   region in the same shared memory; only the partition boundaries (and
+   the first two indices of target / 2) travel back through the pool.
+2. Per partition (parallel): read the partition's rows of every chunk and
+   match values with their complements - np.unique + searchsorted with
+   NumPy, C-level set operations without. Earlier chunks win, giving
+   j = max(first[u], first[c]).
+3. j = the smallest candidate. i = the last occurrence of target - nums[j]
+   before j, found by an aligned bytes.rfind over the shared buffer (C
+   speed, searching backwards from j).
+
+As in two_sum(), a serial scan of the first PREFIX_SCAN numbers runs first:
+a pair that completes there is the answer without starting any process.
+The NumPy phases need every value and target within two_sum_numpy's
+_SAFE_BOUND (so target - value cannot overflow); otherwise the pure-Python
+phases run.
+
+Measured (n=10^7, no pair, `python -m arrays.two_sum_parallel`, 1-CPU
+machine, so speedups are projected from measured CPU time: parent time +
+worker time / workers). two_sum_hash_map takes ~9 s. "scaling" is the
+same phases on `workers` cores vs on one core:
+
+    phases        work vs serial   projected (2/4/8)    scaling (2/4/8)
+    NumPy         0.44-0.46x       4.4 / 8.8 / 14.5x    2.0 / 3.7 / 6.6x
+    pure Python   2.3x             0.9 / 1.7 / 3.4x     2.0 / 3.9 / 7.7x
+
+Keeping phase 1's records in shared memory cut the parent's own CPU time
+from 0.62 s to 0.12 s at 8 workers; that serial part (copying nums in,
+start-up) is what bends the NumPy curve below linear. Without NumPy the
+phases scale near-linearly but the per-value routing loop makes them do
+2.3x the serial work, so 8 cores only buy ~3.4x. Rerun on a multi-core
+machine for real elapsed times.
+
+Time Complexity: O(n / workers) per worker (times log n for NumPy's sorts)
+                 + O(workers) to combine
+Space Complexity: O(n) shared (nums plus two scratch rows per element)
+
+Run the benchmark with: python -m arrays.two_sum_parallel [count]
+"""
+
+import os
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from arrays.two_sum import PREFIX_SCAN, two_sum_hash_map
+from arrays.two_sum_numpy import _SAFE_BOUND, np
+
+# Below this size process start-up costs more than the loop itself
+PARALLEL_THRESHOLD = 1 << 20
+_ITEMSIZE = 8
+_RFIND_BLOCK = 1 << 20
+
+
+Parts = List[Tuple[bytes, bytes]]
+Half = Optional[Tuple[int, Optional[int]]]
+
+
+def _chunk_firsts(
+    name: str, n: int, start: int, stop: int, target: int, partitions: int, vectorized: bool
+) -> Tuple[List[int], Half]:
+    """
+    Phase 1: distinct values of nums[start:stop] and their first indices,
+    grouped by partition and written to rows [start, stop) of the two
+    scratch regions after nums. Returns the partition boundaries (rows).
+    """
+    shm = SharedMemory(name=name)
+    try:
+        raw = bytes(shm.buf[start * _ITEMSIZE:stop * _ITEMSIZE])
+        if vectorized:
+            values, first, counts, half = _chunk_firsts_numpy(
+                np.frombuffer(raw, dtype=np.int64), start, target, partitions)
+        else:
+            chunk = array("q")
+            chunk.frombytes(raw)
+            values, first, counts, half = _chunk_firsts_loop(chunk, start, target, partitions)
+        for region, column in ((1, values), (2, first)):
+            offset = (region * n + start) * _ITEMSIZE
+            data = column.tobytes()
+            shm.buf[offset:offset + len(data)] = data
+    finally:
+        shm.close()
+    bounds = [start]
+    for count in counts:
+        bounds.append(bounds[-1] + count)
+    return bounds, half
+
+
+def _chunk_firsts_loop(chunk: array, start: int, target: int, partitions: int):
+    """Phase 1 in pure Python: one routing step per distinct value."""
+    # Walking backwards, later (smaller) indices overwrite: value -> first index
+    stop = start + len(chunk)
+    first = dict(zip(reversed(chunk), range(stop - 1, start - 1, -1)))
+    values = [array("q") for _ in range(partitions)]
+    indices = [array("q") for _ in range(partitions)]
+    add_value = [part.append for part in values]
+    add_index = [part.append for part in indices]
+    for value, i in first.items():
+        complement = target - value
+        key = value if value < complement else complement
+        p = key % partitions
+        add_value[p](value)
+        add_index[p](i)
+
+    half = None
+    if target % 2 == 0 and target // 2 in first:
+        i = first[target // 2]
+        try:
+            second: Optional[int] = chunk.index(target // 2, i - start + 1) + start
+        except ValueError:
+            second = None
+        half = (i, second)
+    all_values, all_indices = array("q"), array("q")
+    for v, ix in zip(values, indices):
+        all_values.extend(v)
+        all_indices.extend(ix)
+    return all_values, all_indices, [len(v) for v in values], half
+
+
+def _chunk_firsts_numpy(chunk, start: int, target: int, partitions: int):
+    """Phase 1 without a Python loop: np.unique, then one stable sort by partition."""
+    values, first = np.unique(chunk, return_index=True)  # first occurrences
+    first += start
+    keys = np.minimum(values, target - values)
+    routed = keys % partitions  # same partition as the loop: % of a positive int
+    order = np.argsort(routed, kind="stable")
+    counts = np.bincount(routed, minlength=partitions).tolist()
+
+    half = None
+    if target % 2 == 0:
+        hits = np.flatnonzero(chunk == target // 2)[:2] + start
+        if hits.size:
+            half = (int(hits[0]), int(hits[1]) if hits.size > 1 else None)
+    return values[order], first[order], counts, half
+
+
+def _partition_earliest(
+    name: str, n: int, rows: List[Tuple[int, int]], target: int, vectorized: bool
+) -> Optional[int]:
+    """Phase 2: earliest j completing a u != target - u pair in one partition."""
+    shm = SharedMemory(name=name)
+    try:
+        parts = [(bytes(shm.buf[(n + a) * _ITEMSIZE:(n + b) * _ITEMSIZE]),
+                  bytes(shm.buf[(2 * n + a) * _ITEMSIZE:(2 * n + b) * _ITEMSIZE]))
+                 for a, b in rows]
+    finally:
+        shm.close()
+    if vectorized:
+        return _partition_earliest_numpy(parts, target)
+    return _partition_earliest_loop(parts, target)
+
+
+def _partition_earliest_loop(parts: Parts, target: int) -> Optional[int]:
+    """Phase 2 with C-level set operations; dicts only if a pair exists."""
+    chunks = []
+    present = set()
+    for raw_values, raw_indices in parts:
+        values = array("q")
+        values.frombytes(raw_values)
+        present.update(values)
+        chunks.append((values, raw_indices))
+    matches = present & set(map(target.__sub__, present))
+    if not matches:
+        return None
+
+    first: Dict[int, int] = {}
+    for values, raw_indices in reversed(chunks):  # earlier chunks overwrite
+        indices = array("q")
+        indices.frombytes(raw_indices)
+        first.update(zip(values, indices))
+    best = None
+    for u in matches:
+        complement = target - u
+        if u < complement:  # each pair once; u == complement is handled apart
+            j = max(first[u], first[complement])
+            if best is None or j < best:
+                best = j
+    return best
+
+
+def _partition_earliest_numpy(parts: Parts, target: int) -> Optional[int]:
+    """Phase 2 on sorted arrays: searchsorted for complements, as in two_sum_numpy."""
+    values = np.frombuffer(b"".join(v for v, _ in parts), dtype=np.int64)
+    if values.size == 0:
+        return None
+    indices = np.frombuffer(b"".join(ix for _, ix in parts), dtype=np.int64)
+    # Chunks are concatenated in order, so the first occurrence is the earliest
+    values, where = np.unique(values, return_index=True)
+    first = indices[where]
+    comp = target - values
+    pos = np.minimum(np.searchsorted(values, comp), values.size - 1)
+    pair = (values[pos] == comp) & (values < comp)  # each pair once
+    if not pair.any():
+        return None
+    return int(np.maximum(first[pair], first[pos[pair]]).min())
+
+
+def _last_index(buf: memoryview, value: int, stop: int) -> int:
+    """Phase 3: largest index < stop holding value (searching backwards)."""
+    needle = array("q", [value]).tobytes()
+    end = stop
+    while end > 0:
+        begin = max(0, end - _RFIND_BLOCK)
+        data = bytes(buf[begin * _ITEMSIZE:end * _ITEMSIZE])
+        pos = data.rfind(needle)
+        while pos > 0 and pos % _ITEMSIZE:  # a match straddling two values
+            pos = data.rfind(needle, 0, pos + _ITEMSIZE - 1)
+        if pos >= 0:
+            return begin + pos // _ITEMSIZE
+        end = begin
+    return -1
+
+
+def two_sum_parallel(
+    nums: Sequence[int],
+    target: int,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    threshold: int = PARALLEL_THRESHOLD,
+) -> Optional[List[int]]:
+    """
+    Same result as two_sum_hash_map, computed by several processes.
+
+    Args:
+        nums: Integers that fit in int64 (list or array('q'))
+        target: Target sum to find
+        workers: Number of chunks/partitions (default: CPU count)
+        executor: Process pool to reuse across calls (created if None)
+        threshold: Inputs shorter than this use two_sum_hash_map directly
+
+    Returns:
+        List of two indices [i, j] if found, None otherwise
+    """
+    n = len(nums)
+    workers = workers or os.cpu_count() or 1
+    if n < max(threshold, 2) or workers < 2:
+        return two_sum_hash_map(nums, target)
+    # Most pairs complete early: a pair inside the prefix is the earliest
+    early = two_sum_hash_map(nums[:PREFIX_SCAN], target)
+    if early is not None:
+        return early
+
+    data = nums if isinstance(nums, array) and nums.typecode == "q" else array("q", nums)
+    # nums, then two scratch regions for phase 1's (value, first index) rows
+    shm = SharedMemory(create=True, size=3 * n * _ITEMSIZE)
+    try:
+        pool = executor or ProcessPoolExecutor(max_workers=workers)
+        try:
+            return _run_phases(pool, shm, data, target, workers)
+        finally:
+            if executor is None:
+                pool.shutdown()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _vectorizable(data: array, target: int) -> bool:
+    """NumPy is installed and target - value cannot overflow int64."""
+    if np is None:
+        return False
+    values = np.frombuffer(data, dtype=np.int64)
+    return (-_SAFE_BOUND < int(values.min()) and int(values.max()) < _SAFE_BOUND
+            and -_SAFE_BOUND < target < _SAFE_BOUND)
+
+
+def _run_phases(
+    pool: Executor, shm: SharedMemory, data: array, target: int, workers: int
+) -> Optional[List[int]]:
+    """The three phases of two_sum_parallel over nums already in shm."""
+    n = len(data)
+    shm.buf[:n * _ITEMSIZE] = memoryview(data).cast("B")
+    vectorized = _vectorizable(data, target)
+    starts = [n * w // workers for w in range(workers)]
+    stops = starts[1:] + [n]
+    phase1 = list(pool.map(
+        _chunk_firsts, repeat(shm.name), repeat(n), starts, stops, repeat(target),
+        repeat(workers), repeat(vectorized),
+    ))
+    # Only row ranges travel through the pool; the records stay in shm
+    by_partition = [[(bounds[p], bounds[p + 1]) for bounds, _ in phase1]
+                    for p in range(workers)]
+    candidates = [j for j in pool.map(_partition_earliest, repeat(shm.name), repeat(n),
+                                      by_partition, repeat(target), repeat(vectorized))
+                  if j is not None]
+
+    # Second occurrence of target / 2 across chunks, if any
+    halves: List[int] = []
+    for _, half in phase1:
+        if half is not None:
+            halves.extend(i for i in half if i is not None)
+    if len(halves) > 1:
+        candidates.append(halves[1])
+
+    if not candidates:
+        return None
+    j = min(candidates)
+    return [_last_index(shm.buf, target - data[j], j), j]
+
+if __name__ == "__main__":
+    import random
+    import resource
+    import sys
+    import time
+
+    def children_cpu() -> float:
+        """CPU seconds of finished (reaped) child processes."""
+        usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+        return usage.ru_utime + usage.ru_stime
+
+    def own_cpu() -> float:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return usage.ru_utime + usage.ru_stime
+
+    print("=" * 60)
+    print("PARALLEL TWO SUM - SCALING BENCHMARK")
+    print("=" * 60)
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**7
+    # Even values and an odd target: no pair, every element must be read
+    nums = array("q", (2 * random.randrange(10**12) for _ in range(n)))
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    print(f"\nn={n:,} (no pair), {cpus} usable CPUs")
+
+    start = time.perf_counter()
+    expected = two_sum_hash_map(nums, 1)
+    serial = time.perf_counter() - start
+    print(f"   two_sum_hash_map: {serial:.2f}s")
+
+    # Elapsed time only shows the speedup when there are >= workers CPUs.
+    # The projection does not need them: the worker processes' CPU time is
+    # the parallel work, the parent's CPU time is the serial part, so on
+    # `workers` free cores: time ~= parent + children / workers.
+    print(f"\n   {'workers':>7} {'elapsed':>8} {'speedup':>8} {'work':>7} {'projected':>10} "
+          f"{'scaling':>8}")
+    for workers in (2, 4, 8):
+        before_children, before_own = children_cpu(), own_cpu()
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            got = two_sum_parallel(nums, 1, workers=workers, executor=pool)
+        elapsed = time.perf_counter() - start
+        parallel = children_cpu() - before_children
+        sequential = own_cpu() - before_own
+        on_idle_cores = sequential + parallel / workers
+        projected = serial / on_idle_cores
+        scaling = (sequential + parallel) / on_idle_cores
+        assert got == expected
+        print(f"   {workers:>7} {elapsed:>7.2f}s {serial / elapsed:>7.2f}x "
+              f"{(sequential + parallel) / serial:>6.2f}x {projected:>9.2f}x {scaling:>7.2f}x")
+    print("\n   work = total CPU time / serial time (the price of parallelism)")
+    print("   projected = speedup on `workers` idle cores, from measured CPU time")
+    print("   scaling = the same phases on `workers` cores vs on one core")
+
+    print("\n" + "=" * 60)
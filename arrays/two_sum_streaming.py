@@ -0,0 +1,201 @@
+"""
+Two Sum - Streaming Input With Bounded Memory
+
+Problem: the numbers arrive from a socket or file, so we cannot build a
+list first. We still want exactly what two_sum_hash_map would return for
+the concatenated stream, as soon as the pair appears.
+
+Approach: two_sum_hash_map already makes a single left-to-right pass, so
+the same loop works on any iterator - we only have to keep a running
+global index across chunks.
+
+Two optional ways to cap the memory used by the `seen` map:
+
+1. Value-range filter: if every value is known to lie in [lo, hi], a number
+   whose complement (target - num) is outside [lo, hi] can never be part of
+   a pair - neither now nor later - so it is never looked up or stored.
+
+2. Spill to disk: once `seen` holds max_entries values, it is flushed into
+   an SQLite table and cleared. Lookups check the in-memory map first
+   (it always holds the newest index of a value), then the table. The
+   "latest index" semantics of two_sum_hash_map are preserved because a
+   flush overwrites older rows for the same value.
+
+Time Complexity: O(n) (plus disk lookups once spilling starts)
+Space Complexity: O(min(n, max_entries)) in memory
+
+Run the demo with: python -m arrays.two_sum_streaming
+"""
+
+import os
+import sqlite3
+import tempfile
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class StreamingTwoSum:
+    """
+    Incremental two-sum over a stream fed in arbitrary chunks.
+
+    Example:
+        detector = StreamingTwoSum(target=9)
+        detector.feed([2, 11])  # None
+        detector.feed([7, 15])  # [0, 2] - global indices across chunks
+    """
+
+    def __init__(
+        self,
+        target: int,
+        value_range: Optional[Tuple[int, int]] = None,
+        max_entries: Optional[int] = None,
+        spill_path: Optional[str] = None,
+    ):
+        """
+        Args:
+            target: Target sum to find
+            value_range: Optional (lo, hi) bounds every value is known to obey
+            max_entries: Spill the seen map to disk when it reaches this size
+            spill_path: SQLite file for spilled entries (temporary if None);
+                a `seen` table already in the file is replaced
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.target = target
+        self.value_range = value_range
+        self.max_entries = max_entries
+        self.count = 0
+        self.result: Optional[List[int]] = None
+        self._seen: Dict[int, int] = {}
+        self._spill_path = spill_path
+        self._owns_spill_file = spill_path is None
+        self._db: Optional[sqlite3.Connection] = None
+        self.spilled = 0
+
+    def __enter__(self) -> "StreamingTwoSum":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close and (if temporary) delete the spill file."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+            if self._owns_spill_file:
+                os.remove(self._spill_path)
+
+    def _spill(self) -> None:
+        """Move the in-memory seen map into the SQLite table."""
+        if self._db is None:
+            if self._spill_path is None:
+                fd, self._spill_path = tempfile.mkstemp(suffix=".sqlite")
+                os.close(fd)
+            self._db = sqlite3.connect(self._spill_path)
+            # Rows left by an earlier stream in the same file would match
+            # as complements, so every stream starts from an empty table
+            self._db.execute("DROP TABLE IF EXISTS seen")
+            self._db.execute("CREATE TABLE seen (value INTEGER PRIMARY KEY, idx INTEGER)")
+        self._db.executemany(
+            "INSERT OR REPLACE INTO seen (value, idx) VALUES (?, ?)", self._seen.items()
+        )
+        self._db.commit()
+        self.spilled += len(self._seen)
+        self._seen.clear()
+
+    def _lookup_spilled(self, value: int) -> Optional[int]:
+        row = self._db.execute("SELECT idx FROM seen WHERE value = ?", (value,)).fetchone()
+        return None if row is None else row[0]
+
+    def feed(self, numbers: Iterable[int]) -> Optional[List[int]]:
+        """
+        Consume numbers (a chunk, array.array block or any iterator).
+
+        Stops consuming as soon as the first pair is found.
+
+        Returns:
+            [i, j] global indices of the first pair, None if not found yet
+        """
+        if self.result is not None:
+            return self.result
+        target = self.target
+        seen = self._seen
+        lo, hi = self.value_range if self.value_range is not None else (None, None)
+        limit = self.max_entries
+
+        i = self.count - 1
+        for i, num in enumerate(numbers, self.count):
+            complement = target - num
+            if lo is not None and not lo <= complement <= hi:
+                continue
+            if complement in seen:
+                self.result = [seen[complement], i]
+            elif self._db is not None:
+                earlier = self._lookup_spilled(complement)
+                if earlier is not None:
+                    self.result = [earlier, i]
+            if self.result is not None:
+                self.count = i + 1
+                return self.result
+            seen[num] = i
+            if limit is not None and len(seen) >= limit:
+                self._spill()
+        self.count = i + 1
+        return None
+
+
+def two_sum_stream(numbers: Iterable[int], target: int, **options) -> Optional[List[int]]:
+    """
+    Same result as two_sum_hash_map(list(numbers), target), without the list.
+
+    Args:
+        numbers: Any iterable/iterator of integers
+        target: Target sum to find
+        **options: value_range, max_entries, spill_path (see StreamingTwoSum)
+
+    Example:
+        two_sum_stream(iter([2, 7, 11, 15]), 9) -> [0, 1]
+    """
+    with StreamingTwoSum(target, **options) as detector:
+        return detector.feed(numbers)
+
+
+def two_sum_chunks(chunks: Iterable[Iterable[int]], target: int, **options) -> Optional[List[int]]:
+    """
+    Streaming two sum over chunked buffers (lists, array.array blocks, ...).
+
+    Indices are global positions in the concatenated stream.
+
+    Example:
+        two_sum_chunks([array('q', [2, 11]), array('q', [7, 15])], 9) -> [0, 2]
+    """
+    with StreamingTwoSum(target, **options) as detector:
+        for chunk in chunks:
+            result = detector.feed(chunk)
+            if result is not None:
+                return result
+    return None
+
+
+if __name__ == "__main__":
+    import random
+    from array import array
+
+    print("=" * 60)
+    print("STREAMING TWO SUM - TEST YOUR IMPLEMENTATION")
+    print("=" * 60)
+
+    chunks = [array("q", [2, 11]), array("q", [7, 15])]
+    print(f"\n   Chunks [2, 11] + [7, 15], target 9: {two_sum_chunks(chunks, 9)} (expected: [0, 2])")
+
+    stream = (random.randrange(10**9) for _ in range(200_000))
+    with StreamingTwoSum(target=-1, max_entries=50_000) as detector:
+        print(f"   200k values, no pair, 50k in memory: {detector.feed(stream)}")
+        print(f"   Entries spilled to disk: {detector.spilled:,}")
+
+    stream = (random.randrange(10**9) for _ in range(200_000))
+    detector = StreamingTwoSum(target=10**8, value_range=(0, 10**9))
+    detector.feed(stream)
+    print(f"   With value_range filter, entries kept: {len(detector._seen):,} of 200,000")
+
+    print("\n" + "=" * 60)
@@ -0,0 +1,139 @@
+"""
+Two Sum - Sliding Window Over an Event Stream
+
+Problem: report every pair of events among the last W arrivals whose values
+sum to target, as each event arrives, for a stream that never ends.
+
+Approach: two_sum_hash_map's `seen` map, but scoped to the window.
+- seen maps value -> deque of the indices of that value inside the window
+  (oldest first), so len(deque) is the per-value count.
+- A ring of the last W values tells us which value leaves the window when a
+  new one arrives. The leaving index is always the OLDEST occurrence of its
+  value, so eviction is a popleft - O(1).
+- On arrival of num at index j, every index in seen[target - num] forms a
+  pair (i, j) with j - i < W.
+
+Time Complexity: O(1) per event plus O(1) per emitted pair
+Space Complexity: O(W) - independent of the stream length
+
+Run the demo with: python -m arrays.two_sum_window
+"""
+
+from collections import deque
+from typing import Deque, Dict, Iterable, Iterator, List, Tuple
+
+
+class SlidingWindowTwoSum:
+    """
+    Windowed two-sum detector.
+
+    Example:
+        detector = SlidingWindowTwoSum(target=9, window=3)
+        detector.push(2)   # []
+        detector.push(7)   # [(0, 1)]
+        detector.push(4)   # []
+        detector.push(5)   # [(2, 3)] - index 0 (the 2) has left the window
+    """
+
+    def __init__(self, target: int, window: int):
+        """
+        Args:
+            target: Target sum to find
+            window: Number of most recent arrivals a pair must fit in
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.target = target
+        self.window = window
+        self.count = 0  # index of the next arrival
+        self._ring: List[int] = [0] * window
+        self._seen: Dict[int, Deque[int]] = {}
+
+    def __len__(self) -> int:
+        """Number of events currently inside the window."""
+        return min(self.count, self.window)
+
+    def count_of(self, value: int) -> int:
+        """How many times value occurs inside the window."""
+        indices = self._seen.get(value)
+        return len(indices) if indices else 0
+
+    def push(self, num: int) -> List[Tuple[int, int]]:
+        """
+        Add one event and return the pairs it completes.
+
+        Returns:
+            List of (i, j) global index pairs, i ascending, j the new index
+        """
+        j = self.count
+        seen = self._seen
+        slot = j % self.window
+        if j >= self.window:
+            # The event at j - window leaves: it is the oldest of its value
+            old = self._ring[slot]
+            indices = seen[old]
+            indices.popleft()
+            if not indices:
+                del seen[old]
+        self._ring[slot] = num
+        self.count = j + 1
+
+        # After eviction every index in seen is >= j - window + 1, so all
+        # stored partners are inside the window
+        partners = seen.get(self.target - num)
+        pairs = [(i, j) for i in partners] if partners else []
+
+        if num in seen:
+            seen[num].append(j)
+        else:
+            seen[num] = deque((j,))
+        return pairs
+
+    def feed(self, numbers: Iterable[int]) -> Iterator[Tuple[int, int]]:
+        """Push every number, yielding pairs as soon as they complete."""
+        for num in numbers:
+            yield from self.push(num)
+
+
+def sliding_window_pairs(
+    numbers: Iterable[int], target: int, window: int
+) -> Iterator[Tuple[int, int]]:
+    """
+    All (i, j) with i < j, j - i < window and nums[i] + nums[j] == target.
+
+    Pairs are yielded in order of j, so this works on unbounded streams.
+
+    Example:
+        list(sliding_window_pairs([2, 7, 4, 5], 9, 3)) -> [(0, 1), (2, 3)]
+    """
+    return SlidingWindowTwoSum(target, window).feed(numbers)
+
+
+if __name__ == "__main__":
+    import random
+    import time
+    import tracemalloc
+
+    print("=" * 60)
+    print("SLIDING WINDOW TWO SUM - TEST YOUR IMPLEMENTATION")
+    print("=" * 60)
+
+    print(f"\n   [2, 7, 4, 5], target 9, window 3: "
+          f"{list(sliding_window_pairs([2, 7, 4, 5], 9, 3))} (expected: [(0, 1), (2, 3)])")
+
+    window = 10_000
+    for n in (100_000, 1_000_000):
+        nums = [random.randrange(10**6) for _ in range(n)]
+        start = time.perf_counter()
+        found = sum(1 for _ in sliding_window_pairs(nums, 10**6, window))
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        for _ in sliding_window_pairs(nums, 10**6, window):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"   n={n:,}, W={window:,}: {found:,} pairs in {elapsed:.2f}s, "
+              f"peak memory {peak / 1e6:.1f} MB")
+
+    print("\n" + "=" * 60)
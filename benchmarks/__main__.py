@@ -0,0 +1,80 @@
+"""
+Run the benchmark suite.
+
+    python -m benchmarks                          # full sweep, 10^2 .. 10^7
+    python -m benchmarks --quick                  # 10^2 .. 10^4, seconds
+    python -m benchmarks searching two_sum_hash_map --max-size 1000000
+    python -m benchmarks --output after.json --baseline before.json --tolerance 0.2
+
+Exits 1 when a case grows faster than its complexity or, with --baseline,
+when a timing regressed by more than --tolerance.
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from benchmarks.cases import CASES, select
+from benchmarks.suite import (
+    DEFAULT_SLACK,
+    DEFAULT_TOLERANCE,
+    QUICK_SIZES,
+    SIZES,
+    check_regressions,
+    check_scaling,
+    format_tables,
+    load_report,
+    run_suite,
+    save_plot,
+    save_report,
+)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("cases", nargs="*",
+                        help=f"case names or groups (default: all {len(CASES)} cases)")
+    parser.add_argument("--quick", action="store_true", help="sizes 10^2 .. 10^4 only")
+    parser.add_argument("--max-size", type=int, help="skip sizes above this")
+    parser.add_argument("--repeat", type=int, default=5, help="timing samples per size")
+    parser.add_argument("--no-memory", action="store_true", help="skip peak memory runs")
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument("--plot", help="write a log-log PNG here (needs matplotlib)")
+    parser.add_argument("--baseline", help="JSON report to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed relative median slowdown vs baseline")
+    parser.add_argument("--slack", type=float, default=DEFAULT_SLACK,
+                        help="allowed excess of the measured scaling exponent")
+    args = parser.parse_args(argv)
+
+    sizes = QUICK_SIZES if args.quick else SIZES
+    if args.max_size is not None:
+        sizes = [n for n in sizes if n <= args.max_size]
+
+    print("=" * 60)
+    print("BENCHMARK SUITE")
+    print("=" * 60)
+    report = run_suite(select(args.cases), sizes, repeat=args.repeat,
+                       memory=not args.no_memory, progress=True)
+    print(format_tables(report))
+
+    if args.output:
+        save_report(report, args.output)
+        print(f"\nreport written to {args.output}")
+    if args.plot:
+        if save_plot(report, args.plot):
+            print(f"plot written to {args.plot}")
+        else:
+            print("matplotlib is not installed: no plot", file=sys.stderr)
+
+    failures = check_scaling(report, args.slack)
+    if args.baseline:
+        failures += check_regressions(report, load_report(args.baseline), args.tolerance)
+    print("\n" + ("\n".join(f"FAIL {f}" for f in failures) if failures else "all checks passed"))
+    print("=" * 60)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
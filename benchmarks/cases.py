@@ -0,0 +1,119 @@
+"""
+Benchmark Cases - What the Suite Measures
+=========================================
+
+A Case is one function plus a way to build its input for a size n:
+
+    Case(name, group, func, make_args, complexity, max_size)
+
+- make_args(n) builds the arguments OUTSIDE the timed region, so only the
+  function itself is measured.
+- complexity is the expected growth ("1", "log n", "n", "n log n", "n^2").
+  The report fits the measured growth and flags cases that grow faster.
+- max_size caps the sweep for cases that would take minutes at 10^7
+  (brute force two sum, big-int Fibonacci).
+
+Inputs are the worst case where that is cheap to build: searches look for
+an absent value, two sum gets even numbers and an odd target (no pair, so
+every element is read).
+"""
+
+import random
+from collections import deque
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+from arrays.two_sum import two_sum_brute_force, two_sum_hash_map, two_sum_two_pointer
+from arrays.two_sum_numpy import np, two_sum_numpy
+from python_concepts.comprehensions import (
+    even_squares,
+    flatten,
+    group_by_length,
+    matrix_transpose,
+    square_dict,
+    squares,
+)
+from python_concepts.fibonacci_generator import fibonacci_generator
+from searching.binary_search import (
+    binary_search_iterative,
+    binary_search_recursive,
+    find_first_occurrence,
+    find_insertion_position,
+)
+
+# Expected exponent of n for each complexity class (log factors ignored)
+EXPONENTS = {"1": 0.0, "log n": 0.0, "n": 1.0, "n log n": 1.0, "n^2": 2.0}
+
+
+class Case(NamedTuple):
+    name: str
+    group: str
+    func: Callable
+    make_args: Callable[[int], Tuple[Any, ...]]
+    complexity: str
+    max_size: Optional[int] = None
+
+
+def _no_pair(n: int) -> Tuple[List[int], int]:
+    # Even values, odd target in the middle of their sums: nothing matches
+    rng = random.Random(n)
+    return [2 * rng.randrange(10**9) for _ in range(n)], 2 * 10**9 + 1
+
+
+def _sorted_no_pair(n: int) -> Tuple[List[int], int]:
+    nums, target = _no_pair(n)
+    nums.sort()
+    return nums, target
+
+
+def _sorted_range(n: int) -> Tuple[List[int], int]:
+    # An absent target: every search runs the full log2(n) steps
+    return list(range(n)), n
+
+
+def _words(n: int) -> Tuple[List[str]]:
+    rng = random.Random(n)
+    return (["x" * rng.randrange(1, 12) for _ in range(n)],)
+
+
+def _square_matrix(n: int) -> Tuple[List[List[int]]]:
+    side = max(1, int(n ** 0.5))
+    return ([list(range(side)) for _ in range(side)],)
+
+
+def _consume_fibonacci(n: int) -> None:
+    deque(fibonacci_generator(n), maxlen=0)
+
+
+CASES: List[Case] = [
+    Case("binary_search_iterative", "searching", binary_search_iterative, _sorted_range, "log n"),
+    Case("binary_search_recursive", "searching", binary_search_recursive, _sorted_range, "log n"),
+    Case("find_first_occurrence", "searching", find_first_occurrence, _sorted_range, "log n"),
+    Case("find_insertion_position", "searching", find_insertion_position, _sorted_range, "log n"),
+    Case("two_sum_brute_force", "arrays", two_sum_brute_force, _no_pair, "n^2", max_size=10**3),
+    Case("two_sum_hash_map", "arrays", two_sum_hash_map, _no_pair, "n"),
+    Case("two_sum_two_pointer", "arrays", two_sum_two_pointer, _sorted_no_pair, "n"),
+    # Fibonacci numbers grow to O(n) digits, so each addition is O(n) too
+    Case("fibonacci_generator", "generators", _consume_fibonacci, lambda n: (n,), "n^2",
+         max_size=10**5),
+    Case("squares", "comprehensions", squares, lambda n: (n,), "n"),
+    Case("even_squares", "comprehensions", even_squares, lambda n: (n,), "n"),
+    Case("square_dict", "comprehensions", square_dict, lambda n: (n,), "n", max_size=10**6),
+    Case("flatten", "comprehensions", flatten, _square_matrix, "n", max_size=10**6),
+    Case("matrix_transpose", "comprehensions", matrix_transpose, _square_matrix, "n",
+         max_size=10**6),
+    Case("group_by_length", "comprehensions", group_by_length, _words, "n", max_size=10**6),
+]
+
+if np is not None:  # NumPy is optional, like in two_sum_numpy itself
+    CASES.append(Case("two_sum_numpy", "arrays", two_sum_numpy, _no_pair, "n log n"))
+
+
+def select(names: Optional[List[str]] = None) -> List[Case]:
+    """Cases whose name or group is in names (all cases if names is empty)."""
+    if not names:
+        return list(CASES)
+    chosen = [c for c in CASES if c.name in names or c.group in names]
+    unknown = set(names) - {c.name for c in CASES} - {c.group for c in CASES}
+    if unknown:
+        raise ValueError(f"unknown benchmark case or group: {', '.join(sorted(unknown))}")
+    return chosen
@@ -0,0 +1,211 @@
+"""
+Benchmark Suite - Sweep, Report, Gate
+=====================================
+
+For every case and every size n in the sweep:
+1. Build the input (not timed).
+2. Time the call with python_concepts.benchmark (warmup, calibrated loops,
+   GC off) and keep median / p95.
+3. Run the call once more under tracemalloc for its PEAK memory - the
+   bytes the function allocates on top of its input. This is a separate
+   run because tracemalloc slows every allocation down.
+
+Scaling: the slope of log(time) against log(n) is the measured exponent
+(1.0 = linear, 2.0 = quadratic). Fixed per-call overhead flattens small
+sizes, so the exponent is only compared from ABOVE: a case fails the
+scaling check when it grows faster than its declared complexity allows.
+
+Gating: check_scaling() and check_regressions() return a list of failure
+messages (empty = pass), for tests or CI. Timings are compared against a
+baseline report with a relative tolerance on the median.
+
+Plots are optional: with matplotlib installed, save_plot() writes a
+log-log chart per group.
+"""
+
+import json
+import math
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from benchmarks.cases import EXPONENTS, Case
+from python_concepts.benchmark import benchmark, format_seconds
+
+try:
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+except ImportError:  # plots are optional, tables are always printed
+    plt = None
+
+SIZES = [10**k for k in range(2, 8)]
+QUICK_SIZES = [10**2, 10**3, 10**4]
+# Measured exponent may exceed the declared one by this much (noise, log n)
+DEFAULT_SLACK = 0.35
+MIN_SCALING_SIZES = 3
+DEFAULT_TOLERANCE = 0.25
+
+
+def peak_memory(case: Case, args: tuple) -> int:
+    """Peak bytes allocated while running case.func(*args) once."""
+    tracemalloc.start()
+    try:
+        case.func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_case(case: Case, sizes: Iterable[int], repeat: int = 5,
+             min_time: float = 0.02, memory: bool = True) -> List[Dict[str, Any]]:
+    """One row per size: n, median, p95, stddev, loops, peak_bytes."""
+    rows = []
+    for n in sizes:
+        if case.max_size is not None and n > case.max_size:
+            continue
+        args = case.make_args(n)
+        result = benchmark(case.func, *args, name=case.name, repeat=repeat,
+                           min_time=min_time, warmup=1)
+        rows.append({
+            "case": case.name,
+            "group": case.group,
+            "complexity": case.complexity,
+            "n": n,
+            "median": result.median,
+            "p95": result.p95,
+            "stddev": result.stddev,
+            "loops": result.loops,
+            "peak_bytes": peak_memory(case, args) if memory else None,
+        })
+        del args
+    return rows
+
+
+def scaling_exponent(rows: Sequence[Dict[str, Any]]) -> Optional[float]:
+    """
+    Least-squares slope of log(median) vs log(n).
+
+    None with fewer than MIN_SCALING_SIZES sizes: a slope through two noisy
+    points says little.
+    """
+    points = [(math.log(r["n"]), math.log(r["median"])) for r in rows if r["median"] > 0]
+    if len(points) < MIN_SCALING_SIZES:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return sxy / sxx
+
+
+def run_suite(cases: Sequence[Case], sizes: Sequence[int] = SIZES, repeat: int = 5,
+              min_time: float = 0.02, memory: bool = True,
+              progress: bool = False) -> Dict[str, Any]:
+    """Run every case over sizes and return the report dict."""
+    rows: List[Dict[str, Any]] = []
+    scaling: Dict[str, Any] = {}
+    for case in cases:
+        start = time.perf_counter()
+        case_rows = run_case(case, sizes, repeat=repeat, min_time=min_time, memory=memory)
+        rows.extend(case_rows)
+        scaling[case.name] = {
+            "complexity": case.complexity,
+            "expected": EXPONENTS[case.complexity],
+            "measured": scaling_exponent(case_rows),
+        }
+        if progress:
+            print(f"   {case.name:<26} {time.perf_counter() - start:6.1f}s", file=sys.stderr)
+    return {
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "sizes": list(sizes),
+        "results": rows,
+        "scaling": scaling,
+    }
+
+
+def save_report(report: Dict[str, Any], path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def check_scaling(report: Dict[str, Any], slack: float = DEFAULT_SLACK) -> List[str]:
+    """Cases whose measured exponent exceeds the declared one by more than slack."""
+    failures = []
+    for name, s in report["scaling"].items():
+        if s["measured"] is not None and s["measured"] > s["expected"] + slack:
+            failures.append(f"{name}: grows like n^{s['measured']:.2f}, "
+                            f"expected O({s['complexity']})")
+    return failures
+
+
+def check_regressions(report: Dict[str, Any], baseline: Dict[str, Any],
+                      tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+    """(case, n) pairs whose median is more than tolerance slower than baseline."""
+    before = {(r["case"], r["n"]): r["median"] for r in baseline["results"]}
+    failures = []
+    for r in report["results"]:
+        old = before.get((r["case"], r["n"]))
+        if old and r["median"] > old * (1 + tolerance):
+            failures.append(f"{r['case']} n={r['n']:,}: {format_seconds(old)} -> "
+                            f"{format_seconds(r['median'])} ({r['median'] / old - 1:+.0%})")
+    return failures
+
+
+def _format_bytes(size: Optional[int]) -> str:
+    if size is None:
+        return "-"
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def format_tables(report: Dict[str, Any]) -> str:
+    """One table per case: time and peak memory by n, then the exponent."""
+    by_case: Dict[str, List[Dict[str, Any]]] = {}
+    for r in report["results"]:
+        by_case.setdefault(r["case"], []).append(r)
+    lines = []
+    for name, rows in by_case.items():
+        s = report["scaling"][name]
+        measured = "-" if s["measured"] is None else f"n^{s['measured']:.2f}"
+        lines.append(f"\n{name}  [{rows[0]['group']}, expected O({s['complexity']}), "
+                     f"measured {measured}]")
+        lines.append(f"   {'n':>12} {'median':>10} {'p95':>10} {'peak mem':>10}")
+        for r in rows:
+            lines.append(f"   {r['n']:>12,} {format_seconds(r['median']):>10} "
+                         f"{format_seconds(r['p95']):>10} {_format_bytes(r['peak_bytes']):>10}")
+    return "\n".join(lines)
+
+
+def save_plot(report: Dict[str, Any], path: str) -> bool:
+    """Log-log time vs n, one panel per group. False if matplotlib is missing."""
+    if plt is None:
+        return False
+    groups: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+    for r in report["results"]:
+        groups.setdefault(r["group"], {}).setdefault(r["case"], []).append(r)
+    fig, axes = plt.subplots(1, len(groups), figsize=(5 * len(groups), 4), squeeze=False)
+    for ax, (group, cases) in zip(axes[0], groups.items()):
+        for name, rows in cases.items():
+            ax.loglog([r["n"] for r in rows], [r["median"] for r in rows], marker="o", label=name)
+        ax.set_title(group)
+        ax.set_xlabel("n")
+        ax.set_ylabel("seconds per call")
+        ax.legend(fontsize="small")
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+    return True
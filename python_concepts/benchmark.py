@@ -0,0 +1,380 @@
+"""
+Statistical Benchmark Runner
+============================
+Learn: How to get timing numbers you can trust (and compare).
+
+timing_decorator prints ONE perf_counter delta. One sample says little:
+the first call pays for cold caches and lazy imports, a fast function is
+shorter than the timer's resolution, and a garbage collection pause can
+land in any sample. This runner fixes each of those:
+
+1. Warmup: call the function a few times and throw the timings away.
+2. Calibration: time `loops` calls per sample, doubling loops until one
+   sample takes at least min_time (like timeit's autorange). The per-call
+   time is sample / loops.
+3. GC control: collect before measuring and keep the collector off while
+   sampling (optional), so pauses do not land in random samples.
+4. Statistics over `repeat` samples: mean, median, p95, p99, stddev, and
+   the number of outliers (Tukey's fences: below Q1 - 1.5 IQR or above
+   Q3 + 1.5 IQR). Many outliers means a noisy machine - rerun.
+5. Results save to JSON. compare() matches two result files by name and
+   flags a REGRESSION when the median got slower by more than threshold.
+   Names found in only one file are listed; --fail-on-missing fails on them.
+
+Compare medians, not means: one slow sample drags the mean, not the median.
+
+Usage:
+    results = [benchmark(sorted, data, name="sorted")]
+    save_results(results, "after.json")
+
+    python -m python_concepts.benchmark compare before.json after.json --threshold 0.1
+"""
+
+import argparse
+import functools
+import gc
+import json
+import math
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+DEFAULT_REPEAT = 20
+DEFAULT_MIN_TIME = 0.01
+DEFAULT_WARMUP = 3
+DEFAULT_THRESHOLD = 0.05
+
+
+def percentile(sorted_values: Sequence[float], p: float) -> float:
+    """p-th percentile (0-100) of sorted values, linear interpolation."""
+    if not sorted_values:
+        raise ValueError("percentile of empty data")
+    pos = (len(sorted_values) - 1) * p / 100
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+class BenchmarkResult:
+    """
+    Per-call timings of one benchmarked function (seconds).
+
+    Attributes:
+        name: Benchmark name
+        loops: Calls per sample (from calibration)
+        samples: Per-call seconds of each sample, in measurement order
+    """
+
+    __slots__ = ("name", "loops", "samples")
+
+    def __init__(self, name: str, loops: int, samples: List[float]):
+        if not samples:
+            raise ValueError("a result needs at least one sample")
+        self.name = name
+        self.loops = loops
+        self.samples = samples
+
+    @property
+    def mean(self) -> float:
+        return sum(self.samples) / len(self.samples)
+
+    @property
+    def median(self) -> float:
+        return percentile(sorted(self.samples), 50)
+
+    @property
+    def p95(self) -> float:
+        return percentile(sorted(self.samples), 95)
+
+    @property
+    def p99(self) -> float:
+        return percentile(sorted(self.samples), 99)
+
+    @property
+    def stddev(self) -> float:
+        """Sample standard deviation (0 for a single sample)."""
+        n = len(self.samples)
+        if n < 2:
+            return 0.0
+        mean = self.mean
+        return math.sqrt(sum((x - mean) ** 2 for x in self.samples) / (n - 1))
+
+    @property
+    def outliers(self) -> int:
+        """Samples outside Tukey's fences (1.5 IQR beyond the quartiles)."""
+        values = sorted(self.samples)
+        q1, q3 = percentile(values, 25), percentile(values, 75)
+        fence = 1.5 * (q3 - q1)
+        return sum(1 for x in values if x < q1 - fence or x > q3 + fence)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "loops": self.loops,
+            "mean": self.mean,
+            "median": self.median,
+            "p95": self.p95,
+            "p99": self.p99,
+            "stddev": self.stddev,
+            "min": min(self.samples),
+            "max": max(self.samples),
+            "outliers": self.outliers,
+            "samples": self.samples,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BenchmarkResult":
+        return cls(data["name"], data["loops"], list(data["samples"]))
+
+    def __repr__(self) -> str:
+        return (f"BenchmarkResult({self.name!r}, median={format_seconds(self.median)}, "
+                f"samples={len(self.samples)}, loops={self.loops})")
+
+
+def format_seconds(seconds: float) -> str:
+    """Human-readable duration: 1.23 s / ms / us / ns."""
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def _time_loops(func: Callable, args: tuple, kwargs: Dict[str, Any], loops: int) -> float:
+    timer = time.perf_counter
+    start = timer()
+    for _ in range(loops):
+        func(*args, **kwargs)
+    return timer() - start
+
+
+def benchmark(
+    func: Callable,
+    *args: Any,
+    name: Optional[str] = None,
+    repeat: int = DEFAULT_REPEAT,
+    min_time: float = DEFAULT_MIN_TIME,
+    warmup: int = DEFAULT_WARMUP,
+    loops: Optional[int] = None,
+    disable_gc: bool = True,
+    **kwargs: Any,
+) -> BenchmarkResult:
+    """
+    Time func(*args, **kwargs) with warmup, calibration and GC control.
+
+    HINT FOR IMPLEMENTATION:
+    1. Warmup: call func `warmup` times, ignore the timings
+    2. Calibrate: loops = 1, 2, 4, ... until one sample takes >= min_time
+    3. gc.collect(), then gc.disable() while taking `repeat` samples
+    4. Restore the collector even if func raises
+
+    Args:
+        func: Function to time
+        *args, **kwargs: Arguments for every call
+        name: Result name (default: func's name)
+        repeat: Number of samples
+        min_time: Minimum seconds per sample (sets loops)
+        warmup: Untimed calls before measuring
+        loops: Fixed calls per sample (skips calibration)
+        disable_gc: Keep the garbage collector off while sampling
+
+    Returns:
+        BenchmarkResult with per-call seconds for each sample
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be >= 1")
+    for _ in range(warmup):
+        func(*args, **kwargs)
+    if loops is None:
+        loops = 1
+        while _time_loops(func, args, kwargs, loops) < min_time:
+            loops *= 2
+
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    if disable_gc:
+        gc.disable()
+    try:
+        samples = [_time_loops(func, args, kwargs, loops) / loops for _ in range(repeat)]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return BenchmarkResult(name or getattr(func, "__name__", repr(func)), loops, samples)
+
+
+def benchmarked(**options: Any) -> Callable:
+    """
+    Decorator form, in the spirit of timing_decorator: benchmarks the call
+    instead of timing it once, prints a summary line and returns the result.
+
+    Example:
+        @benchmarked(repeat=10)
+        def build(): ...
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            result = benchmark(func, *args, **options, **kwargs)
+            print(format_table([result]))
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def format_table(results: Sequence[BenchmarkResult]) -> str:
+    """One line per result: median, mean, p95, p99, stddev, outliers."""
+    width = max([len(r.name) for r in results] + [4])
+    lines = [f"{'name':<{width}}  {'median':>10} {'mean':>10} {'p95':>10} {'p99':>10} "
+             f"{'stddev':>10}  outliers"]
+    for r in results:
+        lines.append(
+            f"{r.name:<{width}}  {format_seconds(r.median):>10} {format_seconds(r.mean):>10} "
+            f"{format_seconds(r.p95):>10} {format_seconds(r.p99):>10} "
+            f"{format_seconds(r.stddev):>10}  {r.outliers}/{len(r.samples)}"
+        )
+    return "\n".join(lines)
+
+
+def save_results(results: Sequence[BenchmarkResult], path: str) -> None:
+    """Write results (with raw samples) as JSON."""
+    data = {
+        "python": sys.version.split()[0],
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": [r.to_dict() for r in results],
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def load_results(path: str) -> List[BenchmarkResult]:
+    with open(path) as f:
+        return [BenchmarkResult.from_dict(r) for r in json.load(f)["results"]]
+
+
+class Comparison:
+    """
+    Median of one benchmark before and after.
+
+    baseline or current is None when the benchmark is only in one file
+    (added, renamed or deleted).
+    """
+
+    __slots__ = ("name", "baseline", "current", "threshold")
+
+    def __init__(self, name: str, baseline: Optional[float], current: Optional[float],
+                 threshold: float):
+        self.name = name
+        self.baseline = baseline
+        self.current = current
+        self.threshold = threshold
+
+    @property
+    def unmatched(self) -> bool:
+        """True if the benchmark is missing from one of the two runs."""
+        return self.baseline is None or self.current is None
+
+    @property
+    def change(self) -> Optional[float]:
+        """Relative change of the median: +0.10 = 10% slower (None if unmatched)."""
+        if self.unmatched:
+            return None
+        return self.current / self.baseline - 1 if self.baseline else 0.0
+
+    @property
+    def regression(self) -> bool:
+        return not self.unmatched and self.change > self.threshold
+
+    @property
+    def improvement(self) -> bool:
+        return not self.unmatched and self.change < -self.threshold
+
+    @property
+    def verdict(self) -> str:
+        if self.baseline is None:
+            return "only in current"
+        if self.current is None:
+            return "MISSING from current"
+        if self.regression:
+            return "REGRESSION"
+        return "faster" if self.improvement else "same"
+
+
+def compare(
+    baseline: Sequence[BenchmarkResult],
+    current: Sequence[BenchmarkResult],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Comparison]:
+    """
+    Pair results by name and compare medians.
+
+    Benchmarks present in only one of the two runs are returned too, as
+    unmatched comparisons, so a renamed or deleted benchmark is visible.
+    """
+    before = {r.name: r.median for r in baseline}
+    after = {r.name: r.median for r in current}
+    names = list(after) + [name for name in before if name not in after]
+    return [Comparison(name, before.get(name), after.get(name), threshold) for name in names]
+
+
+def format_comparison(comparisons: Sequence[Comparison]) -> str:
+    width = max([len(c.name) for c in comparisons] + [4])
+    lines = [f"{'name':<{width}}  {'baseline':>10} {'current':>10} {'change':>8}"]
+    for c in comparisons:
+        baseline = "-" if c.baseline is None else format_seconds(c.baseline)
+        current = "-" if c.current is None else format_seconds(c.current)
+        change = "-" if c.change is None else f"{c.change:+.1%}"
+        lines.append(f"{c.name:<{width}}  {baseline:>10} {current:>10} {change:>8}  {c.verdict}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    CLI: `compare BASELINE CURRENT [--threshold T] [--fail-on-missing]`
+    exits 1 on a regression (or, with --fail-on-missing, an unmatched name).
+    """
+    parser = argparse.ArgumentParser(prog="python -m python_concepts.benchmark")
+    sub = parser.add_subparsers(dest="command", required=True)
+    cmp_parser = sub.add_parser("compare", help="compare two result files")
+    cmp_parser.add_argument("baseline")
+    cmp_parser.add_argument("current")
+    cmp_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                            help="relative median slowdown that counts as a regression")
+    cmp_parser.add_argument("--fail-on-missing", action="store_true",
+                            help="also fail when a benchmark is in only one of the files")
+    sub.add_parser("demo", help="benchmark a few functions")
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        comparisons = compare(load_results(args.baseline), load_results(args.current),
+                              args.threshold)
+        print(format_comparison(comparisons))
+        failed = any(c.regression for c in comparisons)
+        if args.fail_on_missing:
+            failed = failed or any(c.unmatched for c in comparisons)
+        return 1 if failed else 0
+
+    import random
+
+    from arrays.two_sum import two_sum_hash_map
+    from searching.binary_search import binary_search_iterative
+
+    print("=" * 60)
+    print("STATISTICAL BENCHMARK RUNNER")
+    print("=" * 60)
+    data = [random.randrange(10**6) for _ in range(10_000)]
+    ordered = sorted(data)
+    results = [
+        benchmark(binary_search_iterative, ordered, data[0], name="binary_search_iterative"),
+        benchmark(two_sum_hash_map, data, -1, name="two_sum_hash_map (no pair)"),
+        benchmark(sorted, data, name="sorted"),
+    ]
+    print()
+    print(format_table(results))
+    print("\n" + "=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:] or ["demo"]))
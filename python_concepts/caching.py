@@ -0,0 +1,354 @@
+"""
+Bounded Memoization - LRU, LFU and TTL Caches
+=============================================
+Learn: How to cache results in a long-running process without leaking memory.
+
+memoize in timing_decorator.py is the textbook version: an unbounded dict
+keyed on positional args. In a worker that runs for days it only grows,
+and f(x=1) raises TypeError because the wrapper takes no keyword args.
+
+@cached fixes both:
+- maxsize bounds the number of entries. When full, one entry is evicted:
+  - "lru": the Least Recently Used one. An OrderedDict keeps entries in
+    use order; a hit is move_to_end, an eviction is popitem(last=False).
+  - "lfu": the Least Frequently Used one (ties: least recently used).
+    Entries sit in one OrderedDict per use count; a hit moves the key to
+    the next count's bucket and eviction pops from the lowest count.
+  Both are O(1) per call.
+- ttl (seconds) makes entries expire; an expired entry counts as a miss.
+  Expiry is checked when an entry is looked up, so there is no background
+  thread.
+- Keys include keyword arguments, sorted by name so f(a=1, b=2) and
+  f(b=2, a=1) share an entry. As with functools.lru_cache, f(1) and f(x=1)
+  are different keys.
+- cache_info() returns hit/miss/eviction/expiration counters and
+  cache_clear() empties the cache.
+
+Example:
+    @cached(maxsize=1024, policy="lfu", ttl=60)
+    def load_user(user_id, *, fields=None): ...
+
+    load_user.cache_info()
+"""
+
+import functools
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Dict, Hashable, Optional
+
+POLICIES = ("lru", "lfu")
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "expirations", "maxsize", "currsize"]
+)
+
+_MISSING = object()
+_KWARGS_MARK = object()
+_FAST_TYPES = {int, str}
+
+
+def make_key(args: tuple, kwargs: Dict[str, Any]) -> Hashable:
+    """
+    Hashable cache key for a call.
+
+    Keyword arguments are appended after a marker, sorted by name. A single
+    int or str argument is its own key (cheaper to hash and compare).
+    """
+    if kwargs:
+        return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+    if len(args) == 1 and type(args[0]) in _FAST_TYPES:
+        return args[0]
+    return args
+
+
+class _Entry:
+    __slots__ = ("value", "expires", "count")
+
+    def __init__(self, value: Any, expires: Optional[float]):
+        self.value = value
+        self.expires = expires
+        self.count = 1
+
+
+class LRUStore:
+    """Entries in use order: least recently used first."""
+
+    def __init__(self):
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def remove(self, key: Hashable) -> None:
+        del self._entries[key]
+
+    def evict(self) -> None:
+        self._entries.popitem(last=False)
+
+    def put(self, key: Hashable, entry: _Entry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class LFUStore:
+    """Entries bucketed by use count; each bucket in use order."""
+
+    def __init__(self):
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._buckets: Dict[int, "OrderedDict[Hashable, None]"] = {}
+        self._min_count = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def _unlink(self, key: Hashable, count: int) -> None:
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+
+    def _link(self, key: Hashable, count: int) -> None:
+        bucket = self._buckets.get(count)
+        if bucket is None:
+            bucket = self._buckets[count] = OrderedDict()
+        bucket[key] = None
+
+    def get(self, key: Hashable) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._unlink(key, entry.count)
+            if self._min_count == entry.count and entry.count not in self._buckets:
+                self._min_count += 1
+            entry.count += 1
+            self._link(key, entry.count)
+        return entry
+
+    def remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._unlink(key, entry.count)
+
+    def evict(self) -> None:
+        if self._min_count not in self._buckets:
+            # Only after remove(): re-sync the lowest count
+            self._min_count = min(self._buckets)
+        key, _ = self._buckets[self._min_count].popitem(last=False)
+        if not self._buckets[self._min_count]:
+            del self._buckets[self._min_count]
+        del self._entries[key]
+
+    def put(self, key: Hashable, entry: _Entry) -> None:
+        if key in self._entries:
+            self.remove(key)
+        self._entries[key] = entry
+        self._link(key, entry.count)
+        self._min_count = entry.count  # a new entry has the lowest count (1)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._buckets.clear()
+        self._min_count = 0
+
+
+class Cache:
+    """
+    Bounded cache shared by the @cached wrapper (usable on its own too).
+
+    Args:
+        maxsize: Maximum number of entries (None = unbounded, 0 = disabled)
+        policy: "lru" or "lfu"
+        ttl: Seconds an entry stays valid (None = forever)
+        timer: Clock used for ttl (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 128,
+        policy: str = "lru",
+        ttl: Optional[float] = None,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}, got {policy!r}")
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be >= 0 or None")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be > 0 or None")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.ttl = ttl
+        self._timer = timer
+        self._store = LRUStore() if policy == "lru" else LFUStore()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def _live_entry(self, key: Hashable) -> Optional[_Entry]:
+        """Entry for key, dropping it if expired. Caller holds the lock."""
+        entry = self._store.get(key)
+        if entry is not None and entry.expires is not None and entry.expires <= self._timer():
+            self._store.remove(key)
+            self.expirations += 1
+            entry = None
+        return entry
+
+    def get(self, key: Hashable, default: Any = _MISSING) -> Any:
+        """Cached value for key, or default (counts a hit or a miss)."""
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return entry.value
+
+    def peek(self, key: Hashable, default: Any = _MISSING) -> Any:
+        """Like get, but without touching the hit/miss counters."""
+        with self._lock:
+            entry = self._live_entry(key)
+            return default if entry is None else entry.value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value, evicting one entry first if the cache is full."""
+        if self.maxsize == 0:
+            return
+        expires = self._timer() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            store = self._store
+            if self.maxsize is not None and len(store) >= self.maxsize and key not in store:
+                store.evict()
+                self.evictions += 1
+            store.put(key, _Entry(value, expires))
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.evictions, self.expirations,
+                self.maxsize, len(self._store),
+            )
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._store.clear()
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+
+def cached(
+    func: Optional[Callable] = None,
+    *,
+    maxsize: Optional[int] = 128,
+    policy: str = "lru",
+    ttl: Optional[float] = None,
+    key: Callable[[tuple, Dict[str, Any]], Hashable] = make_key,
+    timer: Callable[[], float] = time.monotonic,
+) -> Callable:
+    """
+    Memoize with a bounded LRU/LFU cache and optional per-entry TTL.
+
+    Usable bare (@cached) or with options (@cached(maxsize=1000, ttl=30)).
+    The wrapper gets cache_info(), cache_clear() and a .cache attribute.
+
+    HINT FOR IMPLEMENTATION:
+    1. Build the key from args AND kwargs (see make_key)
+    2. Look it up; on a miss call func and store the result
+    3. The lock only guards the cache, never the call to func, so recursive
+       functions (fibonacci) and slow calls do not block other callers
+
+    Args:
+        maxsize: Maximum number of entries (None = unbounded, 0 = disabled)
+        policy: "lru" or "lfu"
+        ttl: Seconds an entry stays valid (None = forever)
+        key: Function (args, kwargs) -> hashable key
+        timer: Clock used for ttl
+    """
+    if func is None:
+        return lambda f: cached(f, maxsize=maxsize, policy=policy, ttl=ttl, key=key, timer=timer)
+
+    cache = Cache(maxsize=maxsize, policy=policy, ttl=ttl, timer=timer)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        k = key(args, kwargs)
+        value = cache.get(k)
+        if value is _MISSING:
+            value = func(*args, **kwargs)
+            cache.set(k, value)
+        return value
+
+    wrapper.cache = cache
+    wrapper.cache_info = cache.info
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
+# =============================================================================
+# DEMONSTRATION
+# =============================================================================
+
+
+if __name__ == "__main__":
+    import random
+    import tracemalloc
+
+    from python_concepts.timing_decorator import memoize
+
+    print("=" * 60)
+    print("BOUNDED MEMOIZATION - LRU / LFU / TTL")
+    print("=" * 60)
+
+    @cached(maxsize=None)
+    def fib(n: int) -> int:
+        return n if n <= 1 else fib(n - 1) + fib(n - 2)
+
+    print(f"\nfib(300) = {fib(300)}")
+    print(f"   {fib.cache_info()}")
+
+    def square(x: int) -> int:
+        return x * x
+
+    # Zipf-like keys: a few hot keys and a long tail of one-off keys,
+    # the workload that makes an unbounded cache grow forever
+    n = 200_000
+    keys = [int(random.paretovariate(1.0)) if random.random() < 0.8 else random.randrange(10**9)
+            for _ in range(n)]
+
+    print(f"\n{n:,} calls, 80% hot keys, 20% one-off keys")
+    for name, decorate in [
+        ("memoize", memoize),
+        ("cached lru 1024", cached(maxsize=1024)),
+        ("cached lfu 1024", cached(maxsize=1024, policy="lfu")),
+        ("cached lru ttl=1s", cached(maxsize=1024, ttl=1.0)),
+    ]:
+        fn = decorate(square)
+        tracemalloc.start()
+        start = time.perf_counter()
+        for k in keys:
+            fn(k)
+        elapsed = time.perf_counter() - start
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        line = f"   {name:<18} {elapsed:.2f}s  retained {current / 1e6:6.2f} MB"
+        if hasattr(fn, "cache_info"):
+            info = fn.cache_info()
+            line += f"  hit rate {info.hits / (info.hits + info.misses):.0%}"
+        print(line)
+
+    print("\n" + "=" * 60)
@@ -31,7 +31,6 @@ def even_squares(n: int) -> List[int]:
     Example:
         even_squares(10) -> [4, 16, 36, 64, 100]
     """
-    print(n)
     return [i**2 for i in range(1, n + 1) if i % 2 == 0]
 
 
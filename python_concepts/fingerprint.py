@@ -0,0 +1,218 @@
+"""
+Fingerprint Keys - Memoizing Functions That Take Lists and Arrays
+=================================================================
+Learn: How to cache calls whose arguments are not hashable, and when it pays.
+
+memoize keys on `args`, so two_sum_hash_map([2, 7, 11], 9) raises
+TypeError: unhashable type: 'list'. A fingerprint key replaces each
+unhashable argument with a short digest of its CONTENTS:
+
+- Buffers (array.array, bytearray, numpy arrays, memoryview): blake2b over
+  the raw bytes, plus format and shape. Hashing runs in C and releases the
+  GIL for large inputs.
+- Lists, dicts, sets and other unhashable values: blake2b over their pickle,
+  also built in C.
+- Hashable arguments (ints, strings, tuples of them) are used as-is.
+
+Equal contents give equal keys, so a copy of the list hits the cache.
+(Equal dicts or sets built in a different order may pickle differently:
+that is a miss, never a wrong answer.)
+
+Fingerprinting is O(n) in the argument size. That is cheap next to an O(n)
+Python loop (two_sum_hash_map) but far MORE than an O(log n) binary search.
+fingerprint_cost() measures both sides so you only cache where it pays.
+
+Identity shortcut (identity=True): when the SAME object is passed again
+with the same length, its previous digest is reused in O(1). Only use it
+for inputs you never mutate in place - a changed element with an unchanged
+length is not noticed. The recent objects are kept alive by the key, so
+their id() cannot be reused by a different object.
+
+Example:
+    @cached(maxsize=256, key=FingerprintKey(identity=True))
+    def two_sum(nums, target): ...
+"""
+
+import hashlib
+import pickle
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Dict, Hashable
+
+DIGEST_SIZE = 16
+DEFAULT_RECENT = 64
+
+# Same meaning as a plain tuple: (type name, content digest)
+Fingerprint = namedtuple("Fingerprint", ["kind", "digest"])
+
+_SCALARS = {int, float, str, bytes, bool, type(None)}
+_CONTAINERS = (list, dict, set)
+
+
+def fingerprint(obj: Any) -> Hashable:
+    """
+    Hashable stand-in for obj: obj itself if hashable, else a content digest.
+    """
+    if type(obj) in _SCALARS:
+        return obj
+    if not isinstance(obj, _CONTAINERS):
+        try:
+            view = memoryview(obj)
+        except TypeError:
+            pass
+        else:
+            h = hashlib.blake2b(digest_size=DIGEST_SIZE)
+            h.update(f"{view.format}{view.shape}".encode())
+            try:
+                h.update(view)
+            except BufferError:  # not C-contiguous, e.g. a numpy slice
+                h.update(view.tobytes())
+            return Fingerprint(type(obj).__qualname__, h.digest())
+        try:
+            hash(obj)
+            return obj
+        except TypeError:
+            pass
+    data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    return Fingerprint(type(obj).__qualname__, hashlib.blake2b(data, digest_size=DIGEST_SIZE).digest())
+
+
+class FingerprintKey:
+    """
+    key= function for @cached / memoize_threadsafe / persistent_cache.
+
+    Args:
+        identity: Reuse the digest of an object seen recently (same object,
+            same length) - only for inputs that are never mutated
+        recent: How many objects the identity shortcut remembers
+
+    Attributes:
+        calls: Fingerprints computed
+        shortcuts: Fingerprints answered by the identity shortcut
+        seconds: Total time spent building keys
+    """
+
+    def __init__(self, identity: bool = False, recent: int = DEFAULT_RECENT):
+        self.identity = identity
+        self.recent = recent
+        self._recent: "OrderedDict[int, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.calls = self.shortcuts = 0
+        self.seconds = 0.0
+
+    def _fingerprint(self, obj: Any) -> Hashable:
+        if type(obj) in _SCALARS:
+            return obj
+        if not self.identity or not hasattr(obj, "__len__"):
+            self.calls += 1
+            return fingerprint(obj)
+        with self._lock:
+            entry = self._recent.get(id(obj))
+            if entry is not None and entry[0] is obj and entry[1] == len(obj):
+                self._recent.move_to_end(id(obj))
+                self.shortcuts += 1
+                return entry[2]
+        self.calls += 1
+        digest = fingerprint(obj)
+        with self._lock:
+            # Holding obj keeps its id() from being reused while remembered
+            self._recent[id(obj)] = (obj, len(obj), digest)
+            self._recent.move_to_end(id(obj))
+            if len(self._recent) > self.recent:
+                self._recent.popitem(last=False)
+        return digest
+
+    def __call__(self, args: tuple, kwargs: Dict[str, Any]) -> Hashable:
+        start = time.perf_counter()
+        key = tuple(map(self._fingerprint, args))
+        if kwargs:
+            key += tuple((name, self._fingerprint(kwargs[name])) for name in sorted(kwargs))
+        self.seconds += time.perf_counter() - start
+        return key
+
+    def clear(self) -> None:
+        """Forget the remembered objects and reset the counters."""
+        with self._lock:
+            self._recent.clear()
+            self.calls = self.shortcuts = 0
+            self.seconds = 0.0
+
+
+fingerprint_key = FingerprintKey()
+
+
+class FingerprintCost(namedtuple("FingerprintCost", ["fingerprint", "compute"])):
+    """Seconds to build the key vs seconds to call the function."""
+
+    __slots__ = ()
+
+    @property
+    def ratio(self) -> float:
+        """Key cost as a fraction of the call (< 1: caching can pay off)."""
+        return self.fingerprint / self.compute if self.compute else float("inf")
+
+    @property
+    def pays(self) -> bool:
+        return self.fingerprint < self.compute
+
+
+def fingerprint_cost(func: Callable, *args: Any, repeat: int = 3, **kwargs: Any) -> FingerprintCost:
+    """
+    Best-of-repeat time of fingerprinting the arguments vs calling func.
+
+    A hit still pays the fingerprint, so caching only wins when the key is
+    much cheaper than the call. Measured without the identity shortcut.
+    """
+    key = FingerprintKey()
+    best_key = best_call = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        key(args, kwargs)
+        best_key = min(best_key, time.perf_counter() - start)
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best_call = min(best_call, time.perf_counter() - start)
+    return FingerprintCost(best_key, best_call)
+
+
+# =============================================================================
+# DEMONSTRATION
+# =============================================================================
+
+
+if __name__ == "__main__":
+    import random
+
+    from arrays.two_sum import two_sum_hash_map
+    from python_concepts.caching import cached
+    from searching.binary_search import binary_search_iterative
+
+    print("=" * 60)
+    print("FINGERPRINT KEYS - WHEN DOES CACHING A LIST CALL PAY?")
+    print("=" * 60)
+
+    n = 1_000_000
+    nums = [2 * random.randrange(10**9) for _ in range(n)]
+    sorted_nums = sorted(nums)
+
+    print(f"\nn={n:,}: fingerprint cost vs one call")
+    for name, func, args in [
+        ("two_sum_hash_map (no pair)", two_sum_hash_map, (nums, 1)),
+        ("binary_search_iterative", binary_search_iterative, (sorted_nums, nums[0])),
+    ]:
+        cost = fingerprint_cost(func, *args)
+        verdict = "cache it" if cost.pays else "do not cache"
+        print(f"   {name:<27} key {cost.fingerprint * 1e3:8.3f} ms   "
+              f"call {cost.compute * 1e3:8.3f} ms   -> {verdict}")
+
+    print("\nRepeated calls with the same list object:")
+    for name, key in [("content", FingerprintKey()), ("identity", FingerprintKey(identity=True))]:
+        search = cached(binary_search_iterative, key=key)
+        start = time.perf_counter()
+        for target in nums[:20]:
+            search(sorted_nums, target)
+        print(f"   {name:<9} key: 20 lookups in {time.perf_counter() - start:.3f}s "
+              f"({key.calls} fingerprints, {key.shortcuts} shortcuts)")
+
+    print("\n" + "=" * 60)
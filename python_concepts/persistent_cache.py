@@ -0,0 +1,358 @@
+"""
+Persistent Memoization - A SQLite Cache Shared Across Processes
+===============================================================
+Learn: How to keep memoized results across restarts and between processes.
+
+memoize and @cached live in one process's memory: a restarted worker starts
+cold, and four workers on one machine compute everything four times.
+@persistent_cache stores results in a SQLite file instead:
+
+- Rows are (function, version, key) -> value. key and value are bytes
+  produced by a pluggable serializer (anything with dumps/loads; pickle by
+  default, json for human-readable files).
+- version defaults to a hash of the function's source code. Editing the
+  function changes the version, so stale results are never returned; rows
+  of older versions are deleted the first time the new version is used.
+- max_entries / max_bytes bound each function's rows. When a limit is
+  exceeded, the least recently used rows are evicted. Recency is a sequence
+  number (the function's highest one + 1, taken inside the write
+  transaction), not a clock: no ties, and a wall-clock step cannot reorder
+  rows.
+- Concurrency: the file uses WAL journaling, and a hit is a plain SELECT,
+  so readers never take the write lock. Hits are remembered in memory and
+  their new order is written in one transaction every TOUCH_BATCH hits, on
+  the next set() and on close(). Writers queue on SQLite's lock (busy
+  timeout) instead of failing. Each thread and each process opens its own
+  connection - SQLite connections must not cross threads or a fork.
+
+A hit costs one indexed SELECT - microseconds - so this is for functions
+that take milliseconds or more. Eviction sees this process's pending hits
+(set() writes them first) but not another process's until it flushes.
+
+Example:
+    @persistent_cache("~/.cache/myapp.sqlite", max_entries=10_000)
+    def embed(text): ...
+"""
+
+import functools
+import hashlib
+import inspect
+import marshal
+import os
+import pickle
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from python_concepts.caching import _MISSING, CacheInfo
+
+DEFAULT_TIMEOUT = 30.0
+# Hits whose access order is written back in one transaction
+TOUCH_BATCH = 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    func TEXT NOT NULL,
+    version TEXT NOT NULL,
+    key BLOB NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed INTEGER NOT NULL,
+    PRIMARY KEY (func, version, key)
+);
+CREATE INDEX IF NOT EXISTS entries_lru ON entries (func, version, accessed);
+"""
+
+
+def code_version(func: Callable) -> str:
+    """
+    Hash of func's source (or bytecode if the source is unavailable).
+
+    Any edit to the function body gives a new version.
+    """
+    try:
+        code = inspect.getsource(func).encode()
+    except (OSError, TypeError):
+        code = marshal.dumps(func.__code__)
+    return hashlib.sha256(code).hexdigest()[:16]
+
+
+def persistent_key(args: tuple, kwargs: Dict[str, Any]) -> Hashable:
+    """Call key with keyword arguments sorted by name (serializable, unlike make_key)."""
+    return (args, tuple(sorted(kwargs.items()))) if kwargs else args
+
+
+class PersistentCache:
+    """
+    One function's rows in a SQLite cache file.
+
+    Args:
+        path: SQLite file (created if missing; shared by every function)
+        name: Function identifier, e.g. "module.qualname"
+        version: Rows written under another version are ignored and pruned
+        max_entries: Maximum rows for this function (None = unbounded)
+        max_bytes: Maximum total key + value bytes (None = unbounded)
+        serializer: Object with dumps(obj) and loads(data), e.g. pickle or json
+        timeout: Seconds to wait for another process's write lock
+    """
+
+    def __init__(
+        self,
+        path: str,
+        name: str,
+        version: str = "",
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        serializer: Any = pickle,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be >= 1 or None")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1 or None")
+        self.path = os.path.expanduser(os.fspath(path))
+        self.name = name
+        self.version = version
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.serializer = serializer
+        self.timeout = timeout
+        self._local = threading.local()
+        self._counter_lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+        # Keys hit since the last flush, least recent first
+        self._touched: Dict[bytes, None] = {}
+
+        db = self._connection()
+        with db:
+            db.execute(
+                "DELETE FROM entries WHERE func = ? AND version != ?", (name, version)
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection (reopened after a fork)."""
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            # IMMEDIATE: a write transaction takes the lock up front, so two
+            # processes never both read and then fail to upgrade
+            db = sqlite3.connect(self.path, timeout=self.timeout, isolation_level="IMMEDIATE")
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.executescript(_SCHEMA)
+            local.db, local.pid = db, os.getpid()
+        return local.db
+
+    def _encode(self, value: Any) -> bytes:
+        data = self.serializer.dumps(value)
+        return data.encode() if isinstance(data, str) else data
+
+    def get(self, key: Hashable, default: Any = _MISSING) -> Any:
+        """Stored value for key, or default (counts a hit or a miss)."""
+        blob = self._encode(key)
+        db = self._connection()
+        # Outside a transaction: a WAL read, no write lock
+        row = db.execute(
+            "SELECT value FROM entries WHERE func = ? AND version = ? AND key = ?",
+            (self.name, self.version, blob),
+        ).fetchone()
+        flush = False
+        with self._counter_lock:
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._touched.pop(blob, None)
+                self._touched[blob] = None
+                flush = len(self._touched) >= TOUCH_BATCH
+        if flush:
+            with db:
+                self._flush_touches(db)
+        return default if row is None else self.serializer.loads(row[0])
+
+    def _flush_touches(self, db: sqlite3.Connection) -> None:
+        """
+        Give the pending hits new sequence numbers, oldest first. Runs inside
+        the write transaction (the UPDATE begins it), so numbers never repeat.
+        """
+        with self._counter_lock:
+            touched, self._touched = self._touched, {}
+        db.executemany(
+            "UPDATE entries SET accessed = (SELECT MAX(accessed) FROM entries "
+            "WHERE func = ?1 AND version = ?2) + 1 WHERE func = ?1 AND version = ?2 AND key = ?3",
+            [(self.name, self.version, blob) for blob in touched],
+        )
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value, then evict least recently used rows over the limits."""
+        blob, data = self._encode(key), self._encode(value)
+        db = self._connection()
+        evicted = 0
+        with db:
+            self._flush_touches(db)
+            db.execute(
+                "INSERT OR REPLACE INTO entries SELECT ?1, ?2, ?3, ?4, ?5, "
+                "COALESCE(MAX(accessed), 0) + 1 FROM entries WHERE func = ?1 AND version = ?2",
+                (self.name, self.version, blob, data, len(blob) + len(data)),
+            )
+            if self.max_entries is not None or self.max_bytes is not None:
+                evicted = self._evict(db)
+        if evicted:
+            with self._counter_lock:
+                self.evictions += evicted
+
+    def _evict(self, db: sqlite3.Connection) -> int:
+        """Delete oldest rows until within limits. Runs inside the write transaction."""
+        count, total = db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries WHERE func = ? AND version = ?",
+            (self.name, self.version),
+        ).fetchone()
+        excess = 0 if self.max_entries is None else max(0, count - self.max_entries)
+        if self.max_bytes is not None and total > self.max_bytes:
+            # Walk from the oldest row until enough bytes are freed
+            rows = db.execute(
+                "SELECT size FROM entries WHERE func = ? AND version = ? ORDER BY accessed, rowid",
+                (self.name, self.version),
+            )
+            needed = 0
+            for (size,) in rows:
+                if total <= self.max_bytes:
+                    break
+                total -= size
+                needed += 1
+            excess = max(excess, needed)
+        if excess:
+            db.execute(
+                "DELETE FROM entries WHERE rowid IN (SELECT rowid FROM entries "
+                "WHERE func = ? AND version = ? ORDER BY accessed, rowid LIMIT ?)",
+                (self.name, self.version, excess),
+            )
+        return excess
+
+    def info(self) -> CacheInfo:
+        with self._counter_lock:
+            hits, misses, evictions = self.hits, self.misses, self.evictions
+        return CacheInfo(hits, misses, evictions, 0, self.max_entries, len(self))
+
+    def clear(self) -> None:
+        """Delete this function's rows and reset the counters."""
+        db = self._connection()
+        with db:
+            db.execute("DELETE FROM entries WHERE func = ?", (self.name,))
+        with self._counter_lock:
+            self.hits = self.misses = self.evictions = 0
+            self._touched = {}
+
+    def close(self) -> None:
+        """Write pending hits and close this thread's connection."""
+        db = getattr(self._local, "db", None)
+        if db is not None and self._local.pid == os.getpid():
+            if self._touched:
+                with db:
+                    self._flush_touches(db)
+            db.close()
+        self._local = threading.local()
+
+    def __len__(self) -> int:
+        return self._connection().execute(
+            "SELECT COUNT(*) FROM entries WHERE func = ? AND version = ?",
+            (self.name, self.version),
+        ).fetchone()[0]
+
+
+def persistent_cache(
+    path: str,
+    *,
+    max_entries: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    serializer: Any = pickle,
+    version: Optional[str] = None,
+    key: Callable[[tuple, Dict[str, Any]], Hashable] = persistent_key,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> Callable:
+    """
+    Memoize into a SQLite file that survives restarts and is shared by processes.
+
+    The wrapper gets cache_info(), cache_clear() and a .cache attribute,
+    like @cached.
+
+    HINT FOR IMPLEMENTATION:
+    1. Identify the function by module + qualname and version it by code hash
+    2. Serialize the key; look it up; on a miss call func and store the result
+    3. Two processes missing the same key both compute it - the second write
+       simply replaces the first (results are deterministic)
+
+    Args:
+        path: SQLite file, may be shared by many functions and processes
+        max_entries: Maximum rows for this function (None = unbounded)
+        max_bytes: Maximum stored bytes for this function (None = unbounded)
+        serializer: Module/object with dumps and loads (pickle, json, ...)
+        version: Cache version (default: hash of the function's source)
+        key: Function (args, kwargs) -> serializable key
+        timeout: Seconds to wait for another process's write lock
+    """
+
+    def decorate(func: Callable) -> Callable:
+        cache = PersistentCache(
+            path,
+            f"{func.__module__}.{func.__qualname__}",
+            version=code_version(func) if version is None else version,
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            serializer=serializer,
+            timeout=timeout,
+        )
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            k = key(args, kwargs)
+            value = cache.get(k)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache.set(k, value)
+            return value
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorate
+
+
+# =============================================================================
+# DEMONSTRATION
+# =============================================================================
+
+
+if __name__ == "__main__":
+    import subprocess
+    import sys
+    import tempfile
+
+    print("=" * 60)
+    print("PERSISTENT MEMOIZATION - WARM RESTARTS")
+    print("=" * 60)
+
+    # Each "worker restart" is a fresh interpreter using the same cache file
+    worker = """
+import sys, time
+from python_concepts.persistent_cache import persistent_cache
+
+@persistent_cache(sys.argv[1], version="demo")
+def slow_square(x):
+    time.sleep(0.01)
+    return x * x
+
+start = time.perf_counter()
+total = sum(slow_square(x) for x in range(100))
+print(f"{time.perf_counter() - start:.2f}s  {slow_square.cache_info()}")
+"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "memo.sqlite")
+        for run in ("cold start", "warm restart"):
+            out = subprocess.run(
+                [sys.executable, "-c", worker, path], capture_output=True, text=True, check=True
+            ).stdout.strip()
+            print(f"\n   {run:<13} {out}")
+
+    print("\n" + "=" * 60)
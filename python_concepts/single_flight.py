@@ -0,0 +1,271 @@
+"""
+Single-Flight Memoization - Threads and asyncio
+===============================================
+Learn: How to stop a stampede of identical computations on a cold cache.
+
+memoize's wrapper is check-then-set:
+
+    if args in cache: return cache[args]
+    res = func(*args)          # <- 50 threads can all be here at once
+    cache[args] = res
+
+When 50 threads ask for the same cold key at the same time, all 50 miss and
+all 50 compute it. With single flight, the first caller for a key becomes
+the LEADER and computes; every other caller for that key waits for the
+leader's result (or exception) instead of starting its own call.
+
+Threads:
+- In-flight calls live in per-stripe dicts, each guarded by its own lock
+  (stripe = hash(key) % stripes). Callers for different keys rarely share
+  a lock, so there is no global bottleneck while computations run.
+- The leader stores the result in the cache BEFORE removing the in-flight
+  entry, and a new leader re-checks the cache, so a key is never computed
+  twice by callers that overlap.
+- A thread that re-enters its own in-flight key (recursion) computes
+  directly instead of waiting on itself.
+
+asyncio:
+- The event loop is single-threaded, so no locks: the first awaiter wraps
+  the coroutine in a Task, later awaiters await the same Task.
+- Each awaiter awaits asyncio.shield(task): cancelling one waiter does
+  not cancel the shared computation for the others.
+
+Failed computations are not cached: every waiter gets the exception and
+the next call tries again.
+
+Example:
+    @memoize_threadsafe(maxsize=1024)
+    def load(key): ...
+
+    @memoize_async(ttl=30)
+    async def fetch(url): ...
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from python_concepts.caching import _MISSING, Cache, make_key
+
+DEFAULT_STRIPES = 64
+
+
+class _Call:
+    """One in-flight computation that followers wait on."""
+
+    __slots__ = ("done", "value", "error", "owner")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+        self.owner = threading.get_ident()
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls per key across threads.
+
+    Args:
+        stripes: Number of independent lock + in-flight dict pairs
+    """
+
+    def __init__(self, stripes: int = DEFAULT_STRIPES):
+        if stripes < 1:
+            raise ValueError("stripes must be >= 1")
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._calls: List[Dict[Hashable, _Call]] = [{} for _ in range(stripes)]
+        self.leaders = 0
+        self.followers = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn() once per key among overlapping callers.
+
+        Returns fn's result, or raises its exception, in every caller.
+        """
+        stripe = hash(key) % len(self._locks)
+        lock, calls = self._locks[stripe], self._calls[stripe]
+        me = threading.get_ident()
+        with lock:
+            call = calls.get(key)
+            leader = call is None
+            if leader:
+                call = calls[key] = _Call()
+                self.leaders += 1
+            elif call.owner != me:
+                self.followers += 1
+
+        if not leader:
+            if call.owner == me:
+                return fn()  # re-entrant call: waiting on ourselves would deadlock
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = fn()
+            return call.value
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with lock:
+                del calls[key]
+            call.done.set()
+
+
+def memoize_threadsafe(
+    func: Optional[Callable] = None,
+    *,
+    maxsize: Optional[int] = 128,
+    policy: str = "lru",
+    ttl: Optional[float] = None,
+    key: Callable[[tuple, Dict[str, Any]], Hashable] = make_key,
+    stripes: int = DEFAULT_STRIPES,
+    timer: Callable[[], float] = time.monotonic,
+) -> Callable:
+    """
+    @cached with single-flight misses: one computation per cold key.
+
+    Same options as @cached, plus stripes. The wrapper also gets
+    .single_flight (leader/follower counters).
+
+    HINT FOR IMPLEMENTATION:
+    1. Hit: return the cached value - no single-flight overhead
+    2. Miss: flight.do(key, compute) where compute re-checks the cache
+       (peek) before calling func, then stores the result
+    """
+    if func is None:
+        return lambda f: memoize_threadsafe(
+            f, maxsize=maxsize, policy=policy, ttl=ttl, key=key, stripes=stripes, timer=timer
+        )
+
+    cache = Cache(maxsize=maxsize, policy=policy, ttl=ttl, timer=timer)
+    flight = SingleFlight(stripes)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        k = key(args, kwargs)
+        value = cache.get(k)
+        if value is not _MISSING:
+            return value
+
+        def compute():
+            value = cache.peek(k)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache.set(k, value)
+            return value
+
+        return flight.do(k, compute)
+
+    wrapper.cache = cache
+    wrapper.single_flight = flight
+    wrapper.cache_info = cache.info
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
+def memoize_async(
+    func: Optional[Callable] = None,
+    *,
+    maxsize: Optional[int] = 128,
+    policy: str = "lru",
+    ttl: Optional[float] = None,
+    key: Callable[[tuple, Dict[str, Any]], Hashable] = make_key,
+    timer: Callable[[], float] = time.monotonic,
+) -> Callable:
+    """
+    Memoize an `async def` function, coalescing concurrent awaits per key.
+
+    All awaiters of a cold key share one Task. Intended for one event loop.
+    """
+    if func is None:
+        return lambda f: memoize_async(
+            f, maxsize=maxsize, policy=policy, ttl=ttl, key=key, timer=timer
+        )
+    if not asyncio.iscoroutinefunction(func):
+        raise TypeError("memoize_async needs an async def function")
+
+    cache = Cache(maxsize=maxsize, policy=policy, ttl=ttl, timer=timer)
+    in_flight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+
+    def finished(k: Hashable, task: "asyncio.Task[Any]") -> None:
+        in_flight.pop(k, None)
+        if not task.cancelled() and task.exception() is None:
+            cache.set(k, task.result())
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        k = key(args, kwargs)
+        value = cache.get(k)
+        if value is not _MISSING:
+            return value
+        task = in_flight.get(k)
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            in_flight[k] = task
+            task.add_done_callback(functools.partial(finished, k))
+        return await asyncio.shield(task)
+
+    wrapper.cache = cache
+    wrapper.cache_info = cache.info
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
+# =============================================================================
+# DEMONSTRATION
+# =============================================================================
+
+
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    from python_concepts.timing_decorator import memoize
+
+    print("=" * 60)
+    print("SINGLE-FLIGHT MEMOIZATION - COLD KEY STAMPEDE")
+    print("=" * 60)
+
+    def make_slow():
+        calls = [0]
+
+        def slow_square(x: int) -> int:
+            calls[0] += 1
+            time.sleep(0.05)
+            return x * x
+
+        return slow_square, calls
+
+    threads = 32
+    print()
+    for name, decorate in [("memoize", memoize), ("memoize_threadsafe", memoize_threadsafe)]:
+        fn, calls = make_slow()
+        fn = decorate(fn)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(threads) as pool:
+            list(pool.map(fn, [7] * threads))
+        elapsed = time.perf_counter() - start
+        print(f"   {name:<19} {threads} threads, same cold key: "
+              f"{calls[0]} computations in {elapsed:.2f}s")
+
+    calls = [0]
+
+    @memoize_async
+    async def fetch(x: int) -> int:
+        calls[0] += 1
+        await asyncio.sleep(0.05)
+        return x * x
+
+    async def stampede():
+        return await asyncio.gather(*(fetch(7) for _ in range(100)))
+
+    asyncio.run(stampede())
+    print(f"   memoize_async       100 awaits, same cold key: {calls[0]} computation")
+
+    print("\n" + "=" * 60)
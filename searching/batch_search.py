@@ -0,0 +1,335 @@
+"""
+Batched Binary Search - Many Targets Against One Sorted Array
+
+Algorithm Overview:
+Calling binary_search_iterative once per key pays a full O(log n) descent
+(and a Python function call) for every query. When the queries arrive as a
+batch we can do better:
+
+1. Sort the query batch (we only sort indices, so results can be scattered
+   back into the original query order).
+2. Walk the sorted queries left to right. Each answer is at or after the
+   previous one, so instead of searching the whole array we GALLOP from the
+   last position: probe pos, pos+1, pos+3, pos+7, ... until we overshoot,
+   then binary search inside that last window.
+
+If consecutive queries are close together the gallop costs O(1); if they are
+far apart it costs O(log gap). Summed over the batch this is
+O(m log(n/m + 1)) probes instead of O(m log n).
+
+Optional backend:
+If NumPy is installed and both inputs are integer arrays, the whole batch is
+handed to numpy.searchsorted, which does the same job in C.
+
+Time Complexity: O(m log m + m log(n/m + 1)) for m queries over n elements
+Space Complexity: O(m) for the sorted query order and results
+
+Run the demo/benchmark with: python -m searching.batch_search
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is an optional accelerator
+    np = None
+
+
+BACKENDS = ("auto", "python", "numpy")
+
+
+def _gallop_left(arr: Sequence[int], target: int, lo: int, hi: int) -> int:
+    """
+    Return the first index i in [lo, hi) with arr[i] >= target (hi if none).
+
+    HINT:
+    - Double the step from lo until arr[lo + step] >= target
+    - Then run the usual lower-bound binary search on the last window
+    """
+    step = 1
+    left = lo
+    right = lo
+    while right < hi and arr[right] < target:
+        left = right + 1
+        right = lo + step
+        step <<= 1
+    if right > hi:
+        right = hi
+    while left < right:
+        mid = left + (right - left) // 2
+        if arr[mid] < target:
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+
+def _gallop_right(arr: Sequence[int], target: int, lo: int, hi: int) -> int:
+    """
+    Return the first index i in [lo, hi) with arr[i] > target (hi if none).
+
+    Same as _gallop_left but steps over elements equal to target.
+    """
+    step = 1
+    left = lo
+    right = lo
+    while right < hi and arr[right] <= target:
+        left = right + 1
+        right = lo + step
+        step <<= 1
+    if right > hi:
+        right = hi
+    while left < right:
+        mid = left + (right - left) // 2
+        if arr[mid] <= target:
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+
+def _use_numpy(arr: Sequence[int], targets: Sequence[int], backend: str):
+    """
+    Decide whether to run on the NumPy backend.
+
+    Returns (arr, targets) as NumPy arrays when the NumPy path should be used,
+    otherwise None.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}, got {backend!r}")
+    if backend == "python":
+        return None
+    if np is None:
+        if backend == "numpy":
+            raise ImportError("backend='numpy' requires NumPy to be installed")
+        return None
+    # np.asarray([]) is float64: give empty inputs an integer dtype
+    np_arr = np.asarray(arr) if len(arr) else np.empty(0, dtype=np.int64)
+    np_targets = np.asarray(targets) if len(targets) else np.empty(0, dtype=np.int64)
+    if np_arr.dtype.kind not in "iu" or np_targets.dtype.kind not in "iu":
+        if backend == "numpy":
+            raise TypeError("backend='numpy' only supports integer arrays")
+        return None
+    return np_arr, np_targets
+
+
+def _bounds_many(
+    arr: Sequence[int], targets: Sequence[int], right_side: bool
+) -> List[int]:
+    """
+    Lower (right_side=False) or upper (right_side=True) bound of every target.
+
+    Results are returned in the original query order.
+    """
+    n = len(arr)
+    m = len(targets)
+    result = [0] * m
+    if m == 0:
+        return result
+    gallop = _gallop_right if right_side else _gallop_left
+    order = sorted(range(m), key=targets.__getitem__)
+
+    pos = 0
+    prev_target: Optional[int] = None
+    for q in order:
+        target = targets[q]
+        if target != prev_target:
+            prev_target = target
+            # Cheap check first: dense batches often do not move pos at all
+            if pos < n and (arr[pos] <= target if right_side else arr[pos] < target):
+                pos = gallop(arr, target, pos + 1, n)
+        result[q] = pos
+    return result
+
+
+def search_many_insertion(
+    arr: Sequence[int], targets: Sequence[int], backend: str = "auto"
+) -> List[int]:
+    """
+    Batched find_insertion_position.
+
+    Args:
+        arr: Sorted list of integers
+        targets: Values to insert (any order, duplicates allowed)
+        backend: "auto" (NumPy when available for int data), "python" or "numpy"
+
+    Returns:
+        List where result[k] == find_insertion_position(arr, targets[k])
+
+    Example:
+        search_many_insertion([1, 3, 5, 7], [4, 0, 20]) -> [2, 0, 4]
+    """
+    np_inputs = _use_numpy(arr, targets, backend)
+    if np_inputs is not None:
+        np_arr, np_targets = np_inputs
+        return np.searchsorted(np_arr, np_targets, side="left").tolist()
+    return _bounds_many(arr, targets, right_side=False)
+
+
+def search_many_first(
+    arr: Sequence[int], targets: Sequence[int], backend: str = "auto"
+) -> List[int]:
+    """
+    Batched find_first_occurrence.
+
+    Args:
+        arr: Sorted list (may contain duplicates)
+        targets: Values to search for
+        backend: "auto", "python" or "numpy"
+
+    Returns:
+        List where result[k] == find_first_occurrence(arr, targets[k])
+
+    Example:
+        search_many_first([1, 2, 2, 2, 3], [2, 5, 1]) -> [1, -1, 0]
+    """
+    n = len(arr)
+    np_inputs = _use_numpy(arr, targets, backend)
+    if np_inputs is not None:
+        np_arr, np_targets = np_inputs
+        if n == 0:
+            return [-1] * len(np_targets)
+        pos = np.searchsorted(np_arr, np_targets, side="left")
+        hit = np_arr[np.minimum(pos, n - 1)] == np_targets
+        return np.where(hit & (pos < n), pos, -1).tolist()
+
+    lower = _bounds_many(arr, targets, right_side=False)
+    return [
+        pos if pos < n and arr[pos] == target else -1
+        for pos, target in zip(lower, targets)
+    ]
+
+
+def search_many_last(
+    arr: Sequence[int], targets: Sequence[int], backend: str = "auto"
+) -> List[int]:
+    """
+    Batched find_last_occurrence.
+
+    Args:
+        arr: Sorted list (may contain duplicates)
+        targets: Values to search for
+        backend: "auto", "python" or "numpy"
+
+    Returns:
+        List where result[k] == find_last_occurrence(arr, targets[k])
+
+    Example:
+        search_many_last([1, 2, 2, 2, 3], [2, 5, 1]) -> [3, -1, 0]
+    """
+    np_inputs = _use_numpy(arr, targets, backend)
+    if np_inputs is not None:
+        np_arr, np_targets = np_inputs
+        if len(np_arr) == 0:
+            return [-1] * len(np_targets)
+        pos = np.searchsorted(np_arr, np_targets, side="right") - 1
+        hit = np_arr[np.maximum(pos, 0)] == np_targets
+        return np.where(hit & (pos >= 0), pos, -1).tolist()
+
+    upper = _bounds_many(arr, targets, right_side=True)
+    return [
+        pos - 1 if pos > 0 and arr[pos - 1] == target else -1
+        for pos, target in zip(upper, targets)
+    ]
+
+
+def search_many(
+    arr: Sequence[int], targets: Sequence[int], backend: str = "auto"
+) -> List[int]:
+    """
+    Batched binary_search_iterative: index of each target, -1 if missing.
+
+    For arrays with duplicates binary_search_iterative may return any
+    matching index; search_many always returns the first one, which is
+    equally valid and deterministic.
+
+    Args:
+        arr: Sorted list of integers
+        targets: Values to search for
+        backend: "auto", "python" or "numpy"
+
+    Returns:
+        List of indices in the same order as targets
+
+    Example:
+        search_many([1, 3, 5, 7, 9], [7, 10, 1]) -> [3, -1, 0]
+    """
+    return search_many_first(arr, targets, backend=backend)
+
+
+def count_range_many(
+    arr: Sequence[int], ranges: Sequence[Tuple[int, int]], backend: str = "auto"
+) -> List[int]:
+    """
+    Batched count_range: how many elements fall in each inclusive [lo, hi].
+
+    All lower ends are answered with one galloping sweep and all upper ends
+    with another, so a histogram of m bins costs two sweeps instead of 2m
+    independent descents.
+
+    Args:
+        arr: Sorted list of integers
+        ranges: (lo, hi) pairs, both ends inclusive
+        backend: "auto", "python" or "numpy"
+
+    Returns:
+        List where result[k] == count_range(arr, *ranges[k])
+
+    Example:
+        count_range_many([1, 2, 2, 2, 3, 4], [(2, 3), (5, 9), (0, 1)]) -> [4, 0, 1]
+    """
+    los = [lo for lo, _ in ranges]
+    his = [hi for _, hi in ranges]
+    np_inputs = _use_numpy(arr, los + his, backend)
+    if np_inputs is not None:
+        np_arr, np_bounds = np_inputs
+        m = len(ranges)
+        starts = np.searchsorted(np_arr, np_bounds[:m], side="left")
+        ends = np.searchsorted(np_arr, np_bounds[m:], side="right")
+        return np.maximum(ends - starts, 0).tolist()
+
+    starts = _bounds_many(arr, los, right_side=False)
+    ends = _bounds_many(arr, his, right_side=True)
+    return [max(end - start, 0) for start, end in zip(starts, ends)]
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from searching.binary_search import binary_search_iterative
+
+    print("=" * 60)
+    print("BATCHED BINARY SEARCH - BENCHMARK")
+    print("=" * 60)
+
+    arr = [1, 3, 5, 7, 9, 11, 13, 15]
+    print(f"\nArray: {arr}")
+    print(f"   search_many [7, 10, 1]: {search_many(arr, [7, 10, 1])} (expected: [3, -1, 0])")
+    print(
+        f"   search_many_insertion [4, 0, 20]: "
+        f"{search_many_insertion(arr, [4, 0, 20])} (expected: [2, 0, 8])"
+    )
+
+    for n, m in [(10**5, 10**5), (10**6, 10**6)]:
+        arr = sorted(random.randrange(4 * n) for _ in range(n))
+        queries = [random.randrange(4 * n) for _ in range(m)]
+
+        start = time.perf_counter()
+        expected = [binary_search_iterative(arr, q) for q in queries]
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        got = search_many(arr, queries, backend="python")
+        batch_time = time.perf_counter() - start
+
+        assert [g != -1 for g in got] == [e != -1 for e in expected]
+        print(f"\nn={n:,} m={m:,}")
+        print(f"   loop over binary_search_iterative: {loop_time:.3f}s")
+        print(f"   search_many (python):              {batch_time:.3f}s")
+        if np is not None:
+            start = time.perf_counter()
+            search_many(arr, queries, backend="numpy")
+            print(f"   search_many (numpy):               {time.perf_counter() - start:.3f}s")
+
+    print("\n" + "=" * 60)
@@ -17,7 +17,7 @@ HINTS:
 - Stop when left > right (not found)
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
 def binary_search_iterative(arr: List[int], target: int) -> int:
@@ -192,6 +192,103 @@ def find_insertion_position(arr: List[int], target: int) -> int:
     return left
 
 
+def equal_range(arr: List[int], target: int) -> Tuple[int, int]:
+    """
+    Find the slice [start, end) of all elements equal to target in one pass.
+
+    HINT:
+    - Calling find_first_occurrence and find_last_occurrence does two full
+      descents that repeat the same steps until they first hit target
+    - Share that common prefix: narrow [left, right) until arr[mid] == target
+    - Then finish with a lower-bound search on [left, mid) and an
+      upper-bound search on [mid + 1, right)
+
+    Args:
+        arr: Sorted list (may contain duplicates)
+        target: Value to search for
+
+    Returns:
+        (start, end) so that arr[start:end] are exactly the copies of target.
+        If target is missing, start == end == its insertion position.
+
+    Time Complexity: O(log n) - one shared descent plus two half-descents
+    Space Complexity: O(1)
+
+    Example:
+        [1, 2, 2, 2, 3, 4] target=2 -> (1, 4)
+    """
+    left = 0
+    right = len(arr)
+    while left < right:
+        mid = left + (right - left) // 2
+        if arr[mid] < target:
+            left = mid + 1
+        elif arr[mid] > target:
+            right = mid
+        else:
+            return (
+                _lower_bound(arr, target, left, mid),
+                _upper_bound(arr, target, mid + 1, right),
+            )
+    return left, left
+
+
+def count_range(arr: List[int], lo: int, hi: int) -> int:
+    """
+    Count elements x with lo <= x <= hi in one pass.
+
+    HINT:
+    - Same idea as equal_range, but the shared descent stops as soon as
+      arr[mid] falls inside [lo, hi]
+    - Everything left of mid is searched for lo, everything right for hi
+
+    Args:
+        arr: Sorted list of integers
+        lo: Lower bound (inclusive)
+        hi: Upper bound (inclusive)
+
+    Returns:
+        Number of elements in [lo, hi], 0 if lo > hi
+
+    Example:
+        [1, 2, 2, 2, 3, 4] lo=2, hi=3 -> 4
+    """
+    left = 0
+    right = len(arr)
+    while left < right:
+        mid = left + (right - left) // 2
+        if arr[mid] < lo:
+            left = mid + 1
+        elif arr[mid] > hi:
+            right = mid
+        else:
+            return _upper_bound(arr, hi, mid + 1, right) - _lower_bound(
+                arr, lo, left, mid
+            )
+    return 0
+
+
+def _lower_bound(arr: List[int], target: int, left: int, right: int) -> int:
+    """First index in [left, right) with arr[i] >= target (right if none)."""
+    while left < right:
+        mid = left + (right - left) // 2
+        if arr[mid] < target:
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+
+def _upper_bound(arr: List[int], target: int, left: int, right: int) -> int:
+    """First index in [left, right) with arr[i] > target (right if none)."""
+    while left < right:
+        mid = left + (right - left) // 2
+        if arr[mid] <= target:
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
 
 if __name__ == "__main__":
     print("=" * 60)
@@ -232,4 +329,9 @@ if __name__ == "__main__":
     print(f"   Insert 20 in {arr}: {find_insertion_position(arr, 20)} (expected: 8)")
     print(f"   Insert 7 in {arr}: {find_insertion_position(arr, 7)} (expected: 3)")
 
+    # Test 5: Fused range queries
+    print("\n5️⃣ Testing Equal Range / Count Range:")
+    print(f"   Equal range of 2 in {arr_dup}: {equal_range(arr_dup, 2)} (expected: (1, 4))")
+    print(f"   Count of [2, 4] in {arr_dup}: {count_range(arr_dup, 2, 4)} (expected: 5)")
+
     print("\n" + "=" * 60)
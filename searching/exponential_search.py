@@ -0,0 +1,198 @@
+"""
+Exponential (Galloping) Search - Sorted Sources of Unknown Length
+
+Algorithm Overview:
+Binary search needs both ends of the array up front. Exponential search
+only needs a starting point: probe index 0, 1, 3, 7, 15, ... (doubling the
+step) until the value reaches the target or we run off the end, then binary
+search inside the last step. Finding index i costs O(log i) probes, no
+matter how long (or infinite) the source is.
+
+Two extras make this useful for streams:
+
+1. LazySequence wraps any iterator (e.g. fibonacci_infinite()) and pulls
+   items only when an index is probed, so only the prefix up to roughly
+   twice the answer is ever buffered.
+
+2. Search from a hint: for a stream of increasing queries, start galloping
+   from the previous answer instead of from 0. A query that moves d
+   positions costs O(log d) probes.
+
+Running off the end of a finite source (IndexError) is treated as "value is
++infinity", so the same code handles lists, lazy iterators and infinite
+indexable objects.
+
+Time Complexity: O(log i) where i is the answer (O(log d) from a hint)
+Space Complexity: O(1), plus the buffered prefix for LazySequence
+
+Run the demo with: python -m searching.exponential_search
+"""
+
+from typing import Any, Iterable, List
+
+
+class LazySequence:
+    """
+    Indexable view over an iterator that materializes items on demand.
+
+    Example:
+        from python_concepts.fibonacci_generator import fibonacci_infinite
+
+        fib = LazySequence(fibonacci_infinite())
+        fib[10]          # 55, buffers only the first 11 numbers
+        len(fib.buffer)  # 11
+    """
+
+    def __init__(self, iterable: Iterable[Any]):
+        self._iterator = iter(iterable)
+        self.buffer: List[Any] = []
+        self.exhausted = False
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            raise IndexError("LazySequence does not support negative indices")
+        buffer = self.buffer
+        while len(buffer) <= index and not self.exhausted:
+            try:
+                buffer.append(next(self._iterator))
+            except StopIteration:
+                self.exhausted = True
+        if index >= len(buffer):
+            raise IndexError("LazySequence index out of range")
+        return buffer[index]
+
+
+def _less(source: Any, index: int, target: Any) -> bool:
+    """source[index] < target, treating positions past the end as +infinity."""
+    try:
+        return source[index] < target
+    except IndexError:
+        return False
+
+
+def exponential_search_from(source: Any, target: Any, hint: int = 0) -> int:
+    """
+    Insertion position of target, galloping out from hint in either direction.
+
+    HINT:
+    - If source[hint - 1] >= target the answer is left of hint: gallop left
+    - Otherwise gallop right: probe hint, hint+1, hint+3, hint+7, ...
+    - Either way you end with lo < answer <= hi, then binary search
+
+    Args:
+        source: Sorted indexable (list, LazySequence, ...) - may be unbounded
+        target: Value to locate
+        hint: Position to start from, e.g. the previous answer
+
+    Returns:
+        First index i with source[i] >= target (or the length if none)
+
+    Example:
+        exponential_search_from([1, 3, 5, 7, 9], 7, hint=1) -> 3
+    """
+    hint = max(hint, 0)
+    if hint > 0 and not _less(source, hint - 1, target):
+        # Answer is at or before hint - 1: gallop left
+        hi = hint - 1
+        step = 1
+        lo = hi - step
+        while lo >= 0 and not _less(source, lo, target):
+            hi = lo
+            step *= 2
+            lo = hi - step
+        lo = max(lo, -1)
+    else:
+        # Answer is at or after hint: gallop right
+        lo = hint - 1
+        hi = hint
+        step = 1
+        while _less(source, hi, target):
+            lo = hi
+            hi = lo + step
+            step *= 2
+
+    # Invariant: source[lo] < target <= source[hi]
+    while hi - lo > 1:
+        mid = lo + (hi - lo) // 2
+        if _less(source, mid, target):
+            lo = mid
+        else:
+            hi = mid
+    return hi
+
+
+def exponential_search(source: Any, target: Any) -> int:
+    """
+    Same contract as binary_search_iterative, without knowing the length.
+
+    Args:
+        source: Sorted indexable, possibly unbounded
+        target: Value to search for
+
+    Returns:
+        Index of target (first occurrence) if found, -1 otherwise
+
+    Example:
+        exponential_search(LazySequence(fibonacci_infinite()), 144) -> 12
+    """
+    pos = exponential_search_from(source, target)
+    try:
+        if source[pos] == target:
+            return pos
+    except IndexError:
+        pass
+    return -1
+
+
+class HintedSearcher:
+    """
+    Answers a stream of (mostly increasing) queries over one sorted source,
+    galloping from the previous answer each time.
+
+    Example:
+        searcher = HintedSearcher(list(range(0, 100, 2)))
+        searcher.find_insertion_position(10)  # 5
+        searcher.find_insertion_position(12)  # 6, found in O(1) probes
+    """
+
+    def __init__(self, source: Any):
+        self.source = source
+        self.hint = 0
+
+    def find_insertion_position(self, target: Any) -> int:
+        """Insertion position of target; also becomes the next hint."""
+        self.hint = exponential_search_from(self.source, target, self.hint)
+        return self.hint
+
+    def search(self, target: Any) -> int:
+        """Index of target (first occurrence) or -1."""
+        pos = self.find_insertion_position(target)
+        try:
+            if self.source[pos] == target:
+                return pos
+        except IndexError:
+            pass
+        return -1
+
+
+if __name__ == "__main__":
+    from python_concepts.fibonacci_generator import fibonacci_infinite
+
+    print("=" * 60)
+    print("EXPONENTIAL SEARCH - TEST YOUR IMPLEMENTATION")
+    print("=" * 60)
+
+    fib = LazySequence(fibonacci_infinite())
+    print("\nSearching the infinite Fibonacci sequence:")
+    print(f"   Search 144: {exponential_search(fib, 144)} (expected: 12)")
+    print(f"   Search 145: {exponential_search(fib, 145)} (expected: -1)")
+    print(f"   Items buffered so far: {len(fib.buffer)}")
+    pos = exponential_search_from(fib, 10**100)
+    print(f"   First Fibonacci >= 10**100 is F({pos}), buffered {len(fib.buffer)} items")
+
+    print("\nHinted search over increasing queries:")
+    searcher = HintedSearcher(LazySequence(fibonacci_infinite()))
+    for target in (1, 5, 21, 89, 233):
+        print(f"   Search {target}: {searcher.search(target)}")
+
+    print("\n" + "=" * 60)
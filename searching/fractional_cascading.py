@@ -0,0 +1,155 @@
+"""
+Fractional Cascading - One Key Against Many Sorted Lists
+
+Algorithm Overview:
+Searching the same key in k sorted lists with binary_search_iterative costs
+k full descents: O(k log n). Fractional cascading links the lists so that
+only the FIRST search is a real binary search; every further list costs
+O(1).
+
+Build (from the last list up):
+    M[k-1] = L[k-1]
+    M[i]   = merge(L[i], every second element of M[i+1])
+
+So each augmented list M[i] also carries a sample of the list below it.
+For every position j in M[i] we precompute:
+    own[i][j]  = how many elements of M[i][:j] came from L[i]
+    down[i][j] = how many elements of M[i][:j] were promoted from M[i+1]
+
+Query for x:
+1. j = insertion position of x in M[0]  (the one real binary search)
+2. For each level i:
+   - the insertion position of x in L[i] is own[i][j]
+   - c = down[i][j] promoted elements are < x. They are M[i+1][1], [3], ...,
+     [2c-1], so x belongs at 2c or 2c+1 in M[i+1]: one comparison decides.
+
+Time Complexity: O(log n + k) per query, O(total size) to build
+Space Complexity: O(total size) - each M[i] is at most |L[i]| + |M[i+1]| / 2
+
+Run the demo with: python -m searching.fractional_cascading
+"""
+
+from typing import Any, List, Sequence
+
+from searching.binary_search import find_insertion_position
+
+
+class FractionalCascade:
+    """
+    Preprocessed set of sorted lists answering insertion positions in all
+    of them at once.
+
+    Example:
+        fc = FractionalCascade([[1, 5, 9], [2, 3, 10], [0, 4]])
+        fc.find_insertion_positions(4)  # [1, 2, 1]
+    """
+
+    def __init__(self, lists: Sequence[Sequence[Any]]):
+        """
+        Args:
+            lists: Sorted sequences (one per shard). Empty lists are allowed.
+
+        Raises:
+            ValueError: If any list is not sorted
+        """
+        for lst in lists:
+            for i in range(1, len(lst)):
+                if lst[i - 1] > lst[i]:
+                    raise ValueError("FractionalCascade requires sorted lists")
+
+        k = len(lists)
+        self._lists = list(lists)
+        self._augmented: List[List[Any]] = [[] for _ in range(k)]
+        self._own: List[List[int]] = [[] for _ in range(k)]
+        self._down: List[List[int]] = [[] for _ in range(k)]
+
+        below: List[Any] = []
+        for i in range(k - 1, -1, -1):
+            self._build_level(i, lists[i], below[1::2])
+            below = self._augmented[i]
+
+    def _build_level(self, i: int, own_list: Sequence[Any], promoted: List[Any]) -> None:
+        """Merge own_list with the promoted sample and record both counters."""
+        merged: List[Any] = []
+        own = [0]
+        down = [0]
+        a = b = 0
+        while a < len(own_list) or b < len(promoted):
+            if b == len(promoted) or (a < len(own_list) and own_list[a] <= promoted[b]):
+                merged.append(own_list[a])
+                a += 1
+            else:
+                merged.append(promoted[b])
+                b += 1
+            own.append(a)
+            down.append(b)
+        self._augmented[i] = merged
+        self._own[i] = own
+        self._down[i] = down
+
+    def __len__(self) -> int:
+        return len(self._augmented)
+
+    def find_insertion_positions(self, target: Any) -> List[int]:
+        """
+        Insertion position of target in every list.
+
+        Returns:
+            List where result[i] == find_insertion_position(lists[i], target)
+        """
+        k = len(self._augmented)
+        if k == 0:
+            return []
+        result = [0] * k
+        j = find_insertion_position(self._augmented[0], target)
+        for i in range(k):
+            result[i] = self._own[i][j]
+            if i + 1 < k:
+                j = 2 * self._down[i][j]
+                below = self._augmented[i + 1]
+                if j < len(below) and below[j] < target:
+                    j += 1
+        return result
+
+    def search(self, target: Any) -> List[int]:
+        """
+        Index of target (first occurrence) in every list, -1 where missing.
+
+        Same per-list contract as find_first_occurrence.
+        """
+        positions = self.find_insertion_positions(target)
+        return [
+            pos if pos < len(lst) and lst[pos] == target else -1
+            for lst, pos in zip(self._lists, positions)
+        ]
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    print("=" * 60)
+    print("FRACTIONAL CASCADING - TEST YOUR IMPLEMENTATION")
+    print("=" * 60)
+
+    lists = [[1, 5, 9], [2, 3, 10], [0, 4]]
+    fc = FractionalCascade(lists)
+    print(f"\nLists: {lists}")
+    print(f"   Insertion positions of 4: {fc.find_insertion_positions(4)} (expected: [1, 2, 1])")
+
+    shards = [sorted(random.randrange(10**7) for _ in range(20_000)) for _ in range(48)]
+    fc = FractionalCascade(shards)
+    queries = [random.randrange(10**7) for _ in range(20_000)]
+
+    start = time.perf_counter()
+    for q in queries:
+        [find_insertion_position(shard, q) for shard in shards]
+    print("\n48 shards x 20k keys, 20k queries")
+    print(f"   find_insertion_position per shard: {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    for q in queries:
+        fc.find_insertion_positions(q)
+    print(f"   FractionalCascade:                 {time.perf_counter() - start:.2f}s")
+
+    print("\n" + "=" * 60)
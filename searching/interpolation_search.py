@@ -0,0 +1,301 @@
+"""
+Interpolation Search and a Piecewise-Linear Learned Index
+
+Algorithm Overview:
+Binary search always probes the middle, ignoring the VALUES it has seen.
+If keys are close to uniformly distributed (timestamps, sequential IDs) we
+can guess where the target sits:
+
+    pos = lo + (target - arr[lo]) * (hi - lo) / (arr[hi] - arr[lo])
+
+1. Interpolation search repeats that guess inside the current bracket.
+   On uniform data it needs O(log log n) probes, but on skewed data a plain
+   interpolation search degrades to O(n). We guard against that: whenever a
+   guess fails to at least halve the bracket, the next probe is a normal
+   bisection. That caps the cost at about 2 * log2(n) probes.
+
+2. The learned index fits one straight line per fixed-size segment of the
+   array at build time and records how far the line can be off (the error
+   window). A query picks its segment, predicts a position, and finishes
+   with a binary search restricted to the error window. If the window check
+   ever fails we fall back to a binary search over the whole segment, so
+   the worst case stays O(log n).
+
+Both report probe counts (reads of the data array) so the win can be
+measured on real key distributions.
+
+Time Complexity:
+    Interpolation: O(log log n) expected on uniform keys, O(log n) worst case
+    Learned index: O(log segments + log error) per query, O(log n) worst case
+Space Complexity: O(1) for interpolation, O(n / segment_size) for the model
+
+Run the probe-count comparison with: python -m searching.interpolation_search
+"""
+
+from typing import List, Sequence, Tuple
+
+
+def binary_search_probes(arr: Sequence[int], target: int) -> Tuple[int, int]:
+    """
+    Lower-bound binary search that also counts probes (for comparison).
+
+    Returns:
+        (insertion position, number of array reads)
+    """
+    left = 0
+    right = len(arr)
+    probes = 0
+    while left < right:
+        mid = left + (right - left) // 2
+        probes += 1
+        if arr[mid] < target:
+            left = mid + 1
+        else:
+            right = mid
+    return left, probes
+
+
+def interpolation_search_probes(arr: Sequence[int], target: int) -> Tuple[int, int]:
+    """
+    Guarded interpolation search for the insertion position of target.
+
+    HINT:
+    - Keep a bracket (lo, hi] with arr[lo] < target <= arr[hi]
+    - Guess mid by linear interpolation between arr[lo] and arr[hi]
+    - If the bracket did not shrink by half, take one bisection step
+
+    Returns:
+        (insertion position, number of array reads)
+
+    Example:
+        interpolation_search_probes([10, 20, 30, 40], 30) -> (2, 3)
+    """
+    n = len(arr)
+    if n == 0:
+        return 0, 0
+    if arr[0] >= target:
+        return 0, 1
+    if arr[n - 1] < target:
+        return n, 2
+
+    lo, hi = 0, n - 1
+    lo_val, hi_val = arr[lo], arr[hi]
+    probes = 2
+    bisect_next = False
+    while hi - lo > 1:
+        width = hi - lo
+        if bisect_next:
+            mid = lo + width // 2
+        else:
+            mid = lo + int((target - lo_val) * width / (hi_val - lo_val))
+            if mid <= lo:
+                mid = lo + 1
+            elif mid >= hi:
+                mid = hi - 1
+        value = arr[mid]
+        probes += 1
+        if value < target:
+            lo, lo_val = mid, value
+        else:
+            hi, hi_val = mid, value
+        bisect_next = not bisect_next and (hi - lo) > width // 2
+    return hi, probes
+
+
+def interpolation_search(arr: Sequence[int], target: int) -> int:
+    """
+    Same contract as binary_search_iterative, using guarded interpolation.
+
+    Args:
+        arr: Sorted list of integers
+        target: Value to search for
+
+    Returns:
+        Index of target (first occurrence) if found, -1 otherwise
+
+    Example:
+        interpolation_search([10, 20, 30, 40, 50], 40) -> 3
+    """
+    pos, _ = interpolation_search_probes(arr, target)
+    if pos < len(arr) and arr[pos] == target:
+        return pos
+    return -1
+
+
+class LearnedIndex:
+    """
+    Piecewise-linear position model over a sorted array.
+
+    The array is split into segments of segment_size keys. For each segment
+    we store its first key, the slope of the line through its first and last
+    key, and how far the line can under/over-shoot the true insertion
+    position of any target that lands in the segment.
+
+    Example:
+        index = LearnedIndex(list(range(0, 1000, 5)))
+        index.search(500)                   # 100
+        index.find_insertion_position(501)  # 101
+    """
+
+    def __init__(self, arr: Sequence[int], segment_size: int = 256):
+        """
+        Build the model. The array itself is referenced, not copied.
+
+        Args:
+            arr: Sorted sequence of integers
+            segment_size: Keys per linear segment (smaller = tighter windows)
+        """
+        if segment_size < 1:
+            raise ValueError("segment_size must be at least 1")
+        self.arr = arr
+        n = len(arr)
+        self._starts: List[int] = list(range(0, n, segment_size))
+        self._first_keys: List[int] = [arr[s] for s in self._starts]
+        self._slopes: List[float] = []
+        self._below: List[int] = []
+        self._above: List[int] = []
+        for j, s in enumerate(self._starts):
+            end = self._starts[j + 1] if j + 1 < len(self._starts) else n - 1
+            self._fit_segment(s, end)
+
+    def _fit_segment(self, s: int, e: int) -> None:
+        """
+        Fit the line for keys arr[s..e] and measure its error window.
+
+        A target t in this segment satisfies arr[s] < t <= arr[e]. Its answer
+        is L(w), the first index of the smallest key w >= t, which also equals
+        U(v), one past the last index of the largest key v < t. Because the
+        prediction is monotone in t, the answer lies within
+            [pred(t) - max(pred(w) - L(w)), pred(t) + max(U(v) - pred(v))]
+        """
+        arr = self.arr
+        first_key = arr[s]
+        span = arr[e] - first_key
+        slope = (e - s) / span if span else 0.0
+        below = 0.0
+        above = 0.0
+        for i in range(s, e + 1):
+            v = arr[i]
+            pred = s + (v - first_key) * slope
+            if i > s and arr[i - 1] != v:
+                below = max(below, pred - i)
+            if i < e and arr[i + 1] != v:
+                above = max(above, i + 1 - pred)
+        self._slopes.append(slope)
+        self._below.append(int(below) + 1)
+        self._above.append(int(above) + 1)
+
+    def __len__(self) -> int:
+        return len(self.arr)
+
+    def _segment_for(self, target: int) -> int:
+        """Index of the last segment whose first key is < target."""
+        keys = self._first_keys
+        left, right = 0, len(keys)
+        while left < right:
+            mid = left + (right - left) // 2
+            if keys[mid] < target:
+                left = mid + 1
+            else:
+                right = mid
+        return left - 1
+
+    def insertion_probes(self, target: int) -> Tuple[int, int]:
+        """
+        Insertion position of target plus the number of data-array reads.
+
+        Segment lookup runs on the small in-memory model and is not counted.
+        """
+        arr = self.arr
+        n = len(arr)
+        if n == 0 or target <= self._first_keys[0]:
+            return 0, 0
+        probes = 1
+        if arr[n - 1] < target:
+            return n, probes
+
+        j = self._segment_for(target)
+        s = self._starts[j]
+        seg_lo = s + 1
+        seg_hi = self._starts[j + 1] if j + 1 < len(self._starts) else n
+        pred = s + (target - self._first_keys[j]) * self._slopes[j]
+        lo = max(seg_lo, int(pred) - self._below[j])
+        hi = min(seg_hi, int(pred) + self._above[j])
+        if lo > hi:
+            lo, hi = seg_lo, seg_hi
+
+        left, right = lo, hi
+        while left < right:
+            mid = left + (right - left) // 2
+            probes += 1
+            if arr[mid] < target:
+                left = mid + 1
+            else:
+                right = mid
+
+        # Guaranteed fallback: confirm the window really contained the answer
+        ok = True
+        if left == lo and lo > seg_lo:
+            probes += 1
+            ok = arr[lo - 1] < target
+        if ok and left == hi and hi < seg_hi:
+            probes += 1
+            ok = arr[hi] >= target
+        if not ok:
+            left, right = seg_lo, seg_hi
+            while left < right:
+                mid = left + (right - left) // 2
+                probes += 1
+                if arr[mid] < target:
+                    left = mid + 1
+                else:
+                    right = mid
+        return left, probes
+
+    def find_insertion_position(self, target: int) -> int:
+        """Same contract as find_insertion_position."""
+        return self.insertion_probes(target)[0]
+
+    def search_probes(self, target: int) -> Tuple[int, int]:
+        """
+        Index of target (first occurrence, -1 if missing) and probe count.
+        """
+        pos, probes = self.insertion_probes(target)
+        if pos < len(self.arr):
+            probes += 1
+            if self.arr[pos] == target:
+                return pos, probes
+        return -1, probes
+
+    def search(self, target: int) -> int:
+        """Same contract as binary_search_iterative."""
+        return self.search_probes(target)[0]
+
+
+if __name__ == "__main__":
+    import random
+
+    print("=" * 60)
+    print("INTERPOLATION / LEARNED INDEX - MEAN PROBES PER QUERY")
+    print("=" * 60)
+
+    n = 1_000_000
+    rng = random.Random(42)
+    distributions = {
+        "uniform": sorted(rng.randrange(10 * n) for _ in range(n)),
+        "timestamps": sorted(1_700_000_000_000 + i * 1000 + rng.randrange(50) for i in range(n)),
+        "exponential": sorted(int(rng.expovariate(1e-6)) for _ in range(n)),
+    }
+    for name, arr in distributions.items():
+        learned = LearnedIndex(arr)
+        queries = [arr[rng.randrange(n)] for _ in range(20_000)]
+        results = {
+            "binary": [binary_search_probes(arr, q)[1] for q in queries],
+            "interpolation": [interpolation_search_probes(arr, q)[1] for q in queries],
+            "learned": [learned.insertion_probes(q)[1] for q in queries],
+        }
+        print(f"\n{name}:")
+        for label, probes in results.items():
+            print(f"   {label:<14} mean={sum(probes) / len(probes):5.1f}  max={max(probes)}")
+
+    print("\n" + "=" * 60)
@@ -0,0 +1,207 @@
+"""
+Memory-Mapped Sorted Index - Binary Search Without Loading Into RAM
+
+Algorithm Overview:
+Binary search only touches O(log n) elements, so there is no reason to read
+a whole sorted key set into a Python list before searching it. If the keys
+are stored as packed fixed-width integers we can mmap the file and hand the
+existing binary search routines a zero-copy memoryview over it. The OS pages
+in only the probed pages, and every process mapping the same file shares
+one copy in the page cache.
+
+File format (all little-endian):
+
+    offset  size  field
+    0       4     magic b"SKIX"
+    4       1     format version (1)
+    5       1     typecode (array/struct code: b B h H i I q Q)
+    6       2     reserved (zero)
+    8       8     number of keys (unsigned)
+    16      ...   keys, packed back to back, sorted ascending
+
+Time Complexity: O(log n) per query, O(log n) pages touched
+Space Complexity: O(1) resident per worker beyond the shared page cache
+
+Run the demo with: python -m searching.mmap_index
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Iterable
+
+from searching.binary_search import (
+    binary_search_iterative,
+    find_first_occurrence,
+    find_insertion_position,
+    find_last_occurrence,
+)
+
+MAGIC = b"SKIX"
+VERSION = 1
+HEADER = struct.Struct("<4sBcxxQ")
+TYPECODES = "bBhHiIqQ"
+_CHUNK = 1 << 16
+
+
+def write_sorted_index(path: str, keys: Iterable[int], typecode: str = "q") -> int:
+    """
+    Write sorted keys to path in the SKIX format.
+
+    Keys are streamed in chunks, so the input can be a generator that never
+    fits in memory at once. The file is written under a temporary name and
+    renamed into place, so path only ever holds a complete index.
+
+    Args:
+        path: Destination file
+        keys: Integers in non-decreasing order
+        typecode: Fixed-width key type, one of "bBhHiIqQ"
+
+    Returns:
+        Number of keys written
+
+    Raises:
+        ValueError: If the typecode is unsupported or keys are not sorted
+    """
+    if typecode not in TYPECODES:
+        raise ValueError(f"typecode must be one of {TYPECODES!r}, got {typecode!r}")
+    count = 0
+    previous = None
+    chunk = array(typecode)
+    # Build next to path and rename at the end: a failed build must not
+    # leave a valid-looking (empty or truncated) index behind
+    partial = f"{os.fspath(path)}.{os.getpid()}.tmp"
+    try:
+        with open(partial, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, typecode.encode(), 0))
+            for key in keys:
+                if previous is not None and key < previous:
+                    raise ValueError("write_sorted_index requires sorted keys")
+                previous = key
+                chunk.append(key)
+                if len(chunk) >= _CHUNK:
+                    count += _flush(f, chunk)
+            count += _flush(f, chunk)
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, VERSION, typecode.encode(), count))
+        os.replace(partial, path)
+    except BaseException:
+        if os.path.exists(partial):
+            os.unlink(partial)
+        raise
+    return count
+
+
+def _flush(f, chunk: array) -> int:
+    """Write a chunk little-endian and empty it. Returns the number of keys."""
+    n = len(chunk)
+    if sys.byteorder != "little":
+        chunk.byteswap()
+    f.write(chunk.tobytes())
+    del chunk[:]
+    return n
+
+
+class MmapSortedIndex:
+    """
+    Read-only view of a SKIX file, searchable in place.
+
+    The keys attribute is a memoryview over the mapped file, so the functions
+    from searching/binary_search.py run on it directly.
+
+    Example:
+        write_sorted_index("keys.skix", [1, 2, 2, 2, 3])
+        with MmapSortedIndex("keys.skix") as index:
+            index.find_first_occurrence(2)  # 1
+            index.find_last_occurrence(2)   # 3
+    """
+
+    def __init__(self, path: str):
+        """
+        Map path read-only and validate its header.
+
+        Raises:
+            ValueError: If the file is not a valid SKIX file
+        """
+        if sys.byteorder != "little":
+            raise ValueError("MmapSortedIndex needs a little-endian host")
+        with open(path, "rb") as f:
+            size = f.seek(0, 2)
+            if size < HEADER.size:
+                raise ValueError(f"{path} is too small to be an index file")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, raw_typecode, count = HEADER.unpack_from(self._mm)
+        # Compare raw bytes: a corrupt byte may not even decode
+        if magic != MAGIC or version != VERSION or raw_typecode not in TYPECODES.encode():
+            self._mm.close()
+            raise ValueError(f"{path} is not a version {VERSION} index file")
+        typecode = raw_typecode.decode()
+        itemsize = struct.calcsize(typecode)
+        end = HEADER.size + count * itemsize
+        if end > size:
+            self._mm.close()
+            raise ValueError(f"{path} is truncated")
+
+        self._raw = memoryview(self._mm)
+        self.keys = self._raw[HEADER.size:end].cast(typecode)
+        self.typecode = typecode
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, target: int) -> bool:
+        return self.search(target) != -1
+
+    def __enter__(self) -> "MmapSortedIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the memoryviews and unmap the file."""
+        if self._mm.closed:
+            return
+        self.keys.release()
+        self._raw.release()
+        self._mm.close()
+
+    def search(self, target: int) -> int:
+        """binary_search_iterative over the mapped keys."""
+        return binary_search_iterative(self.keys, target)
+
+    def find_first_occurrence(self, target: int) -> int:
+        """find_first_occurrence over the mapped keys."""
+        return find_first_occurrence(self.keys, target)
+
+    def find_last_occurrence(self, target: int) -> int:
+        """find_last_occurrence over the mapped keys."""
+        return find_last_occurrence(self.keys, target)
+
+    def find_insertion_position(self, target: int) -> int:
+        """find_insertion_position over the mapped keys."""
+        return find_insertion_position(self.keys, target)
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    print("=" * 60)
+    print("MEMORY-MAPPED SORTED INDEX - DEMO")
+    print("=" * 60)
+
+    path = os.path.join(tempfile.mkdtemp(), "keys.skix")
+    n = write_sorted_index(path, range(0, 20_000_000, 2))
+    print(f"\nWrote {n:,} keys to {path} ({os.path.getsize(path):,} bytes)")
+
+    with MmapSortedIndex(path) as index:
+        print(f"   search 1000: {index.search(1000)} (expected: 500)")
+        print(f"   search 1001: {index.search(1001)} (expected: -1)")
+        print(f"   insert 1001: {index.find_insertion_position(1001)} (expected: 501)")
+    os.remove(path)
+
+    print("\n" + "=" * 60)
@@ -0,0 +1,183 @@
+"""
+Predicate (Answer-Space) Binary Search
+
+Algorithm Overview:
+Binary search does not need an array. It works on any MONOTONE predicate
+over a range of integers - one that is False, False, ..., False, True, ...,
+True - and finds the first True. Typical uses:
+- smallest capacity that ships all packages in D days
+- first build/commit where a test starts failing
+- smallest batch size that saturates a GPU
+
+The loop is the same as binary_search_iterative, except "arr[mid] == target"
+becomes "predicate(mid)":
+
+    while left <= right:
+        mid = left + (right - left) // 2
+        if predicate(mid): answer = mid; right = mid - 1
+        else:              left = mid + 1
+
+When each probe is expensive (milliseconds or more) two things help:
+1. Memoization - never evaluate the same x twice, even across searches.
+2. k-ary search - probe k-1 evenly spaced points AT THE SAME TIME on a
+   thread/process pool. The interval shrinks k-fold per round, so the
+   wall-clock depth drops from log2(n) to log_k(n) rounds.
+
+Time Complexity: O(log n) probes (binary), O(log_k n) rounds (k-ary)
+Space Complexity: O(1), plus the memo if one is passed
+
+Run the demo with: python -m searching.predicate_search
+"""
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+Predicate = Callable[[int], bool]
+
+
+def find_first_true(
+    predicate: Predicate, lo: int, hi: int, memo: Optional[Dict[int, bool]] = None
+) -> Optional[int]:
+    """
+    Smallest x in [lo, hi] with predicate(x) True.
+
+    HINT:
+    - Same loop as binary_search_iterative
+    - When predicate(mid) is True, remember mid and keep searching LEFT
+    - Look up / store every evaluation in memo if one is given
+
+    Args:
+        predicate: Monotone function (False...False True...True) over [lo, hi]
+        lo: Smallest candidate (inclusive)
+        hi: Largest candidate (inclusive)
+        memo: Optional dict of already evaluated points, updated in place
+
+    Returns:
+        The first x where predicate(x) is True, None if there is none
+
+    Example:
+        find_first_true(lambda x: x * x >= 50, 0, 100) -> 8
+    """
+    answer = None
+    left = lo
+    right = hi
+    while left <= right:
+        mid = left + (right - left) // 2
+        if memo is None:
+            ok = predicate(mid)
+        elif mid in memo:
+            ok = memo[mid]
+        else:
+            ok = memo[mid] = bool(predicate(mid))
+        if ok:
+            answer = mid
+            right = mid - 1
+        else:
+            left = mid + 1
+    return answer
+
+
+def _round_points(left: int, right: int, k: int) -> List[int]:
+    """
+    Points to probe in one k-ary round over [left, right].
+
+    Splits the interval into k parts with k - 1 probes. If the interval is
+    already smaller than k, simply probe all of it.
+    """
+    width = right - left + 1
+    if width < k:
+        return list(range(left, right + 1))
+    return [left + (i * width) // k for i in range(1, k)]
+
+
+def find_first_true_parallel(
+    predicate: Predicate,
+    lo: int,
+    hi: int,
+    k: int = 4,
+    executor: Optional[Executor] = None,
+    memo: Optional[Dict[int, bool]] = None,
+) -> Optional[int]:
+    """
+    k-ary version of find_first_true that evaluates k - 1 probes concurrently.
+
+    HINT:
+    - Each round probes the k - 1 points from _round_points in parallel
+    - If the first True is at points[j], the answer is in
+      (points[j - 1], points[j]] - everything else is discarded
+    - If no point is True, the answer is after the last point
+
+    Args:
+        predicate: Monotone function over [lo, hi]. Must be picklable when
+            a ProcessPoolExecutor is used (e.g. a module-level function).
+        lo: Smallest candidate (inclusive)
+        hi: Largest candidate (inclusive)
+        k: Branching factor (k - 1 concurrent probes per round), at least 2
+        executor: Pool to run probes on; a thread pool is created if None
+        memo: Optional dict of already evaluated points, updated in place
+
+    Returns:
+        The first x where predicate(x) is True, None if there is none
+
+    Example:
+        with ProcessPoolExecutor(7) as pool:
+            find_first_true_parallel(is_broken, 0, 10_000, k=8, executor=pool)
+    """
+    if k < 2:
+        raise ValueError("k must be at least 2")
+    if memo is None:
+        memo = {}
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=k - 1) as pool:
+            return find_first_true_parallel(predicate, lo, hi, k, pool, memo)
+
+    answer = None
+    left = lo
+    right = hi
+    while left <= right:
+        points = _round_points(left, right, k)
+        pending = [x for x in points if x not in memo]
+        for x, ok in zip(pending, executor.map(predicate, pending)):
+            memo[x] = bool(ok)
+
+        first_true = None
+        for j, x in enumerate(points):
+            if memo[x]:
+                first_true = j
+                break
+
+        if first_true is None:
+            left = points[-1] + 1
+        else:
+            answer = points[first_true]
+            right = answer - 1
+            if first_true > 0:
+                left = points[first_true - 1] + 1
+    return answer
+
+
+if __name__ == "__main__":
+    import time
+
+    print("=" * 60)
+    print("PREDICATE BINARY SEARCH - TEST YOUR IMPLEMENTATION")
+    print("=" * 60)
+
+    print(f"\n   First x with x*x >= 50: {find_first_true(lambda x: x * x >= 50, 0, 100)} (expected: 8)")
+    print(f"   Never true: {find_first_true(lambda x: False, 0, 100)} (expected: None)")
+
+    def slow_check(x: int) -> bool:
+        time.sleep(0.01)
+        return x >= 700_001
+
+    memo: Dict[int, bool] = {}
+    start = time.perf_counter()
+    result = find_first_true(slow_check, 0, 1_000_000, memo=memo)
+    print(f"\nBinary:  {result} in {time.perf_counter() - start:.2f}s, {len(memo)} probes")
+    for k in (4, 8, 16):
+        memo = {}
+        start = time.perf_counter()
+        result = find_first_true_parallel(slow_check, 0, 1_000_000, k=k, memo=memo)
+        print(f"k={k:<3}   {result} in {time.perf_counter() - start:.2f}s, {len(memo)} probes")
+
+    print("\n" + "=" * 60)
@@ -0,0 +1,342 @@
+"""
+SortedList - Mutable Sorted Container Built on Binary Search
+
+Algorithm Overview:
+Keeping a plain Python list sorted with list.insert at the position from
+find_insertion_position is O(n) per insert (everything after the position
+shifts), which collapses at around 10^6 elements.
+
+Instead we keep the elements in many small sorted buckets:
+
+    buckets: [[1, 3, 4], [7, 9, 12], [15, 20]]
+    maxes:   [4, 12, 20]
+
+- To find a value, binary search maxes to pick the bucket, then binary search
+  inside the bucket.
+- Inserting only shifts elements inside one bucket (at most 2 * load).
+- A bucket that grows past 2 * load is split in half; one that shrinks
+  below load / 2 is merged into its neighbour.
+- A Fenwick (binary indexed) tree over bucket lengths turns
+  "how many elements are before bucket i" and "which bucket holds
+  position k" into O(log B) queries, which gives rank and indexing.
+
+Time Complexity (B = number of buckets, L = load):
+    add / remove: O(log n + L)    (L ~ sqrt n keeps this O(sqrt n))
+    search / rank / index: O(log n)
+    bulk load from sorted input: O(n)
+Space Complexity: O(n)
+
+Run the benchmark with: python -m searching.sorted_list
+"""
+
+from typing import Any, Iterable, Iterator, List, Optional
+
+from searching.binary_search import _lower_bound, _upper_bound
+
+DEFAULT_LOAD = 1000
+
+
+class SortedList:
+    """
+    Sorted container with fast insert, delete, rank and search.
+
+    Example:
+        sl = SortedList([5, 1, 3])
+        sl.add(2)                     # [1, 2, 3, 5]
+        sl.find_insertion_position(4)  # 3
+        sl.remove(3)                  # [1, 2, 5]
+        sl[1]                         # 2
+    """
+
+    def __init__(self, iterable: Optional[Iterable[Any]] = None, load: int = DEFAULT_LOAD):
+        """
+        Args:
+            iterable: Initial values in any order (sorted once up front)
+            load: Target bucket size; buckets hold between load/2 and 2*load
+        """
+        if load < 2:
+            raise ValueError("load must be at least 2")
+        self._load = load
+        self._buckets: List[List[Any]] = []
+        self._maxes: List[Any] = []
+        self._tree: List[int] = [0]
+        self._len = 0
+        if iterable is not None:
+            self._bulk_load(sorted(iterable))
+
+    @classmethod
+    def from_sorted(cls, iterable: Iterable[Any], load: int = DEFAULT_LOAD) -> "SortedList":
+        """
+        Build from an already sorted iterable in O(n) without re-sorting.
+
+        Raises:
+            ValueError: If the input is not sorted
+        """
+        values = list(iterable)
+        for i in range(1, len(values)):
+            if values[i - 1] > values[i]:
+                raise ValueError("from_sorted requires sorted input")
+        sl = cls(load=load)
+        sl._bulk_load(values)
+        return sl
+
+    def _bulk_load(self, values: List[Any]) -> None:
+        load = self._load
+        self._buckets = [values[i:i + load] for i in range(0, len(values), load)]
+        self._maxes = [bucket[-1] for bucket in self._buckets]
+        self._len = len(values)
+        self._rebuild_tree()
+
+    # ------------------------------------------------------------------
+    # Fenwick tree over bucket lengths
+    # ------------------------------------------------------------------
+
+    def _rebuild_tree(self) -> None:
+        """Rebuild the Fenwick tree in O(B) after buckets are split/merged."""
+        size = len(self._buckets)
+        tree = [0] * (size + 1)
+        for i, bucket in enumerate(self._buckets, 1):
+            tree[i] += len(bucket)
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _tree_add(self, bucket: int, delta: int) -> None:
+        tree = self._tree
+        i = bucket + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _count_before(self, bucket: int) -> int:
+        """Number of elements stored in buckets [0, bucket)."""
+        tree = self._tree
+        total = 0
+        i = bucket
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def _locate(self, index: int):
+        """(bucket, offset) of the element at position index (0 <= index < len)."""
+        tree = self._tree
+        bucket = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            nxt = bucket + step
+            if nxt < len(tree) and tree[nxt] <= index:
+                bucket = nxt
+                index -= tree[nxt]
+            step >>= 1
+        return bucket, index
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def add(self, value: Any) -> None:
+        """Insert value, keeping the list sorted."""
+        if not self._buckets:
+            self._buckets.append([value])
+            self._maxes.append(value)
+            self._len = 1
+            self._rebuild_tree()
+            return
+        b = _lower_bound(self._maxes, value, 0, len(self._maxes))
+        if b == len(self._maxes):
+            b -= 1
+            self._maxes[b] = value
+            self._buckets[b].append(value)
+        else:
+            bucket = self._buckets[b]
+            bucket.insert(_upper_bound(bucket, value, 0, len(bucket)), value)
+        self._len += 1
+
+        if len(self._buckets[b]) > 2 * self._load:
+            bucket = self._buckets[b]
+            half = len(bucket) // 2
+            self._buckets[b:b + 1] = [bucket[:half], bucket[half:]]
+            self._maxes[b:b + 1] = [bucket[half - 1], bucket[-1]]
+            self._rebuild_tree()
+        else:
+            self._tree_add(b, 1)
+
+    def update(self, values: Iterable[Any]) -> None:
+        """Insert many values."""
+        values = list(values)
+        if len(values) > self._len:
+            self._bulk_load(sorted(list(self) + values))
+        else:
+            for value in values:
+                self.add(value)
+
+    def _delete(self, b: int, offset: int) -> None:
+        """Remove buckets[b][offset] and rebalance."""
+        bucket = self._buckets[b]
+        del bucket[offset]
+        self._len -= 1
+        if not bucket:
+            del self._buckets[b]
+            del self._maxes[b]
+            self._rebuild_tree()
+            return
+        self._maxes[b] = bucket[-1]
+        if len(bucket) < self._load // 2 and len(self._buckets) > 1:
+            # Merge into a neighbour, splitting again if that overflows
+            if b == len(self._buckets) - 1:
+                b -= 1
+            merged = self._buckets[b] + self._buckets[b + 1]
+            if len(merged) > 2 * self._load:
+                half = len(merged) // 2
+                self._buckets[b:b + 2] = [merged[:half], merged[half:]]
+                self._maxes[b:b + 2] = [merged[half - 1], merged[-1]]
+            else:
+                self._buckets[b:b + 2] = [merged]
+                self._maxes[b:b + 2] = [merged[-1]]
+            self._rebuild_tree()
+        else:
+            self._tree_add(b, -1)
+
+    def discard(self, value: Any) -> bool:
+        """Remove one copy of value if present. Returns True if removed."""
+        b = _lower_bound(self._maxes, value, 0, len(self._maxes))
+        if b == len(self._maxes):
+            return False
+        bucket = self._buckets[b]
+        offset = _lower_bound(bucket, value, 0, len(bucket))
+        if bucket[offset] != value:
+            return False
+        self._delete(b, offset)
+        return True
+
+    def remove(self, value: Any) -> None:
+        """Remove one copy of value. Raises ValueError if missing."""
+        if not self.discard(value):
+            raise ValueError(f"{value!r} not in SortedList")
+
+    def pop(self, index: int = -1) -> Any:
+        """Remove and return the element at position index."""
+        index = self._normalize(index)
+        b, offset = self._locate(index)
+        value = self._buckets[b][offset]
+        self._delete(b, offset)
+        return value
+
+    def __delitem__(self, index: int) -> None:
+        self.pop(index)
+
+    # ------------------------------------------------------------------
+    # Queries (same semantics as searching/binary_search.py)
+    # ------------------------------------------------------------------
+
+    def find_insertion_position(self, value: Any) -> int:
+        """Index where value would be inserted (before existing copies)."""
+        b = _lower_bound(self._maxes, value, 0, len(self._maxes))
+        if b == len(self._maxes):
+            return self._len
+        bucket = self._buckets[b]
+        return self._count_before(b) + _lower_bound(bucket, value, 0, len(bucket))
+
+    def rank(self, value: Any) -> int:
+        """Number of elements strictly less than value."""
+        return self.find_insertion_position(value)
+
+    def _upper_position(self, value: Any) -> int:
+        """Number of elements less than or equal to value."""
+        b = _upper_bound(self._maxes, value, 0, len(self._maxes))
+        if b == len(self._maxes):
+            return self._len
+        bucket = self._buckets[b]
+        return self._count_before(b) + _upper_bound(bucket, value, 0, len(bucket))
+
+    def find_first_occurrence(self, value: Any) -> int:
+        """Index of the first copy of value, -1 if not found."""
+        pos = self.find_insertion_position(value)
+        if pos < self._len and self[pos] == value:
+            return pos
+        return -1
+
+    def find_last_occurrence(self, value: Any) -> int:
+        """Index of the last copy of value, -1 if not found."""
+        pos = self._upper_position(value) - 1
+        if pos >= 0 and self[pos] == value:
+            return pos
+        return -1
+
+    def search(self, value: Any) -> int:
+        """Same contract as binary_search_iterative (first copy, or -1)."""
+        return self.find_first_occurrence(value)
+
+    def count(self, value: Any) -> int:
+        """Number of copies of value."""
+        return self._upper_position(value) - self.find_insertion_position(value)
+
+    # ------------------------------------------------------------------
+    # Sequence protocol
+    # ------------------------------------------------------------------
+
+    def _normalize(self, index: int) -> int:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedList index out of range")
+        return index
+
+    def __getitem__(self, index: int) -> Any:
+        b, offset = self._locate(self._normalize(index))
+        return self._buckets[b][offset]
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __contains__(self, value: Any) -> bool:
+        b = _lower_bound(self._maxes, value, 0, len(self._maxes))
+        if b == len(self._maxes):
+            return False
+        bucket = self._buckets[b]
+        offset = _lower_bound(bucket, value, 0, len(bucket))
+        return bucket[offset] == value
+
+    def __iter__(self) -> Iterator[Any]:
+        for bucket in self._buckets:
+            yield from bucket
+
+    def __repr__(self) -> str:
+        return f"SortedList({list(self)!r})"
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from searching.binary_search import find_insertion_position
+
+    print("=" * 60)
+    print("SORTED LIST - INSERT BENCHMARK")
+    print("=" * 60)
+
+    for n in (10**4, 10**5, 10**6):
+        values = [random.randrange(10 * n) for _ in range(n)]
+        print(f"\nn={n:,} random inserts")
+
+        if n <= 10**5:
+            start = time.perf_counter()
+            plain: List[int] = []
+            for v in values:
+                plain.insert(find_insertion_position(plain, v), v)
+            print(f"   list.insert at find_insertion_position: {time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        sl = SortedList()
+        for v in values:
+            sl.add(v)
+        print(f"   SortedList.add:                         {time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        for v in values[:10_000]:
+            sl.rank(v)
+        print(f"   10k rank queries:                        {time.perf_counter() - start:.2f}s")
+
+    print("\n" + "=" * 60)
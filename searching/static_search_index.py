@@ -0,0 +1,208 @@
+"""
+Static Search Index - Eytzinger (BFS) Layout for Sorted Arrays
+
+Algorithm Overview:
+A plain binary search jumps all over a sorted array: the first probe is in
+the middle, the second a quarter away, and so on. On arrays of 10^7+ keys
+almost every probe is a cache miss.
+
+The Eytzinger layout stores the same keys in the order of a breadth-first
+walk of the implicit binary search tree:
+
+    sorted:     [1, 2, 3, 4, 5, 6, 7]
+    eytzinger:  [_, 4, 2, 6, 1, 3, 5, 7]    (1-indexed, slot 0 unused)
+
+Node k has children 2k and 2k+1, so the first few levels of the tree sit
+next to each other in memory and the descent only moves forward. The search
+is branch-free:
+
+    k = 1
+    while k <= n:
+        k = 2 * k + (b[k] < target)
+
+When the loop exits, k has walked past a leaf. The lower bound is the last
+node where we went LEFT, which we recover by stripping the trailing 1-bits
+(right turns) plus one more bit from k.
+
+Keys and their original positions live in compact array.array buffers
+(8 bytes per key instead of ~36 for a list of Python ints).
+
+Time Complexity: O(n) build, O(log n) per query
+Space Complexity: O(n) - two machine-word arrays
+
+Run the benchmark with: python -m searching.static_search_index
+"""
+
+from array import array
+from typing import Iterable
+
+
+class StaticSearchIndex:
+    """
+    Read-only search index over a sorted sequence of integers.
+
+    Exposes the same semantics as the functions in searching/binary_search.py:
+    search, find_first_occurrence, find_last_occurrence and
+    find_insertion_position.
+
+    Example:
+        index = StaticSearchIndex([1, 2, 2, 2, 3, 4])
+        index.find_first_occurrence(2)    # 1
+        index.find_last_occurrence(2)     # 3
+        index.find_insertion_position(5)  # 6
+    """
+
+    def __init__(self, sorted_keys: Iterable[int], typecode: str = "q"):
+        """
+        Build the index from an already sorted iterable.
+
+        Args:
+            sorted_keys: Keys in non-decreasing order
+            typecode: array.array typecode used to store keys (default 'q')
+
+        Raises:
+            ValueError: If the keys are not sorted
+        """
+        keys = array(typecode, sorted_keys)
+        n = len(keys)
+        for i in range(1, n):
+            if keys[i - 1] > keys[i]:
+                raise ValueError("StaticSearchIndex requires sorted input")
+
+        self._n = n
+        self._keys = array(typecode, bytes(keys.itemsize * (n + 1)))
+        self._positions = array("q", bytes(8 * (n + 1)))
+        self._build(keys)
+
+    def _build(self, keys: array) -> None:
+        """
+        Fill the Eytzinger layout with an iterative in-order traversal.
+
+        Visiting the implicit tree in-order yields slots in sorted order,
+        so the i-th visited slot receives keys[i].
+        """
+        n = self._n
+        i = 0
+        stack = []
+        k = 1
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k *= 2
+            k = stack.pop()
+            self._keys[k] = keys[i]
+            self._positions[k] = i
+            i += 1
+            k = 2 * k + 1
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __contains__(self, target: int) -> bool:
+        return self.search(target) != -1
+
+    def _lower_bound_slot(self, target: int) -> int:
+        """Eytzinger slot of the first key >= target (0 if none)."""
+        b = self._keys
+        n = self._n
+        k = 1
+        while k <= n:
+            k = 2 * k + (b[k] < target)
+        return k >> ((~k) & (k + 1)).bit_length()
+
+    def _upper_bound_slot(self, target: int) -> int:
+        """Eytzinger slot of the first key > target (0 if none)."""
+        b = self._keys
+        n = self._n
+        k = 1
+        while k <= n:
+            k = 2 * k + (b[k] <= target)
+        return k >> ((~k) & (k + 1)).bit_length()
+
+    def find_insertion_position(self, target: int) -> int:
+        """
+        Index where target should be inserted to keep the keys sorted.
+
+        Example:
+            StaticSearchIndex([1, 3, 5, 7]).find_insertion_position(4) -> 2
+        """
+        k = self._lower_bound_slot(target)
+        return self._positions[k] if k else self._n
+
+    def find_first_occurrence(self, target: int) -> int:
+        """
+        Index of the first occurrence of target, -1 if not found.
+
+        Example:
+            StaticSearchIndex([1, 2, 2, 2, 3]).find_first_occurrence(2) -> 1
+        """
+        k = self._lower_bound_slot(target)
+        if k and self._keys[k] == target:
+            return self._positions[k]
+        return -1
+
+    def find_last_occurrence(self, target: int) -> int:
+        """
+        Index of the last occurrence of target, -1 if not found.
+
+        Example:
+            StaticSearchIndex([1, 2, 2, 2, 3]).find_last_occurrence(2) -> 3
+        """
+        if self.find_first_occurrence(target) == -1:
+            return -1
+        return self.find_upper_bound(target) - 1
+
+    def find_upper_bound(self, target: int) -> int:
+        """Index of the first key strictly greater than target."""
+        k = self._upper_bound_slot(target)
+        return self._positions[k] if k else self._n
+
+    def search(self, target: int) -> int:
+        """
+        Same contract as binary_search_iterative: an index of target or -1.
+
+        With duplicates the first occurrence is returned.
+        """
+        return self.find_first_occurrence(target)
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from searching.binary_search import (
+        binary_search_iterative,
+        find_first_occurrence,
+        find_insertion_position,
+    )
+
+    print("=" * 60)
+    print("STATIC SEARCH INDEX - LOOKUP LATENCY")
+    print("=" * 60)
+
+    queries_per_size = 200_000
+    for n in (10**3, 10**5, 10**6, 10**7):
+        keys = list(range(0, 2 * n, 2))
+        start = time.perf_counter()
+        index = StaticSearchIndex(keys)
+        build_time = time.perf_counter() - start
+        queries = [random.randrange(2 * n) for _ in range(queries_per_size)]
+
+        rows = [
+            ("binary_search_iterative", lambda q: binary_search_iterative(keys, q)),
+            ("index.search", index.search),
+            ("find_first_occurrence", lambda q: find_first_occurrence(keys, q)),
+            ("index.find_first_occurrence", index.find_first_occurrence),
+            ("find_insertion_position", lambda q: find_insertion_position(keys, q)),
+            ("index.find_insertion_position", index.find_insertion_position),
+        ]
+        print(f"\nn={n:,} (build {build_time:.2f}s)")
+        for name, fn in rows:
+            start = time.perf_counter()
+            for q in queries:
+                fn(q)
+            elapsed = time.perf_counter() - start
+            print(f"   {name:<30} {elapsed / queries_per_size * 1e9:8.0f} ns/lookup")
+        del index, keys
+
+    print("\n" + "=" * 60)
@@ -0,0 +1,27 @@
+"""
+Shared pytest setup.
+
+Tests marked @pytest.mark.benchmark pass or fail on wall-clock timings, so
+they are skipped unless asked for: pytest tests/ --run-benchmarks
+"""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption("--run-benchmarks", action="store_true",
+                     help="also run tests that gate on wall-clock timings")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "benchmark: depends on wall-clock timings (run with --run-benchmarks)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="timing-based, run with --run-benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
@@ -0,0 +1,116 @@
+"""
+Unit tests for batched binary search
+Run with: pytest tests/test_batch_search.py -v
+"""
+
+import random
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from searching.batch_search import (
+    count_range_many,
+    search_many,
+    search_many_first,
+    search_many_last,
+    search_many_insertion
+)
+from searching.binary_search import (
+    find_first_occurrence,
+    find_last_occurrence,
+    find_insertion_position,
+    count_range
+)
+
+
+class TestSearchMany:
+    """Test batched exact search"""
+
+    def test_basic(self):
+        """Test found and missing targets keep query order"""
+        arr = [1, 3, 5, 7, 9, 11]
+        assert search_many(arr, [7, 10, 1, 11]) == [3, -1, 0, 5]
+
+    def test_empty_inputs(self):
+        """Test empty array and empty query batch"""
+        assert search_many([], [1, 2]) == [-1, -1]
+        assert search_many([1, 2, 3], []) == []
+
+    def test_empty_inputs_numpy_backend(self):
+        """Test empty array and empty batch on the NumPy backend"""
+        pytest.importorskip("numpy")
+        assert search_many([], [1, 2], backend="numpy") == [-1, -1]
+        assert search_many([1, 2, 3], [], backend="numpy") == []
+        assert search_many([], [], backend="numpy") == []
+        assert search_many_last([], [4], backend="numpy") == [-1]
+        assert search_many_insertion([], [4, 0], backend="numpy") == [0, 0]
+        assert count_range_many([1, 2], [], backend="numpy") == []
+        assert count_range_many([], [(0, 5)], backend="numpy") == [0]
+
+    def test_duplicate_queries(self):
+        """Test repeated targets in the batch"""
+        arr = [2, 4, 6]
+        assert search_many(arr, [4, 4, 5, 4]) == [1, 1, -1, 1]
+
+    def test_invalid_backend(self):
+        """Test unknown backend is rejected"""
+        with pytest.raises(ValueError):
+            search_many([1, 2], [1], backend="gpu")
+
+
+class TestBatchAgreesWithSingle:
+    """Batched results must match the single-query functions"""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_random(self, seed):
+        rng = random.Random(seed)
+        arr = sorted(rng.randrange(50) for _ in range(rng.randrange(1, 80)))
+        queries = [rng.randrange(-5, 55) for _ in range(200)]
+
+        assert search_many_first(arr, queries, backend="python") == [
+            find_first_occurrence(arr, q) for q in queries
+        ]
+        assert search_many_last(arr, queries, backend="python") == [
+            find_last_occurrence(arr, q) for q in queries
+        ]
+        assert search_many_insertion(arr, queries, backend="python") == [
+            find_insertion_position(arr, q) for q in queries
+        ]
+
+    def test_all_same(self):
+        """Test array where every element is equal"""
+        arr = [5] * 10
+        assert search_many_first(arr, [5, 4, 6]) == [0, -1, -1]
+        assert search_many_last(arr, [5, 4, 6]) == [9, -1, -1]
+        assert search_many_insertion(arr, [5, 4, 6]) == [0, 0, 10]
+
+
+class TestCountRangeMany:
+    """Test batched range counts"""
+
+    def test_basic(self):
+        """Test counts keep query order"""
+        arr = [1, 2, 2, 2, 3, 4]
+        assert count_range_many(arr, [(2, 3), (5, 9), (0, 1)]) == [4, 0, 1]
+
+    def test_inverted_and_empty(self):
+        """Test lo > hi and empty inputs"""
+        assert count_range_many([1, 2, 3], [(3, 1)]) == [0]
+        assert count_range_many([], [(0, 5)]) == [0]
+        assert count_range_many([1, 2], []) == []
+
+    def test_matches_count_range(self):
+        """Test agreement with count_range"""
+        rng = random.Random(3)
+        arr = sorted(rng.randrange(30) for _ in range(60))
+        ranges = [(rng.randrange(-2, 32), rng.randrange(-2, 32)) for _ in range(100)]
+        assert count_range_many(arr, ranges, backend="python") == [
+            count_range(arr, lo, hi) for lo, hi in ranges
+        ]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,143 @@
+"""
+Test suite for the statistical benchmark runner.
+
+Run with: pytest tests/test_benchmark.py -v
+"""
+
+import gc
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from python_concepts.benchmark import (
+    BenchmarkResult,
+    benchmark,
+    compare,
+    format_comparison,
+    load_results,
+    main,
+    percentile,
+    save_results,
+)
+
+
+class TestStatistics:
+    """Tests for percentile and BenchmarkResult statistics."""
+
+    def test_percentile_interpolates(self):
+        values = [1.0, 2.0, 3.0, 4.0]
+        assert percentile(values, 0) == 1.0
+        assert percentile(values, 50) == 2.5
+        assert percentile(values, 100) == 4.0
+
+    def test_percentile_empty(self):
+        with pytest.raises(ValueError):
+            percentile([], 50)
+
+    def test_summary(self):
+        result = BenchmarkResult("f", 1, [1.0, 2.0, 3.0, 4.0, 5.0])
+        assert result.mean == 3.0
+        assert result.median == 3.0
+        assert result.p95 == pytest.approx(4.8)
+        assert result.stddev == pytest.approx(1.5811, rel=1e-4)
+        assert result.outliers == 0
+
+    def test_outliers(self):
+        result = BenchmarkResult("f", 1, [1.0] * 10 + [1.1] * 10 + [50.0])
+        assert result.outliers == 1
+        assert result.median == pytest.approx(1.1)
+        assert result.mean > 3
+
+
+class TestBenchmark:
+    """Tests for benchmark()."""
+
+    def test_calibrates_loops_for_fast_functions(self):
+        result = benchmark(abs, -1, repeat=3, min_time=0.001)
+        assert result.loops > 1
+        assert len(result.samples) == 3
+        assert result.name == "abs"
+
+    def test_fixed_loops_and_kwargs(self):
+        calls = []
+
+        def f(x, scale=1):
+            calls.append(x * scale)
+
+        result = benchmark(f, 2, scale=3, repeat=2, loops=5, warmup=1, name="f3")
+        assert result.name == "f3"
+        assert result.loops == 5
+        assert calls == [6] * 11
+
+    def test_gc_state_restored(self):
+        assert gc.isenabled()
+
+        def boom():
+            if not gc.isenabled():
+                raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            benchmark(boom, warmup=0, loops=1)
+        assert gc.isenabled()
+
+    def test_invalid_repeat(self):
+        with pytest.raises(ValueError):
+            benchmark(abs, 1, repeat=0)
+
+
+class TestCompare:
+    """Tests for JSON results and regression detection."""
+
+    def test_json_round_trip(self, tmp_path):
+        path = str(tmp_path / "results.json")
+        save_results([BenchmarkResult("f", 4, [1.0, 2.0])], path)
+        (loaded,) = load_results(path)
+        assert (loaded.name, loaded.loops, loaded.samples) == ("f", 4, [1.0, 2.0])
+
+    def test_flags_regressions(self):
+        before = [BenchmarkResult("a", 1, [1.0]), BenchmarkResult("b", 1, [1.0]),
+                  BenchmarkResult("gone", 1, [1.0])]
+        after = [BenchmarkResult("a", 1, [1.2]), BenchmarkResult("b", 1, [0.5]),
+                 BenchmarkResult("new", 1, [1.0])]
+        by_name = {c.name: c for c in compare(before, after, threshold=0.1)}
+        assert set(by_name) == {"a", "b", "gone", "new"}
+        assert by_name["a"].regression
+        assert by_name["a"].change == pytest.approx(0.2)
+        assert by_name["b"].improvement
+        assert by_name["b"].verdict == "faster"
+
+    def test_unmatched_names_reported(self):
+        before = [BenchmarkResult("a", 1, [1.0]), BenchmarkResult("old_name", 1, [1.0])]
+        after = [BenchmarkResult("a", 1, [1.0]), BenchmarkResult("new_name", 1, [1.0])]
+        comparisons = compare(before, after)
+        by_name = {c.name: c for c in comparisons}
+        assert not by_name["a"].unmatched
+        assert by_name["old_name"].unmatched and by_name["old_name"].current is None
+        assert by_name["new_name"].unmatched and by_name["new_name"].baseline is None
+        assert not any(c.regression for c in comparisons)
+        table = format_comparison(comparisons)
+        assert "MISSING from current" in table
+        assert "only in current" in table
+
+    def test_cli_fail_on_missing(self, tmp_path, capsys):
+        before, after = str(tmp_path / "before.json"), str(tmp_path / "after.json")
+        save_results([BenchmarkResult("a", 1, [1.0]), BenchmarkResult("b", 1, [1.0])], before)
+        save_results([BenchmarkResult("a", 1, [1.0])], after)
+        assert main(["compare", before, after]) == 0
+        assert main(["compare", before, after, "--fail-on-missing"]) == 1
+        assert "MISSING" in capsys.readouterr().out
+
+    def test_cli_exit_code(self, tmp_path, capsys):
+        before, after = str(tmp_path / "before.json"), str(tmp_path / "after.json")
+        save_results([BenchmarkResult("a", 1, [1.0])], before)
+        save_results([BenchmarkResult("a", 1, [1.5])], after)
+        assert main(["compare", before, after]) == 1
+        assert "REGRESSION" in capsys.readouterr().out
+        assert main(["compare", before, after, "--threshold", "1.0"]) == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,93 @@
+"""
+Test suite for the benchmark suite (a small, fast sweep).
+
+Run with: pytest tests/test_benchmarks.py -v
+The timing gates are marked benchmark: add --run-benchmarks to run them.
+"""
+
+import json
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.__main__ import main
+from benchmarks.cases import CASES, select
+from benchmarks.suite import (
+    check_regressions,
+    check_scaling,
+    format_tables,
+    run_suite,
+    scaling_exponent,
+)
+
+GATED = ["binary_search_iterative", "two_sum_hash_map", "squares"]
+SIZES = [10**2, 10**3, 10**4]
+
+
+@pytest.fixture(scope="module")
+def report():
+    return run_suite(select(GATED), SIZES, repeat=3, min_time=0.005)
+
+
+class TestCases:
+    """Tests for the case registry."""
+
+    def test_every_case_runs_on_small_input(self):
+        for case in CASES:
+            case.func(*case.make_args(10))
+
+    def test_select_by_group(self):
+        assert {c.group for c in select(["searching"])} == {"searching"}
+
+    def test_select_unknown(self):
+        with pytest.raises(ValueError):
+            select(["no_such_case"])
+
+
+class TestSuite:
+    """Tests for the sweep, report and gates."""
+
+    def test_report_rows(self, report):
+        assert {(r["case"], r["n"]) for r in report["results"]} == {
+            (name, n) for name in GATED for n in SIZES
+        }
+        assert all(r["median"] > 0 and r["peak_bytes"] is not None for r in report["results"])
+        json.dumps(report)
+        assert "two_sum_hash_map" in format_tables(report)
+
+    @pytest.mark.benchmark
+    def test_scaling_within_declared_complexity(self, report):
+        assert check_scaling(report) == []
+
+    def test_scaling_exponent(self):
+        rows = [{"n": n, "median": n * n * 1e-9} for n in SIZES]
+        assert scaling_exponent(rows) == pytest.approx(2.0)
+        assert scaling_exponent(rows[:2]) is None
+
+    def test_scaling_flags_faster_growth(self, report):
+        slow = dict(report, scaling={"f": {"complexity": "n", "expected": 1.0, "measured": 2.0}})
+        assert len(check_scaling(slow)) == 1
+
+    def test_regressions_against_baseline(self, report):
+        assert check_regressions(report, report) == []
+        faster_baseline = dict(report, results=[
+            dict(r, median=r["median"] / 2) for r in report["results"]
+        ])
+        assert len(check_regressions(report, faster_baseline, tolerance=0.25)) == len(GATED) * 3
+        assert check_regressions(report, faster_baseline, tolerance=1.5) == []
+
+    @pytest.mark.benchmark
+    def test_cli(self, tmp_path, capsys):
+        output = str(tmp_path / "report.json")
+        args = ["binary_search_iterative", "--quick", "--repeat", "2",
+                "--output", output]
+        assert main(args) == 0
+        assert main(args[:-2] + ["--baseline", output, "--tolerance", "10"]) == 0
+        assert "all checks passed" in capsys.readouterr().out
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
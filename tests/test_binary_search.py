@@ -17,7 +17,9 @@ from searching.binary_search import (
     binary_search_recursive,
     find_first_occurrence,
     find_last_occurrence,
-    find_insertion_position
+    find_insertion_position,
+    equal_range,
+    count_range
 )
 
 
@@ -218,5 +220,68 @@ class TestInsertionPosition:
         assert find_insertion_position(arr, 1) == 0
 
 
+class TestEqualRange:
+    """Test fused first/last occurrence"""
+
+    def test_duplicates_middle(self):
+        """Test slice covering duplicates in middle"""
+        arr = [1, 2, 2, 2, 3, 4, 5]
+        assert equal_range(arr, 2) == (1, 4)
+
+    def test_single_occurrence(self):
+        """Test slice of length one"""
+        arr = [1, 2, 3, 4, 5]
+        assert equal_range(arr, 5) == (4, 5)
+
+    def test_not_found(self):
+        """Test missing target gives empty slice at insertion position"""
+        arr = [1, 3, 5, 7]
+        assert equal_range(arr, 4) == (2, 2)
+        assert equal_range([], 4) == (0, 0)
+
+    def test_all_same(self):
+        """Test when all elements are the same"""
+        assert equal_range([5, 5, 5, 5], 5) == (0, 4)
+
+    def test_matches_first_and_last(self):
+        """Test agreement with find_first/last_occurrence"""
+        arr = [0, 0, 1, 3, 3, 3, 3, 6, 8, 8]
+        for target in range(-1, 10):
+            start, end = equal_range(arr, target)
+            if start == end:
+                assert find_first_occurrence(arr, target) == -1
+            else:
+                assert start == find_first_occurrence(arr, target)
+                assert end - 1 == find_last_occurrence(arr, target)
+
+
+class TestCountRange:
+    """Test counting elements in an inclusive range"""
+
+    def test_basic(self):
+        """Test range covering duplicates"""
+        arr = [1, 2, 2, 2, 3, 4, 5]
+        assert count_range(arr, 2, 3) == 4
+
+    def test_bounds_outside_array(self):
+        """Test bounds beyond both ends"""
+        arr = [1, 2, 3]
+        assert count_range(arr, -10, 10) == 3
+        assert count_range(arr, 4, 10) == 0
+
+    def test_empty_and_inverted(self):
+        """Test empty array and lo > hi"""
+        assert count_range([], 1, 5) == 0
+        assert count_range([1, 2, 3], 3, 1) == 0
+
+    def test_matches_brute_force(self):
+        """Test against a linear count"""
+        arr = [0, 0, 1, 3, 3, 3, 3, 6, 8, 8]
+        for lo in range(-1, 10):
+            for hi in range(-1, 10):
+                expected = sum(1 for x in arr if lo <= x <= hi)
+                assert count_range(arr, lo, hi) == expected
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
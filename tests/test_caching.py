@@ -0,0 +1,170 @@
+"""
+Test suite for bounded memoization.
+
+Run with: pytest tests/test_caching.py -v
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from python_concepts.caching import Cache, cached, make_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def counting(maxsize=128, **options):
+    calls = []
+
+    @cached(maxsize=maxsize, **options)
+    def square(x, scale=1):
+        calls.append(x)
+        return x * x * scale
+
+    return square, calls
+
+
+class TestKeys:
+    """Tests for make_key."""
+
+    def test_kwargs_order_does_not_matter(self):
+        assert make_key((1,), {"a": 1, "b": 2}) == make_key((1,), {"b": 2, "a": 1})
+
+    def test_kwargs_distinct_from_positional(self):
+        assert make_key((1, 2), {}) != make_key((1,), {"b": 2})
+
+    def test_single_fast_argument(self):
+        assert make_key((5,), {}) == 5
+        assert make_key(("x",), {}) == "x"
+        assert make_key((5.0,), {}) == (5.0,)
+
+
+class TestCached:
+    """Tests for the @cached decorator."""
+
+    def test_bare_decorator(self):
+        @cached
+        def double(x):
+            return 2 * x
+
+        assert double(2) == 4
+        assert double(2) == 4
+        assert double.cache_info().hits == 1
+        assert double.__name__ == "double"
+
+    def test_kwargs_are_cached(self):
+        square, calls = counting()
+        assert square(3, scale=2) == 18
+        assert square(3, scale=2) == 18
+        assert square(3) == 9
+        assert calls == [3, 3]
+
+    def test_lru_eviction(self):
+        square, calls = counting(maxsize=2)
+        square(1)
+        square(2)
+        square(1)  # 2 is now least recently used
+        square(3)  # evicts 2
+        square(1)
+        square(2)
+        assert calls == [1, 2, 3, 2]
+        info = square.cache_info()
+        assert info.evictions == 2
+        assert info.currsize == 2
+
+    def test_lfu_eviction(self):
+        square, calls = counting(maxsize=2, policy="lfu")
+        square(1)
+        square(1)
+        square(1)
+        square(2)
+        square(3)  # 2 has the lowest count: evicted, 1 survives
+        square(1)
+        assert calls == [1, 2, 3]
+        square(2)
+        assert calls == [1, 2, 3, 2]
+
+    def test_lfu_ties_break_by_recency(self):
+        square, calls = counting(maxsize=2, policy="lfu")
+        square(1)
+        square(2)
+        square(3)  # 1 and 2 both used once: 1 is older
+        square(2)
+        assert calls == [1, 2, 3]
+
+    def test_ttl_expiry(self):
+        clock = FakeClock()
+        square, calls = counting(ttl=10, timer=clock)
+        square(4)
+        clock.now = 9.9
+        square(4)
+        clock.now = 10.0
+        square(4)
+        assert calls == [4, 4]
+        assert square.cache_info().expirations == 1
+
+    def test_unbounded_and_disabled(self):
+        square, calls = counting(maxsize=None)
+        for x in range(1000):
+            square(x)
+        assert square.cache_info().currsize == 1000
+
+        square, calls = counting(maxsize=0)
+        square(1)
+        square(1)
+        assert calls == [1, 1]
+
+    def test_cache_clear(self):
+        square, calls = counting()
+        square(1)
+        square.cache_clear()
+        assert square.cache_info() == (0, 0, 0, 0, 128, 0)
+        square(1)
+        assert calls == [1, 1]
+
+    def test_recursive_function(self):
+        @cached(maxsize=None)
+        def fib(n):
+            return n if n <= 1 else fib(n - 1) + fib(n - 2)
+
+        assert fib(100) == 354224848179261915075
+        assert fib.cache_info().misses == 101
+
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            Cache(policy="fifo")
+        with pytest.raises(ValueError):
+            Cache(maxsize=-1)
+        with pytest.raises(ValueError):
+            Cache(ttl=0)
+
+
+class TestCacheStores:
+    """Eviction stays consistent under mixed operations."""
+
+    @pytest.mark.parametrize("policy", ["lru", "lfu"])
+    def test_size_never_exceeds_maxsize(self, policy):
+        clock = FakeClock()
+        cache = Cache(maxsize=5, policy=policy, ttl=3, timer=clock)
+        for step in range(500):
+            clock.now = step / 10
+            key = (step * 7) % 13
+            if cache.get(key, None) is not None and step % 3:
+                continue
+            cache.set(key, step)
+            assert len(cache) <= 5
+        info = cache.info()
+        assert info.hits + info.misses == 500
+        assert info.currsize == len(cache)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
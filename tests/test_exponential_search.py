@@ -0,0 +1,89 @@
+"""
+Unit tests for exponential (galloping) search
+Run with: pytest tests/test_exponential_search.py -v
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from searching.exponential_search import (
+    HintedSearcher,
+    LazySequence,
+    exponential_search,
+    exponential_search_from
+)
+from searching.binary_search import find_first_occurrence, find_insertion_position
+from python_concepts.fibonacci_generator import fibonacci_infinite
+
+
+class TestExponentialSearch:
+    """Test exponential search over lists"""
+
+    def test_found_and_missing(self):
+        """Test lookups on a plain list"""
+        arr = [1, 3, 5, 7, 9, 11]
+        assert exponential_search(arr, 7) == 3
+        assert exponential_search(arr, 8) == -1
+        assert exponential_search(arr, 12) == -1
+        assert exponential_search([], 1) == -1
+
+    def test_matches_binary_search(self):
+        """Test agreement with binary_search.py, including duplicates"""
+        arr = [0, 0, 1, 3, 3, 3, 3, 6, 8, 8, 8, 9]
+        for target in range(-1, 11):
+            assert exponential_search(arr, target) == find_first_occurrence(arr, target)
+            for hint in range(len(arr) + 2):
+                assert exponential_search_from(arr, target, hint) == (
+                    find_insertion_position(arr, target)
+                )
+
+
+class TestLazySources:
+    """Test searching lazily materialized and infinite sources"""
+
+    def test_infinite_fibonacci(self):
+        """Test search over fibonacci_infinite"""
+        fib = LazySequence(fibonacci_infinite())
+        assert exponential_search(fib, 144) == 12
+        assert exponential_search(fib, 145) == -1
+
+    def test_buffers_only_probed_prefix(self):
+        """Test only about twice the answer is materialized"""
+        fib = LazySequence(fibonacci_infinite())
+        pos = exponential_search_from(fib, 10 ** 50)
+        assert fib[pos] >= 10 ** 50 > fib[pos - 1]
+        assert len(fib.buffer) <= 2 * pos + 2
+
+    def test_finite_iterator_end(self):
+        """Test running off the end of a finite iterator"""
+        seq = LazySequence(iter([2, 4, 6]))
+        assert exponential_search_from(seq, 100) == 3
+        assert exponential_search(seq, 6) == 2
+        with pytest.raises(IndexError):
+            seq[3]
+
+
+class TestHintedSearcher:
+    """Test galloping from the previous answer"""
+
+    def test_increasing_queries(self):
+        """Test a stream of increasing queries"""
+        arr = list(range(0, 100, 2))
+        searcher = HintedSearcher(arr)
+        for target in range(0, 101, 3):
+            assert searcher.find_insertion_position(target) == (
+                find_insertion_position(arr, target)
+            )
+
+    def test_query_moving_backwards(self):
+        """Test a query smaller than the previous one"""
+        searcher = HintedSearcher(LazySequence(fibonacci_infinite()))
+        assert searcher.search(233) == 13
+        assert searcher.search(5) == 5
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,116 @@
+"""
+Test suite for fingerprint cache keys.
+
+Run with: pytest tests/test_fingerprint.py -v
+"""
+
+import threading
+from array import array
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arrays.two_sum import two_sum_hash_map
+from python_concepts.caching import cached
+from python_concepts.fingerprint import FingerprintKey, fingerprint, fingerprint_cost
+from python_concepts.single_flight import memoize_threadsafe
+
+
+class TestFingerprint:
+    """Tests for fingerprint()."""
+
+    def test_hashable_values_pass_through(self):
+        assert fingerprint(5) == 5
+        assert fingerprint("abc") == "abc"
+        assert fingerprint((1, 2)) == (1, 2)
+
+    def test_equal_contents_equal_keys(self):
+        assert fingerprint([1, 2, 3]) == fingerprint([1, 2, 3])
+        assert fingerprint({"a": [1]}) == fingerprint({"a": [1]})
+        assert fingerprint(array("q", [1, 2])) == fingerprint(array("q", [1, 2]))
+
+    def test_different_contents_or_types_differ(self):
+        assert fingerprint([1, 2, 3]) != fingerprint([1, 2, 4])
+        assert fingerprint(array("q", [1, 2])) != fingerprint(array("i", [1, 2]))
+        assert fingerprint(array("q", [1])) != fingerprint(bytearray(array("q", [1])))
+        assert fingerprint(([1], 2)) != fingerprint(([1], 3))
+
+    def test_non_contiguous_buffer(self):
+        np = pytest.importorskip("numpy")
+        a = np.arange(10)
+        assert fingerprint(a[::2]) == fingerprint(np.arange(0, 10, 2))
+
+
+class TestFingerprintKey:
+    """Tests for FingerprintKey as a cache key function."""
+
+    def test_memoizes_list_arguments(self):
+        calls = []
+
+        @cached(key=FingerprintKey())
+        def total(nums, scale=1):
+            calls.append(1)
+            return sum(nums) * scale
+
+        assert total([1, 2, 3]) == 6
+        assert total([1, 2, 3]) == 6  # a different but equal list hits
+        assert total([1, 2, 3], scale=2) == 12
+        assert len(calls) == 2
+
+    def test_two_sum_hash_map(self):
+        two_sum = cached(two_sum_hash_map, key=FingerprintKey())
+        assert two_sum([2, 7, 11, 15], 9) == [0, 1]
+        assert two_sum([2, 7, 11, 15], 9) == [0, 1]
+        assert two_sum.cache_info().hits == 1
+
+    def test_identity_shortcut(self):
+        key = FingerprintKey(identity=True)
+        nums = [1, 2, 3]
+        assert key((nums,), {}) == key((nums,), {})
+        assert (key.calls, key.shortcuts) == (1, 1)
+
+        nums.append(4)  # a length change is noticed
+        assert key((nums,), {}) == key(([1, 2, 3, 4],), {})
+        assert key.calls == 3
+
+    def test_identity_forgets_old_objects(self):
+        key = FingerprintKey(identity=True, recent=2)
+        lists = [[i] for i in range(3)]
+        for nums in lists:
+            key((nums,), {})
+        key((lists[0],), {})
+        assert key.shortcuts == 0
+
+    def test_works_with_memoize_threadsafe(self):
+        calls = []
+
+        @memoize_threadsafe(key=FingerprintKey(identity=True))
+        def total(nums):
+            calls.append(1)
+            return sum(nums)
+
+        nums = list(range(1000))
+        threads = [threading.Thread(target=total, args=(nums,)) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert total(nums) == sum(nums)
+        assert len(calls) == 1
+
+
+class TestFingerprintCost:
+    """Tests for fingerprint_cost()."""
+
+    def test_reports_both_sides(self):
+        cost = fingerprint_cost(sorted, list(range(1000, 0, -1)))
+        assert cost.fingerprint > 0
+        assert cost.compute > 0
+        assert cost.pays == (cost.ratio < 1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
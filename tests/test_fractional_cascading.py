@@ -0,0 +1,63 @@
+"""
+Unit tests for fractional cascading
+Run with: pytest tests/test_fractional_cascading.py -v
+"""
+
+import random
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from searching.fractional_cascading import FractionalCascade
+from searching.binary_search import find_first_occurrence, find_insertion_position
+
+
+class TestFractionalCascade:
+    """Test cascaded insertion positions against per-list binary search"""
+
+    def test_basic(self):
+        """Test a small example"""
+        fc = FractionalCascade([[1, 5, 9], [2, 3, 10], [0, 4]])
+        assert fc.find_insertion_positions(4) == [1, 2, 1]
+        assert fc.search(10) == [-1, 2, -1]
+        assert len(fc) == 3
+
+    def test_no_lists(self):
+        """Test an empty collection of lists"""
+        assert FractionalCascade([]).find_insertion_positions(1) == []
+
+    def test_empty_lists_inside(self):
+        """Test empty shards mixed with non-empty ones"""
+        lists = [[], [1, 2], [], [0, 0, 3]]
+        fc = FractionalCascade(lists)
+        for q in range(-1, 5):
+            assert fc.find_insertion_positions(q) == [
+                find_insertion_position(lst, q) for lst in lists
+            ]
+
+    def test_unsorted_rejected(self):
+        """Test unsorted input raises ValueError"""
+        with pytest.raises(ValueError):
+            FractionalCascade([[1, 2], [3, 1]])
+
+    @pytest.mark.parametrize("seed", [0, 1, 2, 3])
+    def test_random_with_duplicates(self, seed):
+        """Test many shards with duplicates"""
+        rng = random.Random(seed)
+        lists = [
+            sorted(rng.randrange(40) for _ in range(rng.randrange(0, 30)))
+            for _ in range(rng.randrange(1, 12))
+        ]
+        fc = FractionalCascade(lists)
+        for q in range(-2, 43):
+            assert fc.find_insertion_positions(q) == [
+                find_insertion_position(lst, q) for lst in lists
+            ]
+            assert fc.search(q) == [find_first_occurrence(lst, q) for lst in lists]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,111 @@
+"""
+Test suite for the low-overhead instrumentation decorator.
+
+Run with: pytest tests/test_instrumentation.py -v
+"""
+
+import io
+import threading
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from python_concepts.instrumentation import Recorder, instrument
+from arrays.two_sum import two_sum_hash_map
+
+
+class TestInstrument:
+    """Tests for @instrument and Recorder."""
+
+    def test_off_by_default(self):
+        rec = Recorder()
+
+        @instrument(recorder=rec)
+        def add(a, b):
+            return a + b
+
+        assert add(1, 2) == 3
+        assert rec.flush() == {}
+
+    def test_records_every_call(self):
+        rec = Recorder(sample_every=1)
+
+        @instrument(name="add", recorder=rec)
+        def add(a, b):
+            return a + b
+
+        for i in range(5):
+            add(i, i)
+        stats = rec.flush()["add"]
+        assert stats["count"] == 5
+        assert stats["min_s"] <= stats["mean_s"] <= stats["max_s"]
+        assert sum(stats["histogram_ns"].values()) == 5
+        assert rec.flush() == {}
+
+    def test_sampling(self):
+        rec = Recorder(sample_every=10)
+
+        @instrument(name="f", recorder=rec)
+        def f():
+            return None
+
+        for _ in range(100):
+            f()
+        assert rec.snapshot()["f"]["count"] == 10
+
+    def test_sampling_exact_across_threads(self):
+        rec = Recorder(sample_every=7)
+
+        @instrument(name="f", recorder=rec)
+        def f():
+            return None
+
+        def hammer():
+            for _ in range(20_000):
+                f()
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # switch threads as often as possible
+        try:
+            threads = [threading.Thread(target=hammer) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            sys.setswitchinterval(interval)
+        assert rec.snapshot()["f"]["count"] == 8 * 20_000 // 7
+
+    def test_exception_still_recorded(self):
+        rec = Recorder(sample_every=1)
+
+        @instrument(name="boom", recorder=rec)
+        def boom():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            boom()
+        assert rec.flush()["boom"]["count"] == 1
+
+    def test_report_output(self):
+        rec = Recorder(sample_every=1)
+        instrument(lambda: None, name="noop", recorder=rec)()
+        out = io.StringIO()
+        rec.report(file=out)
+        assert out.getvalue().startswith("noop: calls=1")
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            Recorder(sample_every=-1)
+
+    def test_two_sum_does_not_print(self, capsys):
+        assert two_sum_hash_map([2, 7, 11, 15], 9) == [0, 1]
+        assert capsys.readouterr().out == ""
+        assert two_sum_hash_map.__name__ == "two_sum_hash_map"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,101 @@
+"""
+Test suite for IntIndexMap.
+
+Run with: pytest tests/test_int_index_map.py -v
+"""
+
+import random
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arrays.int_index_map import EMPTY, IntIndexMap, two_sum_int_map
+from arrays.two_sum import two_sum_hash_map
+
+
+class TestIntIndexMap:
+    """Tests for the dict-like operations."""
+
+    def test_set_get_contains(self):
+        seen = IntIndexMap()
+        seen[7] = 0
+        assert 7 in seen
+        assert 8 not in seen
+        assert seen[7] == 0
+        assert seen.get(8, -1) == -1
+        assert seen.get(8) is None
+        assert len(seen) == 1
+
+    def test_overwrite_keeps_len(self):
+        seen = IntIndexMap()
+        seen[3] = 0
+        seen[3] = 5
+        assert seen[3] == 5
+        assert len(seen) == 1
+
+    def test_missing_key_raises(self):
+        with pytest.raises(KeyError):
+            IntIndexMap()[1]
+
+    def test_sentinel_key(self):
+        seen = IntIndexMap()
+        assert EMPTY not in seen
+        seen[EMPTY] = 4
+        assert EMPTY in seen
+        assert seen[EMPTY] == 4
+        assert len(seen) == 1
+        assert list(seen) == [EMPTY]
+
+    def test_out_of_range_rejected(self):
+        with pytest.raises(OverflowError):
+            IntIndexMap()[1 << 63] = 1
+
+    def test_grows_and_matches_dict(self):
+        rng = random.Random(1)
+        seen = IntIndexMap()
+        expected = {}
+        for i in range(5000):
+            key = rng.randrange(-(1 << 62), 1 << 62) if i % 2 else rng.randrange(100)
+            seen[key] = i
+            expected[key] = i
+        assert len(seen) == len(expected)
+        assert sorted(seen) == sorted(expected)
+        assert all(seen[k] == v for k, v in expected.items())
+        assert seen.capacity() * 2 >= len(seen) * 3
+
+    def test_capacity_presizing(self):
+        seen = IntIndexMap(1000)
+        size = seen.capacity()
+        for i in range(1000):
+            seen[i] = i
+        assert seen.capacity() == size
+
+    def test_memory_per_entry(self):
+        seen = IntIndexMap()
+        for i in range(10_000):
+            seen[i * 7919] = i
+        assert 16 <= seen.bytes_per_entry() <= 48
+        assert seen.memory_bytes() == 16 * seen.capacity()
+
+
+class TestTwoSumIntMap:
+    """two_sum_hash_map with IntIndexMap as seen."""
+
+    def test_basic(self):
+        assert two_sum_int_map([2, 7, 11, 15], 9) == [0, 1]
+        assert two_sum_int_map([3, 3], 6) == [0, 1]
+        assert two_sum_int_map([1, 2], 10) is None
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_matches_hash_map(self, seed):
+        rng = random.Random(seed)
+        nums = [rng.randrange(-100, 100) for _ in range(300)]
+        for target in range(-200, 200, 13):
+            assert two_sum_int_map(nums, target) == two_sum_hash_map(nums, target)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,101 @@
+"""
+Unit tests for interpolation search and the learned index
+Run with: pytest tests/test_interpolation_search.py -v
+"""
+
+import math
+import random
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from searching.interpolation_search import (
+    LearnedIndex,
+    binary_search_probes,
+    interpolation_search,
+    interpolation_search_probes
+)
+from searching.binary_search import find_first_occurrence, find_insertion_position
+
+
+def _arrays():
+    rng = random.Random(7)
+    return [
+        [],
+        [5],
+        [1, 3, 5, 7, 9, 11],
+        [1, 2, 2, 2, 3, 4, 5],
+        [5] * 20,
+        sorted(rng.randrange(100) for _ in range(300)),
+        sorted(int(rng.expovariate(0.01)) for _ in range(500)),
+        [2 ** i for i in range(40)],
+    ]
+
+
+class TestInterpolationSearch:
+    """Test guarded interpolation search"""
+
+    def test_basic(self):
+        """Test found and missing targets"""
+        arr = [10, 20, 30, 40, 50]
+        assert interpolation_search(arr, 40) == 3
+        assert interpolation_search(arr, 35) == -1
+        assert interpolation_search([], 1) == -1
+
+    @pytest.mark.parametrize("arr", _arrays())
+    def test_matches_binary_search(self, arr):
+        """Test results agree with binary_search.py on varied distributions"""
+        for q in set(arr) | {-1, 0, 50, 10 ** 13}:
+            assert interpolation_search(arr, q) == find_first_occurrence(arr, q)
+            pos, _ = interpolation_search_probes(arr, q)
+            assert pos == find_insertion_position(arr, q)
+
+    def test_worst_case_is_logarithmic(self):
+        """Test probes stay O(log n) on heavily skewed keys"""
+        arr = [2 ** i for i in range(1000)]
+        bound = 2 * math.log2(len(arr)) + 4
+        for q in arr[::37]:
+            assert interpolation_search_probes(arr, q)[1] <= bound
+
+    def test_uniform_beats_binary(self):
+        """Test uniform keys need fewer probes than binary search"""
+        arr = list(range(0, 3_000_000, 3))
+        queries = arr[::9973]
+        interp = sum(interpolation_search_probes(arr, q)[1] for q in queries)
+        binary = sum(binary_search_probes(arr, q)[1] for q in queries)
+        assert interp < binary / 2
+
+
+class TestLearnedIndex:
+    """Test the piecewise-linear learned index"""
+
+    @pytest.mark.parametrize("arr", _arrays())
+    @pytest.mark.parametrize("segment_size", [1, 4, 64])
+    def test_matches_binary_search(self, arr, segment_size):
+        """Test results agree with binary_search.py"""
+        index = LearnedIndex(arr, segment_size=segment_size)
+        for q in set(arr) | {-1, 0, 50, 10 ** 13}:
+            assert index.find_insertion_position(q) == find_insertion_position(arr, q)
+            assert index.search(q) == find_first_occurrence(arr, q)
+
+    def test_invalid_segment_size(self):
+        """Test segment_size must be positive"""
+        with pytest.raises(ValueError):
+            LearnedIndex([1, 2, 3], segment_size=0)
+
+    def test_uniform_beats_binary(self):
+        """Test near-uniform keys need fewer probes than binary search"""
+        rng = random.Random(1)
+        arr = sorted(i * 10 + rng.randrange(5) for i in range(100_000))
+        index = LearnedIndex(arr)
+        queries = arr[::997]
+        learned = sum(index.insertion_probes(q)[1] for q in queries)
+        binary = sum(binary_search_probes(arr, q)[1] for q in queries)
+        assert learned < binary / 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
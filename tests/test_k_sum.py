@@ -0,0 +1,85 @@
+"""
+Test suite for k-sum.
+
+Run with: pytest tests/test_k_sum.py -v
+"""
+
+import random
+from itertools import combinations
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arrays.k_sum import all_pairs, count_pairs, four_sum, k_sum, three_sum
+
+
+def brute_force(nums, target, k):
+    return sorted({tuple(sorted(c)) for c in combinations(nums, k) if sum(c) == target})
+
+
+class TestAllPairs:
+    """Tests for index pairs and pair counts."""
+
+    def test_all_pairs(self):
+        assert list(all_pairs([3, 3, 3], 6)) == [(0, 1), (0, 2), (1, 2)]
+        assert list(all_pairs([2, 7, 11, 15], 9)) == [(0, 1)]
+        assert list(all_pairs([], 9)) == []
+
+    def test_all_pairs_is_lazy(self):
+        pairs = all_pairs([0] * 10_000, 0)
+        assert next(pairs) == (0, 1)
+
+    def test_count_pairs(self):
+        assert count_pairs([1, 5, 7, -1, 5], 6) == 3
+        assert count_pairs([3, 3, 3, 3], 6) == 6
+        assert count_pairs([1, 2], 10) == 0
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_count_matches_all_pairs(self, seed):
+        rng = random.Random(seed)
+        nums = [rng.randrange(-10, 10) for _ in range(100)]
+        for target in range(-20, 20, 3):
+            assert count_pairs(nums, target) == sum(1 for _ in all_pairs(nums, target))
+
+
+class TestKSum:
+    """Tests for distinct value combinations."""
+
+    def test_three_sum_classic(self):
+        assert sorted(three_sum([-1, 0, 1, 2, -1, -4])) == [(-1, -1, 2), (-1, 0, 1)]
+
+    def test_four_sum_classic(self):
+        assert sorted(four_sum([1, 0, -1, 0, -2, 2], 0)) == [
+            (-2, -1, 1, 2), (-2, 0, 0, 2), (-1, 0, 0, 1)
+        ]
+
+    def test_value_used_up_to_its_count(self):
+        assert list(k_sum([2, 2, 2, 2, 2], 8, 4)) == [(2, 2, 2, 2)]
+        assert list(k_sum([2, 2, 2], 8, 4)) == []
+
+    def test_too_few_numbers(self):
+        assert list(k_sum([1, 2], 3, 3)) == []
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            k_sum([1, 2], 3, 1)
+        with pytest.raises(ValueError):
+            k_sum([1, 2], 3, 2, strategy="magic")
+
+    @pytest.mark.parametrize("strategy", ["auto", "hash", "two_pointer"])
+    @pytest.mark.parametrize("k", [2, 3, 4])
+    def test_matches_brute_force(self, strategy, k):
+        rng = random.Random(k)
+        for value_range in (3, 20):
+            nums = [rng.randrange(-value_range, value_range) for _ in range(18)]
+            for target in (-5, 0, 4):
+                got = list(k_sum(nums, target, k, strategy))
+                assert len(got) == len(set(got))
+                assert sorted(got) == brute_force(nums, target, k)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,95 @@
+"""
+Unit tests for the memory-mapped sorted index
+Run with: pytest tests/test_mmap_index.py -v
+"""
+
+import itertools
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from searching.mmap_index import MmapSortedIndex, write_sorted_index
+
+
+class TestMmapSortedIndex:
+    """Test writing and searching SKIX files"""
+
+    def test_round_trip(self, tmp_path):
+        """Test every search routine on mapped keys"""
+        path = str(tmp_path / "keys.skix")
+        assert write_sorted_index(path, [1, 2, 2, 2, 3, 4, 5]) == 7
+        with MmapSortedIndex(path) as index:
+            assert len(index) == 7
+            assert index.search(4) == 5
+            assert index.search(6) == -1
+            assert index.find_first_occurrence(2) == 1
+            assert index.find_last_occurrence(2) == 3
+            assert index.find_insertion_position(0) == 0
+            assert 3 in index
+
+    def test_generator_input_spans_chunks(self, tmp_path):
+        """Test streaming input larger than one write chunk"""
+        path = str(tmp_path / "keys.skix")
+        n = 200_000
+        write_sorted_index(path, (2 * i for i in range(n)), typecode="I")
+        with MmapSortedIndex(path) as index:
+            assert len(index) == n
+            assert index.search(2 * 123_456) == 123_456
+            assert index.find_insertion_position(2 * n) == n
+
+    def test_empty(self, tmp_path):
+        """Test file with no keys"""
+        path = str(tmp_path / "keys.skix")
+        write_sorted_index(path, [])
+        with MmapSortedIndex(path) as index:
+            assert index.search(1) == -1
+            assert index.find_insertion_position(1) == 0
+
+    def test_unsorted_rejected(self, tmp_path):
+        """Test unsorted keys raise ValueError"""
+        with pytest.raises(ValueError):
+            write_sorted_index(str(tmp_path / "keys.skix"), [2, 1])
+
+    def test_failed_build_leaves_no_file(self, tmp_path):
+        """Test a failed build leaves nothing that opens as an empty index"""
+        path = tmp_path / "keys.skix"
+        with pytest.raises(ValueError):
+            # Several chunks are already written when the bad key arrives
+            write_sorted_index(str(path), itertools.chain(range(3 * 2**16), [0]))
+        assert not path.exists()
+        assert os.listdir(tmp_path) == []
+
+    def test_failed_rebuild_keeps_old_index(self, tmp_path):
+        """Test a failed rebuild does not touch the existing index"""
+        path = str(tmp_path / "keys.skix")
+        write_sorted_index(path, [1, 2, 3])
+        with pytest.raises(ValueError):
+            write_sorted_index(path, [5, 4])
+        with MmapSortedIndex(path) as index:
+            assert len(index) == 3
+            assert index.search(2) == 1
+
+    def test_bad_file_rejected(self, tmp_path):
+        """Test a non-index file raises ValueError"""
+        path = tmp_path / "junk.bin"
+        path.write_bytes(b"not an index file at all")
+        with pytest.raises(ValueError):
+            MmapSortedIndex(str(path))
+
+    def test_corrupt_typecode_rejected(self, tmp_path):
+        """Test a header typecode byte that is not ASCII raises ValueError"""
+        path = tmp_path / "keys.skix"
+        write_sorted_index(str(path), [1, 2, 3])
+        data = bytearray(path.read_bytes())
+        data[5] = 0xFF  # typecode byte follows the magic and version
+        path.write_bytes(bytes(data))
+        with pytest.raises(ValueError, match="not a version") as excinfo:
+            MmapSortedIndex(str(path))
+        assert excinfo.type is ValueError  # not UnicodeDecodeError
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,170 @@
+"""
+Test suite for persistent memoization.
+
+Run with: pytest tests/test_persistent_cache.py -v
+"""
+
+import itertools
+import json
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from python_concepts.persistent_cache import PersistentCache, code_version, persistent_cache
+
+
+def counting(path, **options):
+    calls = []
+
+    @persistent_cache(path, **options)
+    def square(x, scale=1):
+        calls.append(x)
+        return x * x * scale
+
+    return square, calls
+
+
+def _square_in_worker(path, x):
+    return counting(path, version="v1")[0](x)
+
+
+class TestPersistentCache:
+    """Tests for @persistent_cache."""
+
+    def test_survives_restart(self, tmp_path):
+        path = str(tmp_path / "memo.sqlite")
+        square, calls = counting(path, version="v1")
+        assert [square(3), square(3), square(4)] == [9, 9, 16]
+        assert calls == [3, 4]
+        square.cache.close()
+
+        # A new decorator over the same file plays the restarted worker
+        square, calls = counting(path, version="v1")
+        assert [square(3), square(4)] == [9, 16]
+        assert calls == []
+        assert square.cache_info().hits == 2
+
+    def test_kwargs_are_part_of_the_key(self, tmp_path):
+        square, calls = counting(str(tmp_path / "memo.sqlite"))
+        assert square(2, scale=10) == 40
+        assert square(2) == 4
+        assert square(2, scale=10) == 40
+        assert calls == [2, 2]
+
+    def test_new_version_ignores_and_prunes_old_rows(self, tmp_path):
+        path = str(tmp_path / "memo.sqlite")
+        square, _ = counting(path, version="v1")
+        square(3)
+        square, calls = counting(path, version="v2")
+        assert square(3) == 9
+        assert calls == [3]
+        assert len(square.cache) == 1
+
+    def test_code_version_follows_the_source(self):
+        def f(x):
+            return x
+
+        def g(x):
+            return x + 1
+
+        assert code_version(f) == code_version(f)
+        assert code_version(f) != code_version(g)
+
+    def test_max_entries_evicts_least_recently_used(self, tmp_path):
+        square, calls = counting(str(tmp_path / "memo.sqlite"), max_entries=2)
+        square(1)
+        square(2)
+        square(1)  # 2 is now the least recently used
+        square(3)
+        assert square.cache_info().evictions == 1
+        square(1)
+        square(2)
+        assert calls == [1, 2, 3, 2]
+
+    def test_lru_order_ignores_the_clock(self, tmp_path, monkeypatch):
+        # A wall clock that steps backwards on every call
+        clock = itertools.count(10**9, -1)
+        monkeypatch.setattr(time, "time", lambda: next(clock))
+        square, calls = counting(str(tmp_path / "memo.sqlite"), max_entries=2)
+        square(1)
+        square(2)
+        square(1)
+        square(3)  # evicts 2, the least recently used
+        square(1)
+        square(2)
+        assert calls == [1, 2, 3, 2]
+
+    def test_pending_hits_written_on_close(self, tmp_path):
+        path = str(tmp_path / "memo.sqlite")
+        cache = PersistentCache(path, "f", max_entries=2)
+        cache.set(1, "one")
+        cache.set(2, "two")
+        assert cache.get(1) == "one"
+        cache.close()
+        cache = PersistentCache(path, "f", max_entries=2)
+        cache.set(3, "three")
+        assert cache.get(2, None) is None
+        assert cache.get(1) == "one"
+
+    def test_hit_does_not_take_the_write_lock(self, tmp_path):
+        path = str(tmp_path / "memo.sqlite")
+        cache = PersistentCache(path, "f", timeout=0.1)
+        cache.set(1, "one")
+        writer = sqlite3.connect(path, isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")  # another process is writing
+        try:
+            assert cache.get(1) == "one"
+            assert cache.get(2, None) is None
+        finally:
+            writer.execute("ROLLBACK")
+            writer.close()
+
+    def test_max_bytes(self, tmp_path):
+        cache = PersistentCache(str(tmp_path / "memo.sqlite"), "blob", max_bytes=1000)
+        for i in range(10):
+            cache.set(i, b"x" * 300)
+        assert len(cache) == 3
+        assert cache.get(9) == b"x" * 300
+        assert cache.get(0, None) is None
+
+    def test_json_serializer(self, tmp_path):
+        path = str(tmp_path / "memo.sqlite")
+
+        @persistent_cache(path, serializer=json)
+        def pair(a, b):
+            return {"sum": a + b}
+
+        assert pair(1, 2) == {"sum": 3}
+        assert pair(1, 2) == {"sum": 3}
+        assert pair.cache_info().hits == 1
+
+    def test_clear(self, tmp_path):
+        square, calls = counting(str(tmp_path / "memo.sqlite"))
+        square(5)
+        square.cache_clear()
+        assert len(square.cache) == 0
+        square(5)
+        assert calls == [5, 5]
+
+    def test_shared_between_processes(self, tmp_path):
+        path = str(tmp_path / "memo.sqlite")
+        xs = list(range(20)) * 2
+        with ProcessPoolExecutor(4) as pool:
+            assert list(pool.map(_square_in_worker, [path] * len(xs), xs)) == [x * x for x in xs]
+        square, calls = counting(path, version="v1")
+        assert [square(x) for x in range(20)] == [x * x for x in range(20)]
+        assert calls == []
+
+    def test_invalid_limits(self, tmp_path):
+        with pytest.raises(ValueError):
+            PersistentCache(str(tmp_path / "memo.sqlite"), "f", max_entries=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,93 @@
+"""
+Unit tests for predicate (answer-space) binary search
+Run with: pytest tests/test_predicate_search.py -v
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from searching.predicate_search import find_first_true, find_first_true_parallel
+
+
+def at_least_777(x):
+    """Module-level predicate so it can be pickled for a process pool"""
+    return x >= 777
+
+
+class TestFindFirstTrue:
+    """Test sequential predicate search"""
+
+    def test_basic(self):
+        """Test smallest square >= 50"""
+        assert find_first_true(lambda x: x * x >= 50, 0, 100) == 8
+
+    def test_boundaries(self):
+        """Test answer at either end and no answer"""
+        assert find_first_true(lambda x: True, 5, 10) == 5
+        assert find_first_true(lambda x: x >= 10, 5, 10) == 10
+        assert find_first_true(lambda x: False, 5, 10) is None
+        assert find_first_true(lambda x: True, 5, 4) is None
+
+    def test_negative_range(self):
+        """Test ranges below zero"""
+        assert find_first_true(lambda x: x >= -3, -100, 100) == -3
+
+    def test_memo_avoids_repeat_probes(self):
+        """Test memo is filled and reused across searches"""
+        calls = []
+
+        def check(x):
+            calls.append(x)
+            return x >= 300
+
+        memo = {}
+        assert find_first_true(check, 0, 1000, memo=memo) == 300
+        first_calls = len(calls)
+        assert first_calls == len(memo)
+        assert find_first_true(check, 0, 1000, memo=memo) == 300
+        assert len(calls) == first_calls
+
+
+class TestFindFirstTrueParallel:
+    """Test k-ary concurrent predicate search"""
+
+    @pytest.mark.parametrize("k", [2, 3, 4, 8, 16])
+    def test_matches_sequential(self, k):
+        """Test every answer position for several k"""
+        for target in [0, 1, 2, 17, 63, 64, 99, 100, 101]:
+            result = find_first_true_parallel(lambda x: x >= target, 0, 100, k=k)
+            assert result == find_first_true(lambda x: x >= target, 0, 100)
+
+    def test_fewer_rounds_than_binary(self):
+        """Test k-ary search needs log_k(n) rounds"""
+        rounds = []
+
+        class CountingPool:
+            def map(self, fn, xs):
+                rounds.append(len(xs))
+                return [fn(x) for x in xs]
+
+        result = find_first_true_parallel(
+            lambda x: x >= 4321, 0, 65535, k=16, executor=CountingPool()
+        )
+        assert result == 4321
+        assert len(rounds) <= 5
+
+    def test_invalid_k(self):
+        """Test k below 2 is rejected"""
+        with pytest.raises(ValueError):
+            find_first_true_parallel(lambda x: True, 0, 10, k=1)
+
+    def test_process_pool(self):
+        """Test probes evaluated on a process pool"""
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            assert find_first_true_parallel(at_least_777, 0, 10_000, k=4, executor=pool) == 777
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,156 @@
+"""
+Test suite for single-flight memoization.
+
+Run with: pytest tests/test_single_flight.py -v
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from python_concepts.single_flight import SingleFlight, memoize_async, memoize_threadsafe
+
+
+def run_together(fn, args):
+    """Call fn(arg) for every arg, all threads released at the same moment."""
+    barrier = threading.Barrier(len(args))
+
+    def call(arg):
+        barrier.wait()
+        return fn(arg)
+
+    with ThreadPoolExecutor(len(args)) as pool:
+        return list(pool.map(call, args))
+
+
+class TestMemoizeThreadsafe:
+    """Tests for the thread single-flight decorator."""
+
+    def test_one_computation_per_cold_key(self):
+        calls = []
+
+        @memoize_threadsafe
+        def slow_square(x):
+            calls.append(x)
+            time.sleep(0.05)
+            return x * x
+
+        assert run_together(slow_square, [7] * 16) == [49] * 16
+        assert calls == [7]
+        assert slow_square.single_flight.leaders == 1
+
+    def test_different_keys_run_independently(self):
+        @memoize_threadsafe(stripes=4)
+        def square(x):
+            time.sleep(0.01)
+            return x * x
+
+        assert run_together(square, list(range(16))) == [x * x for x in range(16)]
+        assert square.cache_info().currsize == 16
+
+    def test_exception_reaches_every_waiter_and_is_not_cached(self):
+        calls = []
+
+        @memoize_threadsafe
+        def boom(x):
+            calls.append(x)
+            time.sleep(0.05)
+            raise ValueError("boom")
+
+        def call(x):
+            try:
+                return boom(x)
+            except ValueError as exc:
+                return str(exc)
+
+        assert run_together(call, [1] * 8) == ["boom"] * 8
+        assert len(calls) == 1
+        with pytest.raises(ValueError):
+            boom(1)
+        assert len(calls) == 2
+
+    def test_recursive_function(self):
+        @memoize_threadsafe(maxsize=None)
+        def fib(n):
+            return n if n <= 1 else fib(n - 1) + fib(n - 2)
+
+        assert fib(80) == 23416728348467685
+
+    def test_reentrant_same_key_does_not_deadlock(self):
+        flight = SingleFlight()
+        assert flight.do("k", lambda: flight.do("k", lambda: 5) + 1) == 6
+
+    def test_invalid_stripes(self):
+        with pytest.raises(ValueError):
+            SingleFlight(stripes=0)
+
+
+class TestMemoizeAsync:
+    """Tests for the asyncio variant."""
+
+    def test_concurrent_awaits_share_one_call(self):
+        calls = []
+
+        @memoize_async
+        async def fetch(x):
+            calls.append(x)
+            await asyncio.sleep(0.01)
+            return x * 2
+
+        async def main():
+            first = await asyncio.gather(*(fetch(3) for _ in range(20)))
+            again = await fetch(3)
+            return first, again
+
+        first, again = asyncio.run(main())
+        assert first == [6] * 20
+        assert again == 6
+        assert calls == [3]
+        assert fetch.cache_info().hits == 1
+
+    def test_exception_not_cached(self):
+        calls = []
+
+        @memoize_async
+        async def fail(x):
+            calls.append(x)
+            raise KeyError(x)
+
+        async def main():
+            results = await asyncio.gather(fail(1), fail(1), return_exceptions=True)
+            assert all(isinstance(r, KeyError) for r in results)
+            with pytest.raises(KeyError):
+                await fail(1)
+
+        asyncio.run(main())
+        assert calls == [1, 1]
+
+    def test_cancelling_one_waiter_keeps_shared_task(self):
+        @memoize_async
+        async def slow(x):
+            await asyncio.sleep(0.02)
+            return x
+
+        async def main():
+            a = asyncio.ensure_future(slow(1))
+            b = asyncio.ensure_future(slow(1))
+            await asyncio.sleep(0)
+            a.cancel()
+            return await b
+
+        assert asyncio.run(main()) == 1
+
+    def test_requires_coroutine_function(self):
+        with pytest.raises(TypeError):
+            memoize_async(lambda x: x)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
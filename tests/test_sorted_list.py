@@ -0,0 +1,112 @@
+"""
+Unit tests for the bucketed SortedList
+Run with: pytest tests/test_sorted_list.py -v
+"""
+
+import random
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from searching.sorted_list import SortedList
+from searching.binary_search import (
+    find_first_occurrence,
+    find_last_occurrence,
+    find_insertion_position
+)
+
+
+class TestSortedListBasics:
+    """Test basic container behaviour"""
+
+    def test_add_and_index(self):
+        """Test values come out sorted"""
+        sl = SortedList([5, 1, 3])
+        sl.add(2)
+        assert list(sl) == [1, 2, 3, 5]
+        assert sl[1] == 2
+        assert sl[-1] == 5
+        assert len(sl) == 4
+
+    def test_remove_and_discard(self):
+        """Test deleting present and missing values"""
+        sl = SortedList([1, 2, 2, 3])
+        sl.remove(2)
+        assert list(sl) == [1, 2, 3]
+        assert sl.discard(7) is False
+        with pytest.raises(ValueError):
+            sl.remove(7)
+
+    def test_pop(self):
+        """Test pop by position"""
+        sl = SortedList([4, 1, 3])
+        assert sl.pop() == 4
+        assert sl.pop(0) == 1
+        assert list(sl) == [3]
+        with pytest.raises(IndexError):
+            sl.pop(5)
+
+    def test_searches(self):
+        """Test the four binary search operations"""
+        sl = SortedList([1, 2, 2, 2, 3, 4, 5])
+        assert sl.search(4) == 5
+        assert sl.find_first_occurrence(2) == 1
+        assert sl.find_last_occurrence(2) == 3
+        assert sl.find_insertion_position(6) == 7
+        assert sl.count(2) == 3
+        assert sl.search(9) == -1
+
+    def test_empty(self):
+        """Test queries on an empty list"""
+        sl = SortedList()
+        assert sl.search(1) == -1
+        assert sl.find_insertion_position(1) == 0
+        assert 1 not in sl
+        with pytest.raises(IndexError):
+            sl[0]
+
+    def test_from_sorted(self):
+        """Test bulk load from sorted input"""
+        sl = SortedList.from_sorted(range(10), load=3)
+        assert list(sl) == list(range(10))
+        assert sl.rank(7) == 7
+        with pytest.raises(ValueError):
+            SortedList.from_sorted([2, 1])
+
+
+class TestSortedListRandomized:
+    """Compare against a plain sorted list under random operations"""
+
+    @pytest.mark.parametrize("load", [2, 4, 16])
+    def test_random_operations(self, load):
+        rng = random.Random(load)
+        sl = SortedList(load=load)
+        ref = []
+        for _ in range(2000):
+            op = rng.random()
+            value = rng.randrange(100)
+            if op < 0.6:
+                sl.add(value)
+                ref.insert(find_insertion_position(ref, value), value)
+            elif op < 0.85:
+                removed = sl.discard(value)
+                assert removed == (value in ref)
+                if removed:
+                    ref.remove(value)
+            elif ref:
+                index = rng.randrange(len(ref))
+                assert sl.pop(index) == ref.pop(index)
+
+            assert len(sl) == len(ref)
+            assert sl.find_first_occurrence(value) == find_first_occurrence(ref, value)
+            assert sl.find_last_occurrence(value) == find_last_occurrence(ref, value)
+            assert sl.find_insertion_position(value) == find_insertion_position(ref, value)
+        assert list(sl) == ref
+        assert [sl[i] for i in range(len(ref))] == ref
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
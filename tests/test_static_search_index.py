@@ -0,0 +1,68 @@
+"""
+Unit tests for the Eytzinger-layout StaticSearchIndex
+Run with: pytest tests/test_static_search_index.py -v
+"""
+
+import random
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from searching.static_search_index import StaticSearchIndex
+from searching.binary_search import (
+    binary_search_iterative,
+    find_first_occurrence,
+    find_last_occurrence,
+    find_insertion_position
+)
+
+
+class TestStaticSearchIndex:
+    """Test the index against the plain binary search functions"""
+
+    def test_basic(self):
+        """Test lookups on a small unique array"""
+        index = StaticSearchIndex([1, 3, 5, 7, 9, 11])
+        assert index.search(5) == 2
+        assert index.search(4) == -1
+        assert index.find_insertion_position(12) == 6
+        assert 11 in index
+        assert len(index) == 6
+
+    def test_duplicates(self):
+        """Test first/last occurrence with duplicates"""
+        index = StaticSearchIndex([1, 2, 2, 2, 3, 4, 5])
+        assert index.find_first_occurrence(2) == 1
+        assert index.find_last_occurrence(2) == 3
+        assert index.find_last_occurrence(6) == -1
+
+    def test_empty(self):
+        """Test empty index"""
+        index = StaticSearchIndex([])
+        assert index.search(1) == -1
+        assert index.find_insertion_position(1) == 0
+        assert index.find_last_occurrence(1) == -1
+
+    def test_unsorted_rejected(self):
+        """Test unsorted input raises ValueError"""
+        with pytest.raises(ValueError):
+            StaticSearchIndex([3, 1, 2])
+
+    @pytest.mark.parametrize("n", [1, 2, 7, 8, 31, 100])
+    def test_matches_binary_search(self, n):
+        """Test every operation agrees with binary_search.py"""
+        rng = random.Random(n)
+        arr = sorted(rng.randrange(n) for _ in range(n))
+        index = StaticSearchIndex(arr)
+        for q in range(-1, n + 1):
+            assert index.find_first_occurrence(q) == find_first_occurrence(arr, q)
+            assert index.find_last_occurrence(q) == find_last_occurrence(arr, q)
+            assert index.find_insertion_position(q) == find_insertion_position(arr, q)
+            assert (index.search(q) == -1) == (binary_search_iterative(arr, q) == -1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
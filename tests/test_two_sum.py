@@ -4,13 +4,22 @@ Test suite for Two Sum algorithm implementations.
 Run with: pytest tests/test_two_sum.py -v
 """
 
+import random
+from array import array
+
 import pytest
 import sys
 import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from arrays.two_sum import two_sum_brute_force, two_sum_hash_map
+from arrays.two_sum import (
+    is_sorted,
+    two_sum,
+    two_sum_brute_force,
+    two_sum_hash_map,
+    two_sum_two_pointer,
+)
 
 
 class TestTwoSumBruteForce:
@@ -98,5 +107,74 @@ class TestBothMethodsAgree:
         assert nums[hashmap[0]] + nums[hashmap[1]] == target
 
 
+class TestTwoSumTwoPointer:
+    """Tests for the sorted-input two-pointer path."""
+
+    def test_basic_case(self):
+        assert two_sum_two_pointer([2, 7, 11, 15], 9) == [0, 1]
+
+    def test_no_solution(self):
+        assert two_sum_two_pointer([1, 2, 3], 10) is None
+        assert two_sum_two_pointer([], 5) is None
+        assert two_sum_two_pointer([5], 10) is None
+
+    def test_duplicate_values(self):
+        assert two_sum_two_pointer([3, 3], 6) == [0, 1]
+        assert two_sum_two_pointer([1, 3, 3, 3, 5], 6) == [1, 2]
+
+    def test_latest_complement_index(self):
+        # hash map semantics: j is the first 5, i the LAST 1 before it
+        assert two_sum_two_pointer([1, 1, 1, 5, 5], 6) == [2, 3]
+
+    def test_buffers_without_copy(self):
+        data = array("q", [-5, -1, 0, 2, 9])
+        assert two_sum_two_pointer(data, 4) == [0, 4]
+        assert two_sum_two_pointer(memoryview(data), -1) == [1, 2]
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_hash_map_on_sorted_input(self, seed):
+        rng = random.Random(seed)
+        nums = sorted(rng.randrange(-30, 30) for _ in range(rng.randrange(0, 60)))
+        for target in range(-65, 65):
+            assert two_sum_two_pointer(nums, target) == two_sum_hash_map(nums, target)
+
+
+class TestTwoSumDispatch:
+    """Tests for sorted-input detection in two_sum."""
+
+    def test_is_sorted(self):
+        assert is_sorted([])
+        assert is_sorted([1])
+        assert is_sorted([1, 1, 2])
+        assert not is_sorted([2, 1])
+        assert is_sorted(array("q", [1, 2, 3]))
+
+    def test_sorted_input_uses_two_pointer(self, monkeypatch):
+        import arrays.two_sum as module
+
+        monkeypatch.setattr(module, "two_sum_hash_map", None)  # must not be used
+        assert two_sum([1, 2, 3, 4], 7) == [2, 3]
+        assert two_sum([1, 2, 3, 4], 7, assume_sorted=True) == [2, 3]
+        assert two_sum([1, 2, 3, 4], 7, backend="two_pointer") == [2, 3]
+
+    @pytest.mark.parametrize("nums, target", [
+        ([1.5, 2.5, 3.0], 4.0),
+        ([0.5, 1.0, 1.5, 1.5, 2.0], 3.0),
+        ([0.5, 1.0, 1.5, 1.5, 2.0], 2.5),
+        ([-2.5, -1.5, 0.25, 0.25], 0.5),
+        ([1.0, 2.0, 3.0], 3.5),
+    ])
+    def test_sorted_floats_match_hash_map(self, nums, target):
+        assert is_sorted(nums)
+        assert two_sum(nums, target) == two_sum_hash_map(nums, target)
+
+    def test_unsorted_input_uses_hash_map(self):
+        assert two_sum([4, 3, 2, 1], 7) == [0, 1]
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            two_sum([1, 2], 3, backend="magic")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
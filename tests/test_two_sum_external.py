@@ -0,0 +1,139 @@
+"""
+Test suite for external memory two sum.
+
+Run with: pytest tests/test_two_sum_external.py -v
+"""
+
+import random
+import tracemalloc
+from array import array
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arrays.two_sum import two_sum_hash_map
+import arrays.two_sum_external as external
+from arrays.two_sum_external import (
+    ENTRY_BYTES,
+    MAX_PARTITIONS,
+    _buffer_size,
+    _earliest_in_partition,
+    _partition_count,
+    two_sum_external,
+)
+
+
+def write_numbers(path, nums, typecode="q"):
+    with open(path, "wb") as f:
+        array(typecode, nums).tofile(f)
+    return str(path)
+
+
+class TestTwoSumExternal:
+    """Tests for the partitioned out-of-core search."""
+
+    def test_basic_file(self, tmp_path):
+        path = write_numbers(tmp_path / "nums.bin", [2, 7, 11, 15])
+        assert two_sum_external(path, 9) == [0, 1]
+        assert two_sum_external(path, 100) is None
+
+    def test_empty_file(self, tmp_path):
+        path = write_numbers(tmp_path / "nums.bin", [])
+        assert two_sum_external(path, 0) is None
+
+    def test_sequence_source(self):
+        assert two_sum_external(array("q", [3, 2, 4]), 6) == [1, 2]
+        assert two_sum_external([3, 3], 6, memory_limit=1) == [0, 1]
+
+    def test_other_typecode(self, tmp_path):
+        path = write_numbers(tmp_path / "nums.bin", [5, 0, 4, 1], typecode="i")
+        assert two_sum_external(path, 5, typecode="i", memory_limit=1) == [0, 1]
+
+    def test_partition_count(self):
+        assert _partition_count(1000, 1000 * ENTRY_BYTES) == 1
+        assert _partition_count(1000, 1000 * ENTRY_BYTES // 5) == 8
+        # Capped: never more than MAX_PARTITIONS open files, or than n
+        assert _partition_count(4 * 10**9, 256 * 2**20) == MAX_PARTITIONS
+        assert _partition_count(5000, 1) == MAX_PARTITIONS
+        assert _partition_count(5, 1) == 4
+
+    def test_buffer_size_follows_memory_limit(self):
+        # 256 buffers of 512 KB would be 128 MB: fine under 256 MB
+        assert _buffer_size(256 * 2**20, 256) == 1 << 16
+        # 16 MB over 256 partitions: 64 KB = 8192 int64 per buffer
+        assert _buffer_size(16 * 2**20, 256) == 8192
+        assert _buffer_size(1, 256) == 2
+
+    @pytest.mark.parametrize("target", [-1, 4997])
+    def test_tiny_memory_limit(self, target, tmp_path):
+        # Would need ~640,000 partitions in one pass: split in levels instead
+        nums = array("q", range(5000))
+        assert two_sum_external(nums, target, memory_limit=1,
+                                tmp_dir=str(tmp_path)) == two_sum_hash_map(nums, target)
+        assert os.listdir(tmp_path) == []
+
+    def test_open_files_capped(self, tmp_path, monkeypatch):
+        real_partition = external._partition
+        widths = []
+
+        def recording_partition(records, target, partitions, *args):
+            widths.append(partitions)
+            return real_partition(records, target, partitions, *args)
+
+        monkeypatch.setattr(external, "_partition", recording_partition)
+        rng = random.Random(0)
+        nums = [rng.randrange(10**9) for _ in range(3000)]
+        expected = two_sum_hash_map(nums, 7)
+        assert two_sum_external(nums, 7, memory_limit=4 * ENTRY_BYTES,
+                                tmp_dir=str(tmp_path)) == expected
+        assert len(widths) > 1  # some partitions were split again
+        assert max(widths) <= MAX_PARTITIONS
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_matches_hash_map_with_small_memory_cap(self, seed, tmp_path):
+        rng = random.Random(seed)
+        nums = [rng.randrange(-500, 500) for _ in range(2000)]
+        path = write_numbers(tmp_path / "nums.bin", nums)
+        # ~30 entries per partition -> 128 partitions
+        memory_limit = 30 * ENTRY_BYTES
+        for target in rng.sample(range(-1000, 1000), 8) + [10**6]:
+            expected = two_sum_hash_map(nums, target)
+            assert two_sum_external(path, target, memory_limit=memory_limit,
+                                    tmp_dir=str(tmp_path)) == expected
+
+    def test_all_equal_values_with_small_memory_cap(self, tmp_path):
+        # Every record lands in one partition, far over the memory cap
+        nums = [5] * 200_000
+        path = write_numbers(tmp_path / "nums.bin", nums)
+        memory_limit = 100 * ENTRY_BYTES
+        assert two_sum_external(path, 7, memory_limit=memory_limit, tmp_dir=str(tmp_path)) is None
+        assert two_sum_external(path, 10, memory_limit=memory_limit,
+                                tmp_dir=str(tmp_path)) == [0, 1]
+
+    def test_partition_read_in_blocks(self, tmp_path):
+        records = array("q")
+        for i in range(200_000):
+            records.extend((i, 5))
+        part = tmp_path / "part.bin"
+        with open(part, "wb") as f:
+            records.tofile(f)
+        size = os.path.getsize(part)
+        tracemalloc.start()
+        try:
+            assert _earliest_in_partition(str(part), 7, 200_000) is None
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert peak < size / 2
+
+    def test_temp_files_removed(self, tmp_path):
+        path = write_numbers(tmp_path / "nums.bin", range(1000))
+        two_sum_external(path, -1, memory_limit=ENTRY_BYTES * 10, tmp_dir=str(tmp_path))
+        assert os.listdir(tmp_path) == ["nums.bin"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,53 @@
+"""
+Test suite for the reusable TwoSumIndex.
+
+Run with: pytest tests/test_two_sum_index.py -v
+"""
+
+import random
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arrays.two_sum import two_sum_hash_map
+from arrays.two_sum_index import TwoSumIndex
+
+
+class TestTwoSumIndex:
+    """Tests for repeated queries over one array."""
+
+    def test_basic_case(self):
+        assert TwoSumIndex([2, 7, 11, 15]).query(9) == [0, 1]
+
+    def test_duplicate_values(self):
+        assert TwoSumIndex([3, 3]).query(6) == [0, 1]
+
+    def test_latest_complement_index(self):
+        # two_sum_hash_map keeps the latest index of each value
+        assert TwoSumIndex([1, 1, 5]).query(6) == [1, 2]
+
+    def test_no_solution(self):
+        assert TwoSumIndex([1, 2, 3]).query(10) is None
+
+    def test_empty_and_single(self):
+        assert TwoSumIndex([]).query(5) is None
+        assert TwoSumIndex([5]).query(10) is None
+
+    def test_query_many(self):
+        index = TwoSumIndex([2, 7, 11, 15])
+        assert index.query_many([9, 4, 26, 9]) == [[0, 1], None, [2, 3], [0, 1]]
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_hash_map(self, seed):
+        rng = random.Random(seed)
+        nums = [rng.randrange(-20, 20) for _ in range(rng.randrange(0, 60))]
+        index = TwoSumIndex(nums)
+        for target in range(-45, 45):
+            assert index.query(target) == two_sum_hash_map(nums, target)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,85 @@
+"""
+Test suite for the NumPy two-sum backend and automatic dispatch.
+
+Run with: pytest tests/test_two_sum_numpy.py -v
+"""
+
+import random
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+np = pytest.importorskip("numpy")
+
+from arrays import two_sum as two_sum_module
+from arrays import two_sum_numpy as two_sum_numpy_module
+from arrays.two_sum import two_sum, two_sum_hash_map
+from arrays.two_sum_numpy import two_sum_numpy
+
+
+class TestTwoSumNumpy:
+    """Tests for the vectorized backend."""
+
+    def test_basic_case(self):
+        assert two_sum_numpy([2, 7, 11, 15], 9) == [0, 1]
+
+    def test_duplicate_values(self):
+        assert two_sum_numpy([3, 3], 6) == [0, 1]
+        assert two_sum_numpy([1, 1, 5], 6) == [1, 2]
+
+    def test_no_solution(self):
+        assert two_sum_numpy([1, 2, 3], 10) is None
+        assert two_sum_numpy([], 5) is None
+
+    def test_rejects_floats(self):
+        with pytest.raises(TypeError):
+            two_sum_numpy([1.5, 2.5], 4)
+
+    def test_huge_values_fall_back(self):
+        big = 2 ** 63 - 1
+        assert two_sum_numpy(np.array([big, 0, -1], dtype=np.int64), big - 1) == [0, 2]
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_matches_hash_map(self, seed):
+        rng = random.Random(seed)
+        nums = [rng.randrange(-30, 30) for _ in range(rng.randrange(0, 80))]
+        arr = np.array(nums, dtype=np.int64)
+        for target in range(-65, 65):
+            assert two_sum_numpy(arr, target) == two_sum_hash_map(nums, target)
+
+
+class TestTwoSumDispatch:
+    """Tests for automatic backend selection."""
+
+    def test_small_input(self):
+        assert two_sum([2, 7, 11, 15], 9) == [0, 1]
+
+    def test_invalid_backend(self):
+        with pytest.raises(ValueError):
+            two_sum([1, 2], 3, backend="gpu")
+
+    def test_large_input_uses_numpy_consistently(self, monkeypatch):
+        monkeypatch.setattr(two_sum_module, "NUMPY_THRESHOLD", 50)
+        monkeypatch.setattr(two_sum_module, "PREFIX_SCAN", 8)
+        calls = []
+
+        def recording_two_sum_numpy(nums, target):
+            calls.append(target)
+            return two_sum_numpy(nums, target)
+
+        # two_sum imports the backend lazily, so patch it at its source
+        monkeypatch.setattr(two_sum_numpy_module, "two_sum_numpy", recording_two_sum_numpy)
+        rng = random.Random(0)
+        nums = [rng.randrange(10 ** 6) for _ in range(300)]
+        early, late, missing = nums[0] + nums[1], nums[-1] + nums[-2], -1
+        for target in [early, late, missing]:
+            assert two_sum(nums, target) == two_sum_hash_map(nums, target)
+        # The prefix scan answers the early pair; the rest reach NumPy
+        assert calls == [late, missing]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,118 @@
+"""
+Test suite for parallel two sum.
+
+Run with: pytest tests/test_two_sum_parallel.py -v
+"""
+
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import arrays.two_sum_parallel as two_sum_parallel_module
+from arrays.two_sum import two_sum_hash_map
+from arrays.two_sum_parallel import _last_index, two_sum_parallel
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+@pytest.fixture(autouse=True)
+def no_prefix_scan(monkeypatch):
+    # Small inputs would otherwise be answered by the serial prefix scan
+    monkeypatch.setattr(two_sum_parallel_module, "PREFIX_SCAN", 0)
+
+
+class TestTwoSumParallel:
+    """Tests for the shared-memory multiprocess search."""
+
+    def test_basic(self, pool):
+        nums = [2, 7, 11, 15]
+        assert two_sum_parallel(nums, 9, workers=2, executor=pool, threshold=0) == [0, 1]
+        assert two_sum_parallel(nums, 100, workers=2, executor=pool, threshold=0) is None
+
+    def test_same_value_pair_across_chunks(self, pool):
+        nums = [3, 5, 7, 9, 11, 3]
+        assert two_sum_parallel(nums, 6, workers=3, executor=pool, threshold=0) == [0, 5]
+
+    def test_small_input_falls_back(self):
+        assert two_sum_parallel([3, 3], 6) == [0, 1]
+        assert two_sum_parallel([3, 2, 4], 6, workers=1, threshold=0) == [1, 2]
+
+    def test_prefix_hit_skips_workers(self, monkeypatch):
+        monkeypatch.setattr(two_sum_parallel_module, "PREFIX_SCAN", 2)
+
+        class NoPool:
+            def map(self, *args):
+                raise AssertionError("workers should not be used")
+
+        nums = [2, 7, 11, 15]
+        assert two_sum_parallel(nums, 9, workers=2, executor=NoPool(), threshold=0) == [0, 1]
+
+    def test_shared_memory_released_when_pool_fails(self, monkeypatch):
+        created = []
+        real_shared_memory = two_sum_parallel_module.SharedMemory
+
+        def tracking_shared_memory(*args, **kwargs):
+            shm = real_shared_memory(*args, **kwargs)
+            created.append(shm.name)
+            return shm
+
+        def broken_pool(*args, **kwargs):
+            raise OSError("cannot start workers")
+
+        monkeypatch.setattr(two_sum_parallel_module, "SharedMemory", tracking_shared_memory)
+        monkeypatch.setattr(two_sum_parallel_module, "ProcessPoolExecutor", broken_pool)
+        with pytest.raises(OSError):
+            two_sum_parallel([1, 2, 3, 4], 100, workers=2, threshold=0)
+        assert len(created) == 1
+        with pytest.raises(FileNotFoundError):
+            real_shared_memory(name=created[0])
+
+    def test_own_pool(self):
+        nums = array("q", [5, 2, 4, 0, 2])
+        assert two_sum_parallel(nums, 5, workers=2, threshold=0) == [0, 3]
+
+    @pytest.mark.parametrize("seed", range(3))
+    @pytest.mark.parametrize("workers", [2, 3, 8])
+    @pytest.mark.parametrize("vectorized", [True, False])
+    def test_matches_hash_map(self, pool, seed, workers, vectorized, monkeypatch):
+        if vectorized:
+            pytest.importorskip("numpy")
+        else:  # the pure-Python phases, as without NumPy
+            monkeypatch.setattr(two_sum_parallel_module, "np", None)
+        rng = random.Random(seed)
+        nums = [rng.randrange(-300, 300) for _ in range(800)]
+        for target in rng.sample(range(-600, 600), 15) + [0, 10**9]:
+            assert two_sum_parallel(
+                nums, target, workers=workers, executor=pool, threshold=0
+            ) == two_sum_hash_map(nums, target)
+
+    def test_values_near_int64_limits(self, pool):
+        # target - value would overflow in NumPy: the loop phases run instead
+        big = 2**63 - 1
+        nums = [big, 5, -big - 1, 7, -5]
+        for target in (-1, 0, big + 5, 12):
+            assert two_sum_parallel(
+                nums, target, workers=2, executor=pool, threshold=0
+            ) == two_sum_hash_map(nums, target)
+
+    def test_last_index_skips_misaligned_matches(self):
+        # 256 packs as 00 01 00 ..., so the bytes of the needle 1 straddle
+        # the values 256 and 0 without being a real element
+        data = array("q", [1, 256, 0, 7])
+        buf = memoryview(data).cast("B")
+        assert _last_index(buf, 1, 4) == 0
+        assert _last_index(buf, 7, 3) == -1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,106 @@
+"""
+Test suite for streaming two sum.
+
+Run with: pytest tests/test_two_sum_streaming.py -v
+"""
+
+import random
+from array import array
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arrays.two_sum import two_sum_hash_map
+from arrays.two_sum_streaming import StreamingTwoSum, two_sum_chunks, two_sum_stream
+
+
+class TestTwoSumStream:
+    """Tests for iterator and chunked input."""
+
+    def test_basic_iterator(self):
+        assert two_sum_stream(iter([2, 7, 11, 15]), 9) == [0, 1]
+
+    def test_global_indices_across_chunks(self):
+        chunks = [array("q", [2, 11]), array("q", [7, 15])]
+        assert two_sum_chunks(chunks, 9) == [0, 2]
+
+    def test_no_solution(self):
+        assert two_sum_stream(iter([1, 2, 3]), 10) is None
+        assert two_sum_chunks([[], []], 10) is None
+
+    def test_stops_consuming_at_first_pair(self):
+        consumed = []
+
+        def numbers():
+            for x in [3, 3, 1, 2, 4]:
+                consumed.append(x)
+                yield x
+
+        assert two_sum_stream(numbers(), 6) == [0, 1]
+        assert consumed == [3, 3]
+
+    def test_infinite_stream(self):
+        def naturals():
+            n = 0
+            while True:
+                yield n
+                n += 1
+
+        assert two_sum_stream(naturals(), 101) == [50, 51]
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_hash_map(self, seed):
+        rng = random.Random(seed)
+        nums = [rng.randrange(-50, 50) for _ in range(rng.randrange(0, 120))]
+        size = rng.randrange(1, 10)
+        chunks = [nums[k:k + size] for k in range(0, len(nums), size)]
+        for target in range(-60, 60, 7):
+            expected = two_sum_hash_map(nums, target)
+            assert two_sum_chunks(chunks, target) == expected
+            assert two_sum_stream(nums, target, value_range=(-50, 49)) == expected
+
+
+class TestMemoryCaps:
+    """Tests for the value-range filter and spill-to-disk."""
+
+    def test_value_range_skips_impossible_values(self):
+        detector = StreamingTwoSum(target=10, value_range=(0, 20))
+        assert detector.feed([100, 15, 30]) is None
+        # 15 pairs with -5 (out of range) so nothing at all is stored
+        assert detector._seen == {}
+        assert detector.feed([5, 5]) == [3, 4]
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_spill_matches_hash_map(self, seed, tmp_path):
+        rng = random.Random(seed)
+        nums = [rng.randrange(0, 200) for _ in range(150)]
+        for target in range(0, 400, 37):
+            result = two_sum_stream(
+                nums, target, max_entries=4, spill_path=str(tmp_path / f"{target}.db")
+            )
+            assert result == two_sum_hash_map(nums, target)
+
+    def test_reused_spill_path_starts_empty(self, tmp_path):
+        path = str(tmp_path / "spill.db")
+        with StreamingTwoSum(target=10, max_entries=1, spill_path=path) as first:
+            assert first.feed([1, 2, 3]) is None
+        with StreamingTwoSum(target=10, max_entries=1, spill_path=path) as second:
+            assert second.feed([100, 7]) is None
+            assert second.feed([3]) == [1, 2]
+
+    def test_spill_bounds_memory(self):
+        with StreamingTwoSum(target=-1, max_entries=10) as detector:
+            assert detector.feed(range(100)) is None
+            assert len(detector._seen) < 10
+            assert detector.spilled == 100
+
+    def test_invalid_max_entries(self):
+        with pytest.raises(ValueError):
+            StreamingTwoSum(target=1, max_entries=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,74 @@
+"""
+Test suite for sliding window two sum.
+
+Run with: pytest tests/test_two_sum_window.py -v
+"""
+
+import random
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from arrays.two_sum_window import SlidingWindowTwoSum, sliding_window_pairs
+
+
+def brute_force(nums, target, window):
+    return [
+        (i, j)
+        for j in range(len(nums))
+        for i in range(max(0, j - window + 1), j)
+        if nums[i] + nums[j] == target
+    ]
+
+
+class TestSlidingWindowTwoSum:
+    """Tests for the windowed detector."""
+
+    def test_basic(self):
+        assert list(sliding_window_pairs([2, 7, 4, 5], 9, 3)) == [(0, 1), (2, 3)]
+
+    def test_pair_outside_window_not_reported(self):
+        assert list(sliding_window_pairs([2, 0, 0, 7], 9, 3)) == []
+        assert list(sliding_window_pairs([2, 0, 0, 7], 9, 4)) == [(0, 3)]
+
+    def test_all_duplicates_reported(self):
+        assert list(sliding_window_pairs([3, 3, 3], 6, 3)) == [(0, 1), (0, 2), (1, 2)]
+
+    def test_window_one_never_pairs(self):
+        assert list(sliding_window_pairs([3, 3, 3], 6, 1)) == []
+
+    def test_invalid_window(self):
+        with pytest.raises(ValueError):
+            SlidingWindowTwoSum(target=1, window=0)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_brute_force(self, seed):
+        rng = random.Random(seed)
+        nums = [rng.randrange(-10, 10) for _ in range(200)]
+        for window in (1, 2, 5, 17, 300):
+            for target in (-3, 0, 4):
+                assert list(sliding_window_pairs(nums, target, window)) == brute_force(
+                    nums, target, window
+                )
+
+    def test_memory_stays_bounded(self):
+        detector = SlidingWindowTwoSum(target=-1, window=50)
+        for _ in detector.feed(range(10_000)):
+            pass
+        assert len(detector) == 50
+        assert sum(len(v) for v in detector._seen.values()) == 50
+
+    def test_count_of(self):
+        detector = SlidingWindowTwoSum(target=100, window=3)
+        for num in [1, 1, 2, 1]:
+            detector.push(num)
+        assert detector.count_of(1) == 2
+        assert detector.count_of(2) == 1
+        assert detector.count_of(5) == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])